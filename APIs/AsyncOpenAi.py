@@ -0,0 +1,175 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from APIs.OpenAi import get_env, build_messages, parse_retry_after
+from Helpers.UrlManager import URLManager
+from Config.settings import (
+    SUMMARY_MODEL,
+    SUMMARY_MAX_TOKENS,
+    LLM_CONNECT_TIMEOUT,
+    LLM_READ_TIMEOUT,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_MAX_IN_FLIGHT,
+    LLM_RATE_PER_SECOND,
+    LLM_BURST,
+    LLM_MAX_RETRIES,
+)
+
+
+@dataclass(frozen=True)
+class SummaryResult:
+    """Outcome of one summary request; exactly one of `text`/`error` is set."""
+
+    text: Optional[str] = None
+    error: Optional[str] = None        # 'rate_limited', 'timeout', 'connection', 'api', 'empty', 'unexpected'
+    detail: Optional[str] = None
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.text is not None
+
+
+class TokenBucket:
+    """Async token bucket that can also be paused until a server-given time."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause_for(self, seconds: float):
+        """Stop handing out tokens for `seconds` (e.g. from Retry-After)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        # Refill starts when the pause ends; the paused time earns no tokens
+        self._updated = self._paused_until
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncSummarizer:
+    """
+    Concurrent summaries at the provider's allowed rate.
+
+    At most `max_in_flight` requests run at once, request starts are paced by
+    a token bucket, and rate-limit responses pause the bucket for the
+    server-advertised time before retrying. Failures come back as
+    SummaryResult errors rather than strings that could be posted.
+
+        async with AsyncSummarizer() as summarizer:
+            results = await summarizer.summarize_many(texts)
+    """
+
+    def __init__(self, base_url=None, api_key=None, model=SUMMARY_MODEL,
+                 max_in_flight=LLM_MAX_IN_FLIGHT, rate=LLM_RATE_PER_SECOND,
+                 burst=LLM_BURST, max_retries=LLM_MAX_RETRIES):
+        api_key = api_key or get_env("OPENROUTER_API_KEY")
+        if not api_key:
+            raise ValueError("Missing OPENROUTER_API_KEY. Please set it in your .env file.")
+
+        # Imported on first use, as in APIs.OpenAi
+        import httpx
+        from openai import AsyncOpenAI
+
+        self.model = model
+        self.max_retries = max_retries
+        self.bucket = TokenBucket(rate, burst)
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
+        )
+        self.client = AsyncOpenAI(
+            base_url=base_url or get_env("OPENROUTER_BASE_URL") or URLManager.get_url(category='api_urls', key='openrouter'),
+            api_key=api_key,
+            http_client=self._http_client,
+            max_retries=0,  # retries are paced by the bucket instead
+        )
+
+    async def summarize(self, text: str) -> SummaryResult:
+        from openai import OpenAIError, RateLimitError, APIStatusError, APITimeoutError, APIConnectionError
+        attempts = 0
+        while True:
+            attempts += 1
+            await self.bucket.acquire()
+            try:
+                async with self._semaphore:
+                    raw = await self.client.chat.completions.with_raw_response.create(
+                        model=self.model,
+                        messages=build_messages(text),
+                        max_tokens=SUMMARY_MAX_TOKENS,
+                    )
+                # Slow down before the server has to say no
+                wait = parse_retry_after(raw.headers)
+                if wait:
+                    self.bucket.pause_for(wait)
+
+                completion = raw.parse()
+                if not completion.choices or not completion.choices[0].message.content:
+                    return SummaryResult(error="empty", detail="No choices returned by API.", attempts=attempts)
+                return SummaryResult(text=completion.choices[0].message.content, attempts=attempts)
+
+            except RateLimitError as e:
+                wait = parse_retry_after(e.response.headers)
+                self.bucket.pause_for(wait if wait is not None else 2 ** attempts)
+                if attempts > self.max_retries:
+                    return SummaryResult(error="rate_limited", detail=str(e), attempts=attempts)
+            except APITimeoutError as e:
+                if attempts > self.max_retries:
+                    return SummaryResult(error="timeout", detail=str(e), attempts=attempts)
+            except APIConnectionError as e:
+                if attempts > self.max_retries:
+                    return SummaryResult(error="connection", detail=str(e), attempts=attempts)
+            except APIStatusError as e:
+                if e.status_code < 500 or attempts > self.max_retries:
+                    return SummaryResult(error="api", detail=str(e), attempts=attempts)
+            except OpenAIError as e:
+                return SummaryResult(error="api", detail=str(e), attempts=attempts)
+            except Exception as e:
+                return SummaryResult(error="unexpected", detail=str(e), attempts=attempts)
+
+    async def summarize_many(self, texts) -> list:
+        """Summarize all texts concurrently; results are in input order."""
+        return await asyncio.gather(*(self.summarize(text) for text in texts))
+
+    async def aclose(self):
+        await self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+def summarize_many(texts) -> list:
+    """Blocking helper: run AsyncSummarizer.summarize_many in a fresh event loop."""
+    async def run():
+        async with AsyncSummarizer() as summarizer:
+            return await summarizer.summarize_many(texts)
+    return asyncio.run(run())
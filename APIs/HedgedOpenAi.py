@@ -0,0 +1,281 @@
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+import time
+from collections import deque
+
+import httpx
+from openai import AsyncOpenAI, RateLimitError
+from APIs.OpenAi import get_env, build_messages, parse_retry_after
+from Helpers.UrlManager import URLManager
+from Helpers.LogManager import LogManager
+from Config.settings import (
+    SUMMARY_PROVIDERS,
+    SUMMARY_MAX_TOKENS,
+    LLM_CONNECT_TIMEOUT,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_REQUEST_DEADLINE,
+    LLM_HEDGE_DEFAULT_DELAY,
+    LLM_HEDGE_MIN_DELAY,
+    LLM_HEDGE_PERCENTILE,
+    LLM_HEDGE_MAX_P50_MULTIPLE,
+    LLM_HEALTH_WINDOW,
+    LLM_STALL_COOLDOWN,
+)
+
+log = LogManager.get_logger("llm")
+
+
+class ProviderHealth:
+    """Recent latency and success rate of one provider/model."""
+
+    def __init__(self, window=LLM_HEALTH_WINDOW):
+        self.latencies = deque(maxlen=window)  # successful calls only
+        self.success_rate = 1.0  # EWMA
+        self.cooldown_until = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.stalls = 0
+        self.wins = 0
+        self._stalls_in_a_row = 0
+
+    def record(self, ok, latency=None):
+        self.calls += 1
+        self.success_rate = 0.8 * self.success_rate + 0.2 * (1.0 if ok else 0.0)
+        if ok:
+            self.latencies.append(latency)
+            self._stalls_in_a_row = 0
+        else:
+            self.errors += 1
+
+    def record_stall(self):
+        """A request cancelled after outliving its hedge delay: a failure, and a cooldown if it keeps happening.
+
+        Without this a provider that always stalls would keep a perfect
+        success rate and stay first, so every request would wait out its
+        hedge delay before the backup is asked. A one-off stall only costs
+        success rate; repeated ones bench the provider for longer each time.
+        """
+        self.record(False)
+        self.stalls += 1
+        self._stalls_in_a_row += 1
+        if self._stalls_in_a_row > 1:
+            cooldown = LLM_STALL_COOLDOWN * (self._stalls_in_a_row - 1)
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + cooldown)
+
+    def percentile(self, pct):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+    def hedge_delay(self):
+        """When to fire a backup request: this provider's p95, once there's enough history.
+
+        Capped at a multiple of p50 so that frequent stalls, which pull p95 up
+        to the stall time, can't disable hedging.
+        """
+        if len(self.latencies) < 10:
+            return LLM_HEDGE_DEFAULT_DELAY
+        delay = min(self.percentile(LLM_HEDGE_PERCENTILE), LLM_HEDGE_MAX_P50_MULTIPLE * self.percentile(50))
+        return max(LLM_HEDGE_MIN_DELAY, delay)
+
+    def score(self):
+        """Higher is better: success rate per second of typical latency; 0 while cooling down."""
+        if time.monotonic() < self.cooldown_until:
+            return 0.0
+        p50 = self.percentile(50) or LLM_HEDGE_DEFAULT_DELAY
+        return self.success_rate / max(p50, 0.05)
+
+
+class _Provider:
+    def __init__(self, spec, http_client):
+        self.name = spec["name"]
+        self.model = spec["model"]
+        self.health = ProviderHealth()
+        api_key = get_env(spec.get("api_key_env", "OPENROUTER_API_KEY")) or ""
+        base_url = (spec.get("base_url") or get_env("OPENROUTER_BASE_URL")
+                    or URLManager.get_url(category='api_urls', key='openrouter'))
+        self.client = AsyncOpenAI(base_url=base_url, api_key=api_key, http_client=http_client, max_retries=0)
+
+
+class HedgedSummarizer:
+    """
+    Summaries with a bounded tail: hedged requests and health-weighted failover.
+
+    Providers (SUMMARY_PROVIDERS) are tried best-first by recent success rate
+    and latency. If the first hasn't answered by its own p95 latency, the
+    next one is asked too and the first good answer wins; the other request
+    is cancelled. Errors fail over immediately, and every request is bounded
+    by LLM_REQUEST_DEADLINE. Calls run on a private event loop thread, so
+    summarize() is safe to call from worker threads.
+    """
+
+    def __init__(self, providers=SUMMARY_PROVIDERS, deadline=LLM_REQUEST_DEADLINE):
+        self.deadline = deadline
+        self.hedges = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-hedging", daemon=True)
+        self._thread.start()
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(deadline, connect=LLM_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
+        )
+        self.providers = [_Provider(spec, self._http_client) for spec in providers]
+        if not self.providers:
+            raise ValueError("SUMMARY_PROVIDERS is empty.")
+
+    async def _call(self, provider, text):
+        started = time.monotonic()
+        try:
+            completion = await provider.client.chat.completions.create(
+                model=provider.model,
+                messages=build_messages(text),
+                max_tokens=SUMMARY_MAX_TOKENS,
+            )
+            content = completion.choices[0].message.content if completion.choices else None
+            if not content:
+                raise RuntimeError("No choices returned by API.")
+        except asyncio.CancelledError:
+            # Cancelled early, it merely lost the race; cancelled after its own
+            # hedge delay (a backup was needed, or the deadline passed), it stalled
+            if time.monotonic() - started >= provider.health.hedge_delay():
+                provider.health.record_stall()
+            raise
+        except RateLimitError as e:
+            provider.health.record(False)
+            wait = parse_retry_after(e.response.headers)
+            provider.health.cooldown_until = time.monotonic() + (wait if wait is not None else 30)
+            raise
+        except Exception:
+            provider.health.record(False)
+            raise
+        provider.health.record(True, time.monotonic() - started)
+        return content
+
+    async def summarize_async(self, text):
+        """First good summary within the deadline, or None."""
+        summary, _model = await self._race(text)
+        return summary
+
+    async def _race(self, text):
+        """(summary, model that wrote it) for the first good answer, or (None, None)."""
+        deadline = time.monotonic() + self.deadline
+        queue = sorted(self.providers, key=lambda p: p.health.score(), reverse=True)
+        running = {}  # task -> provider
+
+        def launch():
+            provider = queue.pop(0)
+            running[asyncio.ensure_future(self._call(provider, text))] = provider
+            return provider
+
+        try:
+            current = launch()
+            while running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    log.warning("[LLM] No summary within %ss.", self.deadline)
+                    return None, None
+
+                # Hedge only while a single request is out and an alternative exists
+                hedge_after = current.health.hedge_delay() if len(running) == 1 and queue else None
+                timeout = min(remaining, hedge_after) if hedge_after is not None else remaining
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    if hedge_after is not None and timeout == hedge_after:
+                        self.hedges += 1
+                        current = launch()
+                    continue
+
+                for task in done:
+                    provider = running.pop(task)
+                    if task.exception() is None:
+                        provider.health.wins += 1
+                        return task.result(), provider.model
+                    log.warning("[LLM] %s failed: %s", provider.name, task.exception())
+
+                # Fail over when nothing is left in flight
+                if not running and queue:
+                    current = launch()
+            return None, None
+        finally:
+            for task in running:
+                task.cancel()
+
+    def summarize(self, text):
+        """Blocking wrapper around summarize_async for sync callers."""
+        return self.summarize_with_model(text)[0]
+
+    def summarize_with_model(self, text):
+        """Blocking (summary, model) for sync callers; (None, None) if nothing answered in time.
+
+        Backups run different models, so callers caching the summary need to
+        know which one wrote it.
+        """
+        future = asyncio.run_coroutine_threadsafe(self._race(text), self._loop)
+        try:
+            return future.result(timeout=self.deadline + 5)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            log.warning("[LLM] No summary within %ss.", self.deadline)
+            return None, None
+
+    def stats(self):
+        out = {"hedges": self.hedges}
+        for provider in self.providers:
+            health = provider.health
+            p50, p95 = health.percentile(50), health.percentile(95)
+            out[provider.name] = {
+                "calls": health.calls,
+                "errors": health.errors,
+                "stalls": health.stalls,
+                "wins": health.wins,
+                "p50_s": round(p50, 3) if p50 is not None else None,
+                "p95_s": round(p95, 3) if p95 is not None else None,
+            }
+        return out
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._http_client.aclose(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+
+_summarizer = None
+_summarizer_lock = threading.Lock()
+
+
+def get_hedged_summarizer():
+    """Process-wide HedgedSummarizer, created on first use."""
+    global _summarizer
+    if _summarizer is None:
+        with _summarizer_lock:
+            if _summarizer is None:
+                _summarizer = HedgedSummarizer()
+                atexit.register(_summarizer.close)
+    return _summarizer
+
+
+def close_hedged_summarizer():
+    """Closes the process-wide summarizer, if it was created; the next use creates a new one."""
+    global _summarizer
+    with _summarizer_lock:
+        summarizer, _summarizer = _summarizer, None
+    if summarizer is not None:
+        summarizer.close()
+
+
+def hedging_stats():
+    """Per-provider stats of the process-wide summarizer, or None if it was never used."""
+    return _summarizer.stats() if _summarizer is not None else None
@@ -1,53 +1,209 @@
 import os
-from dotenv import load_dotenv
-from openai import OpenAI, OpenAIError
+import sys
+import atexit
+import threading
+import time
+from typing import Optional
 from Helpers.UrlManager import URLManager
-from openai.types.chat import ChatCompletionUserMessageParam
+from Helpers.Tracer import Tracer
+from Helpers.PromptManager import PromptManager
+from Helpers.LogManager import LogManager
+from Config.settings import (
+    LLM_CONNECT_TIMEOUT,
+    LLM_READ_TIMEOUT,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_KEEPALIVE_EXPIRY,
+    SUMMARY_MODEL,
+    SUMMARY_MAX_TOKENS,
+    SUMMARY_PROVIDERS,
+    LLM_HEDGING,
+)
 
-load_dotenv()
+log = LogManager.get_logger("llm")
 
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+# The openai SDK, httpx and dotenv are imported on first use: together they
+# take most of a second to import, which scheduled runs that exit early never need.
+_env_loaded = False
 
 
-def summerize_api(text: str) -> str:
-    if not OPENROUTER_API_KEY:
-        raise ValueError("Missing OPENROUTER_API_KEY. Please set it in your .env file.")
+def get_env(name: str):
+    """Environment variable, after loading .env on first call.
+
+    OPENROUTER_API_KEY is required; OPENROUTER_BASE_URL optionally points at
+    e.g. a local OpenAI-compatible stub server.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+    return os.getenv(name)
+
+
+_clients = {}  # (base_url, api_key) -> OpenAI
+_clients_lock = threading.Lock()
+_http_client = None
+
 
+def _http2_available() -> bool:
     try:
-        # messages = poml(
-        #     PROMPT_FILE,             # path to your POML file
-        #     context={"text": text},       # inject tweet/text here
-        #     format="openai_chat"          # returns list of messages
-        # )
-
-        # return messages
-        url = URLManager.get_url(category='api_urls', key='openrouter')
-
-        client = OpenAI(
-            base_url=url,
-            api_key=OPENROUTER_API_KEY,
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _get_http_client():
+    """Shared httpx client so every OpenAI client reuses one keep-alive pool."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.Client(
+            http2=_http2_available(),
+            timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
         )
+    return _http_client
+
+
+def get_client(base_url: str = None, api_key: str = None):
+    """Return the cached OpenAI client for this base URL/key, creating it on first use."""
+    base_url = base_url or get_env("OPENROUTER_BASE_URL") or URLManager.get_url(category='api_urls', key='openrouter')
+    api_key = api_key or get_env("OPENROUTER_API_KEY")
+
+    key = (base_url, api_key)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            from openai import OpenAI
+            client = OpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                http_client=_get_http_client(),
+            )
+            _clients[key] = client
+    return client
+
+
+def close_clients():
+    """Close pooled connections, the hedged summarizer's included (called on shutdown)."""
+    global _http_client
+    with _clients_lock:
+        _clients.clear()
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+    hedged = sys.modules.get("APIs.HedgedOpenAi")
+    if hedged is not None:
+        hedged.close_hedged_summarizer()
+
+
+atexit.register(close_clients)
+
+
+def build_messages(text: str) -> list:
+    """Chat messages for a summary request (shared by the sync and async clients)."""
+    return PromptManager.messages(text)
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Seconds to wait from Retry-After or X-RateLimit-* headers, if present."""
+    if headers is None:
+        return None
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; fall through to the rate-limit headers
+
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if remaining is not None and reset:
+        try:
+            if int(float(remaining)) > 0:
+                return None
+            reset = float(reset)
+            # OpenRouter sends an epoch timestamp in ms; others send seconds-from-now
+            if reset > 1e12:
+                return max(0.0, reset / 1000 - time.time())
+            if reset > 1e9:
+                return max(0.0, reset - time.time())
+            return reset
+        except ValueError:
+            return None
+    return None
+
+
+@Tracer.traced("summerize_api", "llm")
+def summerize_api(text: str, with_model: bool = False):
+    """Summary of `text`, or an "Error: ..." string on failure.
+
+    With `with_model`, returns (summary, model that wrote it); the model is
+    None on failure. Only differs from SUMMARY_MODEL when a hedged backup
+    provider answered.
+    """
+    if not get_env("OPENROUTER_API_KEY"):
+        raise ValueError("Missing OPENROUTER_API_KEY. Please set it in your .env file.")
+
+    summary, model = _summarize(text)
+    return (summary, model) if with_model else summary
+
+
+def _summarize(text: str) -> tuple:
+    from openai import OpenAIError
+    try:
+        if LLM_HEDGING:
+            # Imported here: it builds on this module
+            from APIs.HedgedOpenAi import get_hedged_summarizer
+            summary, model = get_hedged_summarizer().summarize_with_model(text)
+            if not summary:
+                return "Error: All summary providers failed.", None
+            return summary, model
+
+        client = get_client()
 
         completion = client.chat.completions.create(
-            model="deepseek/deepseek-chat-v3-0324:free",
-            messages=[
-                ChatCompletionUserMessageParam(role="user", content=f"Summarize this: {text}")
-            ],
-            max_tokens=50,
+            model=SUMMARY_MODEL,
+            messages=build_messages(text),
+            max_tokens=SUMMARY_MAX_TOKENS,
         )
 
         # Defensive access in case structure changes
         if not completion.choices:
             raise RuntimeError("No choices returned by API.")
 
-        return completion.choices[0].message.content
+        return completion.choices[0].message.content, SUMMARY_MODEL
 
     except OpenAIError as e:
         # Handles API-related errors (auth, rate limits, invalid request, etc.)
-        print(f"[OpenAI API Error] {e}")
-        return "Error: API request failed."
+        log.error("[OpenAI API Error] %s", e)
+        return "Error: API request failed.", None
 
     except Exception as e:
         # Handles all other unexpected errors
-        print(f"[Unexpected Error] {e}")
-        return "Error: Something went wrong."
+        log.error("[Unexpected Error] %s", e)
+        return "Error: Something went wrong.", None
+
+
+def summary_models() -> list:
+    """Models summerize_api may answer with, preferred first (for cache lookups)."""
+    if not LLM_HEDGING:
+        return [SUMMARY_MODEL]
+    return list(dict.fromkeys([SUMMARY_MODEL] + [p["model"] for p in SUMMARY_PROVIDERS]))
+
+
+def hedging_stats():
+    """Per-provider stats of the hedged summarizer, or None if it was never used."""
+    hedged = sys.modules.get("APIs.HedgedOpenAi")  # not imported just to report nothing
+    return hedged.hedging_stats() if hedged is not None else None
@@ -0,0 +1,75 @@
+"""
+Throughput of a batch of summaries: sequential, a thread pool, and AsyncSummarizer.
+
+Each mode gets a fresh stub LLM server (Benchmarks/stub_llm.py) that answers
+after a fixed latency and rate-limits every Nth request with a Retry-After
+header. The threads call APIs.OpenAi.summerize_api concurrently, as
+run_pipelined does; APIs.AsyncOpenAi.AsyncSummarizer runs the same number of
+requests at once on one event loop, paced by its token bucket.
+
+    python -m Benchmarks.async_summary --texts 40 --rate-limit-every 8
+"""
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Benchmarks.stub_llm import StubLLMServer
+from Config.settings import LLM_MAX_IN_FLIGHT
+
+
+def run_sequential(texts, args):
+    from APIs.OpenAi import summerize_api
+    return [summerize_api(text) for text in texts]
+
+
+def run_threads(texts, args):
+    from APIs.OpenAi import summerize_api
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        return list(pool.map(summerize_api, texts))
+
+
+def run_async(texts, args):
+    from APIs.AsyncOpenAi import AsyncSummarizer
+
+    async def run():
+        async with AsyncSummarizer(max_in_flight=args.concurrency, rate=args.rate,
+                                   burst=args.concurrency) as summarizer:
+            results = await summarizer.summarize_many(texts)
+        return [result.text if result.ok else f"Error: {result.error}" for result in results]
+    return asyncio.run(run())
+
+
+MODES = {"sequential": run_sequential, "threads": run_threads, "async": run_async}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--rate-limit-every", type=int, default=8)
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--concurrency", type=int, default=LLM_MAX_IN_FLIGHT)
+    parser.add_argument("--rate", type=float, default=50.0, help="AsyncSummarizer requests per second")
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENROUTER_API_KEY", "stub-key")
+    texts = [f"Benchmark tweet number {i} about the news of the day." for i in range(args.texts)]
+
+    print(f"{args.texts} summaries, {args.latency}s per request, every {args.rate_limit_every}th "
+          f"rate-limited (Retry-After {args.retry_after}s), concurrency {args.concurrency}:")
+    for label, run in MODES.items():
+        with StubLLMServer(latency=args.latency, rate_limit_every=args.rate_limit_every,
+                           retry_after=args.retry_after) as llm:
+            os.environ["OPENROUTER_BASE_URL"] = llm.base_url
+            started = time.perf_counter()
+            summaries = run(texts, args)
+            elapsed = time.perf_counter() - started
+        failures = sum(1 for summary in summaries if not summary or summary.startswith("Error"))
+        print(f"  {label:<11} {elapsed:7.2f}s  {args.texts / elapsed:6.1f}/s  failures {failures:<3} "
+              f"requests {llm.requests}  rate-limited {llm.rate_limited}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Micro-benchmark: WebDriver round trips for per-element lookups vs query_batch.
+
+Run with:  python -m Benchmarks.batch_query
+Needs Chrome + chromedriver; the page is a local data: URL, no network.
+"""
+import time
+import urllib.parse
+from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+from Helpers.XpathManager import XpathManager
+
+FIXTURE_HTML = """
+<html><body>
+  <article data-testid="tweet"><div data-testid="tweetText">Fixture tweet text</div></article>
+  <button data-testid="like">Like</button>
+  <div data-testid="tweetTextarea_0" contenteditable="true"></div>
+  <button data-testid="tweetButtonInline">Reply</button>
+</body></html>
+"""
+
+
+def count_round_trips(driver):
+    """Wrap driver.execute so every WebDriver command is counted."""
+    counter = {"n": 0}
+    original = driver.execute
+
+    def counted(*args, **kwargs):
+        counter["n"] += 1
+        return original(*args, **kwargs)
+
+    driver.execute = counted
+    return counter, lambda: setattr(driver, "execute", original)
+
+
+def per_element(selectors):
+    out = {}
+    for name, value in selectors.items():
+        selector_type = "xpath" if name.endswith("_xpath") else "css"
+        element = SS.find_element(selector_type, value, timeout=1)
+        out[name] = (element.text, element.get_attribute("data-testid")) if element else None
+    return out
+
+
+def batched(selectors):
+    return SS.query_batch(selectors, attributes=["data-testid"])
+
+
+def main(repeats=20):
+    driver = SS.initialize_driver(headless=True)
+    SS.navigate_to("data:text/html," + urllib.parse.quote(FIXTURE_HTML))
+    selectors = XpathManager.get_page("detailed_tweet_page")
+
+    for label, fn in (("per-element", per_element), ("query_batch", batched)):
+        counter, restore = count_round_trips(driver)
+        started = time.perf_counter()
+        for _ in range(repeats):
+            fn(selectors)
+        elapsed = time.perf_counter() - started
+        restore()
+        print(f"{label:<12} round trips/query={counter['n'] / repeats:5.1f} "
+              f"ms/query={elapsed * 1000 / repeats:7.2f}")
+
+    SS.quit_driver()
+
+
+if __name__ == "__main__":
+    main()
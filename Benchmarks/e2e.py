@@ -0,0 +1,154 @@
+"""
+Offline end-to-end benchmark of the real run loop.
+
+Serves local X-like fixture pages and a stub OpenAI-compatible LLM, then
+drives main.run_serial / main.run_pipelined against them with headless
+Chrome. Reports per-post latency, throughput and memory, writes the result
+to Benchmarks/results/latest.json and compares it with a saved baseline.
+
+    python -m Benchmarks.e2e --posts 10 --llm-latency 1.5
+    python -m Benchmarks.e2e --mode pipelined --load-profile lean
+    python -m Benchmarks.e2e --save-baseline
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from Benchmarks.fixture_server import FixtureServer
+from Benchmarks.stub_llm import StubLLMServer
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+BASELINE_FILE = RESULTS_DIR / "baseline.json"
+LATEST_FILE = RESULTS_DIR / "latest.json"
+
+# Lower is better for everything except throughput
+COMPARED_METRICS = {
+    "per_post_p50_s": False,
+    "per_post_p95_s": False,
+    "throughput_posts_per_min": True,
+    "python_peak_rss_mb": False,
+    "js_heap_used_mb": False,
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=5)
+    parser.add_argument("--mode", choices=("serial", "pipelined"), default="serial")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="stub LLM seconds per request")
+    parser.add_argument("--llm-jitter", type=float, default=0.0)
+    parser.add_argument("--render-delay-ms", type=int, default=150, help="fixture client-side render delay")
+    parser.add_argument("--load-profile", default="full")
+    parser.add_argument("--headful", action="store_true")
+    parser.add_argument("--save-baseline", action="store_true")
+    return parser.parse_args()
+
+
+def js_heap_mb(SS):
+    try:
+        SS.execute_cdp("Performance.enable")
+        metrics = {m["name"]: m["value"] for m in SS.execute_cdp("Performance.getMetrics")["metrics"]}
+        return metrics.get("JSHeapUsedSize", 0) / 2 ** 20
+    except Exception:
+        return None
+
+
+def run(args):
+    nonce = uuid.uuid4().hex[:8]  # unique tweet text so the summary cache never hits
+    with FixtureServer(render_delay_ms=args.render_delay_ms, nonce=nonce) as fixtures, \
+            StubLLMServer(latency=args.llm_latency, jitter=args.llm_jitter) as llm, \
+            tempfile.TemporaryDirectory() as tmp:
+
+        # Configure before importing app modules, which read these at import time
+        os.environ["OPENROUTER_API_KEY"] = "stub-key"
+        os.environ["OPENROUTER_BASE_URL"] = llm.base_url
+
+        import main
+        import Helpers.SummaryCache as summary_cache
+        import Helpers.ProcessedIndex as processed_index
+        import Helpers.JobQueue as job_queue
+        import Helpers.LogManager as log_manager
+        import Helpers.ArtifactCapture as artifact_capture
+        from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+
+        summary_cache.SUMMARY_CACHE_FILE = Path(tmp) / "summary_cache.sqlite3"
+        processed_index.PROCESSED_INDEX_FILE = Path(tmp) / "processed.sqlite3"
+        job_queue.JOBS_FILE = Path(tmp) / "jobs.sqlite3"
+        log_manager.LOG_FILE = Path(tmp) / "bot.jsonl"
+        artifact_capture.ARTIFACTS_DIR = Path(tmp) / "artifacts"
+        main.posts = [fixtures.search_url(f"bench{i}") for i in range(args.posts)]
+
+        SS.initialize_driver(headless=not args.headful, timeout=10, startup_mode="cold",
+                             load_profile=args.load_profile)
+        try:
+            started = time.monotonic()
+            if args.mode == "pipelined":
+                main.run_pipelined()
+            else:
+                main.run_serial()
+            elapsed = time.monotonic() - started
+            heap = js_heap_mb(SS)
+        finally:
+            SS.quit_driver()
+            SS.stop_service()
+            artifact_capture.ArtifactCapture.flush()
+            log_manager.LogManager.flush()
+
+        arrivals = [started] + [r["received_at"] for r in fixtures.replies]
+        per_post = [b - a for a, b in zip(arrivals, arrivals[1:])]
+
+    per_post_sorted = sorted(per_post) or [elapsed]
+    return {
+        "mode": args.mode,
+        "load_profile": args.load_profile,
+        "posts": args.posts,
+        "replies": len(per_post),
+        "llm_latency_s": args.llm_latency,
+        "llm_requests": llm.requests,
+        "elapsed_s": elapsed,
+        "per_post_p50_s": statistics.median(per_post_sorted),
+        "per_post_p95_s": per_post_sorted[min(len(per_post_sorted) - 1, int(0.95 * len(per_post_sorted)))],
+        "throughput_posts_per_min": len(per_post) / elapsed * 60 if elapsed else 0.0,
+        # ru_maxrss is KiB on Linux
+        "python_peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "js_heap_used_mb": heap,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(result, baseline):
+    print(f"Compared with baseline from {baseline.get('timestamp')} ({baseline.get('mode')}):")
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        now, before = result.get(metric), baseline.get(metric)
+        if now is None or not before:
+            continue
+        change = (now - before) / before
+        better = change > 0 if higher_is_better else change < 0
+        print(f"  {metric:<26} {before:9.2f} -> {now:9.2f} ({change:+.1%}{', better' if better else ''})")
+
+
+def main():
+    args = parse_args()
+    result = run(args)
+
+    print("End-to-end benchmark:")
+    for key, value in result.items():
+        print(f"  {key:<26} {value:.3f}" if isinstance(value, float) else f"  {key:<26} {value}")
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    LATEST_FILE.write_text(json.dumps(result, indent=4))
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(result, indent=4))
+        print(f"Baseline saved to {BASELINE_FILE}")
+    elif BASELINE_FILE.exists():
+        compare(result, json.loads(BASELINE_FILE.read_text()))
+
+
+if __name__ == "__main__":
+    main()
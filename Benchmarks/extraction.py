@@ -0,0 +1,120 @@
+"""
+Cost of extracting tweets from a loaded timeline, per 100 tweets.
+
+Compares three ways of getting (id, text, author) for every tweet on a
+fixture search page:
+
+    dom_elements  find the articles, then per article read the text and
+                  status link over WebDriver (one round trip per call)
+    dom_batch     SeleniumSingleton.query_batch (one round trip)
+    network       SeleniumSingleton.capture_timeline, decoding the
+                  SearchTimeline response the page already downloaded
+
+Page load and render are excluded; only extraction is timed.
+
+    python -m Benchmarks.extraction --tweets 100 --repeat 5
+    python -m Benchmarks.extraction --fake   # browserless, Python-side cost only
+"""
+import argparse
+import statistics
+import time
+
+from Benchmarks.fixture_server import FixtureServer, fixture_tweet, search_first_id, timeline_payload
+from Helpers.ProcessedIndex import tweet_id_from_url
+
+ARTICLE_CSS = "article[data-testid='tweet']"
+TEXT_CSS = "div[data-testid='tweetText']"
+LINK_CSS = "a[href*='/status/']"
+
+
+def extract_dom_elements(SS):
+    records = []
+    for article in SS.find_elements("css", ARTICLE_CSS) or []:
+        text = article.find_element("css selector", TEXT_CSS).text
+        href = article.find_element("css selector", LINK_CSS).get_attribute("href")
+        records.append({"id": tweet_id_from_url(href), "text": text, "author": href.strip("/").split("/")[-3]})
+    return records
+
+
+def extract_dom_batch(SS, count):
+    result = SS.query_batch(
+        {"text": ("css", f"{ARTICLE_CSS} {TEXT_CSS}"), "link": ("css", f"{ARTICLE_CSS} {LINK_CSS}")},
+        attributes=["href"],
+        limit=count,
+    )
+    return [
+        {"id": tweet_id_from_url(link["attributes"]["href"]), "text": text["text"],
+         "author": link["attributes"]["href"].strip("/").split("/")[-3]}
+        for text, link in zip(result["text"]["matches"], result["link"]["matches"])
+    ]
+
+
+def extract_network(SS):
+    SS.clear_captured_tweets()
+    return SS.capture_timeline()
+
+
+def fake_driver(count):
+    from Benchmarks.fake_backend import static_search_html
+    from Benchmarks.fake_webdriver import FakeWebDriver
+
+    def responses(url):
+        keyword = url.split("q=", 1)[1].split("&", 1)[0]
+        tweets = [fixture_tweet(search_first_id(keyword) + i) for i in range(count)]
+        return [("http://fixture.local/i/api/graphql/fixture/SearchTimeline", timeline_payload(tweets))]
+
+    return FakeWebDriver(lambda url: static_search_html(url.split("q=", 1)[1].split("&", 1)[0], count),
+                         responses=responses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tweets", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fake", action="store_true", help="use Benchmarks.fake_webdriver instead of Chrome")
+    parser.add_argument("--headful", action="store_true")
+    args = parser.parse_args()
+
+    from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+
+    timings = {"dom_elements": [], "dom_batch": [], "network": []}
+    with FixtureServer(render_delay_ms=0, tweets_per_page=args.tweets) as fixtures:
+        if args.fake:
+            SS.use_driver(fake_driver(args.tweets), extraction_mode="network")
+            search_url = lambda i: f"http://fixture.local/search?q=extract{i}"
+        else:
+            SS.initialize_driver(headless=not args.headful, timeout=10, startup_mode="cold",
+                                 extraction_mode="network")
+            search_url = lambda i: fixtures.search_url(f"extract{i}")
+
+        try:
+            for i in range(args.repeat):
+                SS.navigate_to(search_url(i))
+                SS.query_batch({"tweets": ("css", ARTICLE_CSS)}, wait_for=["tweets"])
+                # Let the last tweet render so every method sees the full page
+                SS.wait_until(lambda d: len(d.find_elements("css selector", ARTICLE_CSS)) >= args.tweets, None)
+
+                for name, extract in (
+                    ("network", lambda: extract_network(SS)),
+                    ("dom_batch", lambda: extract_dom_batch(SS, args.tweets)),
+                    ("dom_elements", lambda: extract_dom_elements(SS)),
+                ):
+                    started = time.perf_counter()
+                    records = extract()
+                    elapsed = time.perf_counter() - started
+                    if len(records) != args.tweets:
+                        print(f"⚠️ {name} extracted {len(records)} of {args.tweets} tweets")
+                    timings[name].append(elapsed * 100 / max(len(records), 1))
+        finally:
+            SS.quit_driver()
+            SS.stop_service()
+
+    print(f"Extraction cost per 100 tweets ({'fake' if args.fake else 'chrome'}, "
+          f"{args.tweets} tweets/page, {args.repeat} runs):")
+    for name, values in timings.items():
+        print(f"  {name:<14} median {statistics.median(values) * 1000:9.2f}ms  "
+              f"min {min(values) * 1000:9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
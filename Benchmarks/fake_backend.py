@@ -0,0 +1,125 @@
+"""
+Browserless benchmark of the script logic.
+
+Runs main.run_serial (or run_pipelined) against Benchmarks.fake_webdriver with static versions of
+the fixture pages and the stub LLM at zero latency, so what's measured is
+orchestration overhead: lookups, config access, waits, logging.
+
+    python -m Benchmarks.fake_backend --posts 200
+    python -m Benchmarks.fake_backend --pipelined   # main.run_pipelined instead
+    python -m Benchmarks.fake_backend --profile   # cProfile top functions
+"""
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+from Benchmarks.fixture_server import fixture_tweet, search_first_id
+from Benchmarks.stub_llm import StubLLMServer
+
+
+def static_search_html(keyword, count=10):
+    first_id = search_first_id(keyword)
+    cells = "".join(
+        f'<div data-testid="cellInnerDiv"><article data-testid="tweet">'
+        f'<a href="/{t["user"]}/status/{t["id"]}">{t["user"]}</a>'
+        f'<div data-testid="tweetText" lang="en">{t["text"]}</div></article></div>'
+        for t in (fixture_tweet(first_id + i) for i in range(count))
+    )
+    return (f"<html><head><title>Search / X (fixture)</title></head><body>"
+            f"<nav><a href='#'><span>Latest</span></a></nav><main>{cells}</main></body></html>")
+
+
+def static_tweet_html(tweet_id):
+    t = fixture_tweet(tweet_id)
+    return (f"<html><head><title>{t['user']} on X (fixture)</title></head><body><main>"
+            f'<article data-testid="tweet"><div data-testid="tweetText" lang="en">{t["text"]}</div>'
+            f'<button data-testid="like">Like</button></article>'
+            f'<div data-testid="tweetTextarea_0" contenteditable="true" role="textbox"></div>'
+            f'<button data-testid="tweetButtonInline">Reply</button></main></body></html>')
+
+
+def router(url):
+    parsed = urlparse(url)
+    parts = parsed.path.strip("/").split("/")
+    if parsed.path == "/search":
+        return static_search_html(parse_qs(parsed.query).get("q", [""])[0])
+    if len(parts) == 3 and parts[1] == "status":
+        return static_tweet_html(int(parts[2]))
+    return "<html><body><main>home</main></body></html>"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--pipelined", action="store_true")
+    args = parser.parse_args()
+
+    with StubLLMServer(latency=0) as llm, tempfile.TemporaryDirectory() as tmp:
+        os.environ["OPENROUTER_API_KEY"] = "stub-key"
+        os.environ["OPENROUTER_BASE_URL"] = llm.base_url
+
+        import main as bot
+        import Helpers.SummaryCache as summary_cache
+        import Helpers.ProcessedIndex as processed_index
+        import Helpers.JobQueue as job_queue
+        import Helpers.LogManager as log_manager
+        import Helpers.ArtifactCapture as artifact_capture
+        from Benchmarks.fake_webdriver import FakeWebDriver
+        from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+
+        summary_cache.SUMMARY_CACHE_FILE = Path(tmp) / "summary_cache.sqlite3"
+        processed_index.PROCESSED_INDEX_FILE = Path(tmp) / "processed.sqlite3"
+        job_queue.JOBS_FILE = Path(tmp) / "jobs.sqlite3"
+        log_manager.LOG_FILE = Path(tmp) / "bot.jsonl"
+        artifact_capture.ARTIFACTS_DIR = Path(tmp) / "artifacts"
+        replies = []
+
+        def on_click(driver, element):
+            if element.attrs.get("data-testid") == "tweetButtonInline":
+                box = driver.find_element("css selector", "[data-testid='tweetTextarea_0']")
+                replies.append(box.text)
+                return True
+            return False
+
+        driver = SS.use_driver(FakeWebDriver(router, on_click=on_click))
+        # Nothing renders asynchronously here, so don't wait between polls
+        SS.set_wait_timing(poll_interval=0.001, settle_idle_time=0)
+
+        bot.posts = [f"http://fixture.local/search?q=bench{i}" for i in range(args.posts)]
+
+        profiler = cProfile.Profile() if args.profile else None
+        started = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        bot.run_pipelined() if args.pipelined else bot.run_serial()
+        if profiler:
+            profiler.disable()
+        elapsed = time.perf_counter() - started
+        SS.quit_driver()
+        artifact_capture.ArtifactCapture.flush()
+        log_manager.LogManager.flush()
+
+    result = {
+        "posts": args.posts,
+        "replies": len(replies),
+        "llm_requests": llm.requests,
+        "elapsed_s": round(elapsed, 4),
+        "ms_per_post": round(elapsed * 1000 / max(args.posts, 1), 3),
+        "driver_commands_per_post": round(driver.commands / max(args.posts, 1), 1),
+        "navigations_per_post": round(driver.navigations / max(args.posts, 1), 2),
+    }
+    print(json.dumps(result, indent=4))
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,612 @@
+"""
+In-process stand-in for the subset of Selenium WebDriver that
+SeleniumSingleton uses, backed by an in-memory DOM parsed from static HTML.
+
+Pages come from a `router(url) -> html` callable. No JavaScript runs: the
+scripts SeleniumSingleton injects (clicks, scrolling, readiness checks,
+batch queries, probes) are recognised and emulated in Python. CSS and XPath
+support covers the selector shapes used in Data/xpaths.json and the Scripts.
+
+    SeleniumSingleton.use_driver(FakeWebDriver(router))
+"""
+import base64
+import json
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, JavascriptException, WebDriverException
+
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+_HIDDEN_TAGS = {"script", "style", "head", "title", "meta", "link"}
+
+
+def _is_special_key(ch):
+    # selenium.webdriver.common.keys.Keys values are private-use code points
+    return "\ue000" <= ch <= "\uf8ff"
+
+
+class FakeElement:
+    """A parsed DOM node exposing the WebElement methods the bot calls."""
+
+    def __init__(self, tag, attrs, parent=None, driver=None):
+        self.tag_name = tag
+        self.attrs = dict(attrs)
+        self.parent = parent
+        self.children = []
+        self.text_parts = []  # (index among children, text)
+        self._driver = driver
+        self.typed = ""  # text entered with send_keys
+
+    # -- tree helpers ---------------------------------------------------
+
+    def iter_descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.iter_descendants()
+
+    def iter_ancestors(self):
+        node = self.parent
+        while node is not None and node.tag_name != "#document":
+            yield node
+            node = node.parent
+
+    def _raw_text(self):
+        if self.tag_name in _HIDDEN_TAGS:
+            return ""
+        pieces = []
+        texts = dict(self.text_parts)
+        for i, child in enumerate(self.children):
+            pieces.append(texts.get(i, ""))
+            pieces.append(child._raw_text())
+        pieces.append(texts.get(len(self.children), ""))
+        pieces.append(self.typed)
+        return "".join(pieces)
+
+    # -- WebElement API -------------------------------------------------
+
+    @property
+    def text(self):
+        return re.sub(r"\s+", " ", self._raw_text()).strip()
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def is_displayed(self):
+        return not any(n.tag_name in _HIDDEN_TAGS or "hidden" in n.attrs
+                       for n in [self, *self.iter_ancestors()])
+
+    def is_enabled(self):
+        return "disabled" not in self.attrs
+
+    def clear(self):
+        self.typed = ""
+
+    def send_keys(self, *values):
+        for value in values:
+            self.typed += "".join(ch for ch in str(value) if not _is_special_key(ch))
+            if any(_is_special_key(ch) for ch in str(value)):
+                self._driver._on_submit(self)
+
+    def click(self):
+        self._driver._on_click(self)
+
+    def find_element(self, by, value):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"{by}={value}")
+        return found[0]
+
+    def find_elements(self, by, value):
+        return self._driver._query(by, value, root=self)
+
+    def __repr__(self):
+        return f"<FakeElement {self.tag_name} {self.attrs}>"
+
+
+class _DomBuilder(HTMLParser):
+    def __init__(self, driver):
+        super().__init__(convert_charrefs=True)
+        self.root = FakeElement("#document", {}, driver=driver)
+        self.current = self.root
+        self.driver = driver
+
+    def handle_starttag(self, tag, attrs):
+        node = FakeElement(tag, [(k, v if v is not None else "") for k, v in attrs], self.current, self.driver)
+        self.current.children.append(node)
+        if tag not in _VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.current = self.current.parent
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not None and node.tag_name != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.text_parts.append((len(self.current.children), data))
+
+
+# ----------------------------------------------------------------------
+# Selector engines
+# ----------------------------------------------------------------------
+
+_CSS_COMPOUND = re.compile(
+    r"(?P<tag>[a-zA-Z*][\w-]*)?"
+    r"(?P<rest>(?:#[\w-]+|\.[\w-]+|\[[^\]]+\])*)"
+)
+_CSS_PART = re.compile(r"#([\w-]+)|\.([\w-]+)|\[\s*([\w:-]+)\s*(?:([*^$~]?=)\s*(['\"]?)(.*?)\5)?\s*\]")
+
+
+def _css_compound_matcher(compound):
+    m = _CSS_COMPOUND.fullmatch(compound)
+    if m is None:
+        raise ValueError(f"Unsupported CSS selector: {compound!r}")
+    tag = m.group("tag")
+    checks = []
+    for part in _CSS_PART.finditer(m.group("rest") or ""):
+        id_, cls_, attr, op, _, val = part.groups()
+        if id_:
+            checks.append(lambda n, v=id_: n.attrs.get("id") == v)
+        elif cls_:
+            checks.append(lambda n, v=cls_: v in n.attrs.get("class", "").split())
+        elif op is None:
+            checks.append(lambda n, a=attr: a in n.attrs)
+        else:
+            ops = {
+                "=": lambda have, want: have == want,
+                "*=": lambda have, want: want in have,
+                "^=": lambda have, want: have.startswith(want),
+                "$=": lambda have, want: have.endswith(want),
+                "~=": lambda have, want: want in have.split(),
+            }
+            checks.append(lambda n, a=attr, f=ops[op], v=val: a in n.attrs and f(n.attrs[a], v))
+
+    def match(node):
+        if tag and tag != "*" and node.tag_name != tag.lower():
+            return False
+        return all(check(node) for check in checks)
+
+    return match
+
+
+def _css_select(root, selector):
+    results = []
+    for group in selector.split(","):
+        tokens = re.findall(r">|[^\s>]+", group.strip())
+        steps, combinator = [], " "
+        for token in tokens:
+            if token == ">":
+                combinator = ">"
+                continue
+            steps.append((combinator, _css_compound_matcher(token)))
+            combinator = " "
+
+        context = [root]
+        for combinator, match in steps:
+            seen, nxt = set(), []
+            for node in context:
+                candidates = node.children if combinator == ">" else node.iter_descendants()
+                for cand in candidates:
+                    if id(cand) not in seen and match(cand):
+                        seen.add(id(cand))
+                        nxt.append(cand)
+            context = nxt
+        results.extend(n for n in context if n not in results)
+    return _document_order(root, results)
+
+
+def _document_order(root, nodes):
+    if len(nodes) < 2:
+        return nodes
+    order = {id(n): i for i, n in enumerate(root.iter_descendants())}
+    return sorted(nodes, key=lambda n: order.get(id(n), 0))
+
+
+_XPATH_STEP = re.compile(r"(//|/)(?:(ancestor|parent|child|descendant)::)?([\w*-]+|\.\.)((?:\[[^\]]*\])*)")
+_XPATH_PRED = re.compile(r"\[([^\]]*)\]")
+
+
+def _xpath_predicate(expr):
+    expr = expr.strip()
+    if expr.isdigit():
+        return int(expr)
+    m = re.fullmatch(r"@([\w:-]+)\s*=\s*(['\"])(.*)\2", expr)
+    if m:
+        return lambda n, a=m.group(1), v=m.group(3): n.attrs.get(a) == v
+    m = re.fullmatch(r"@([\w:-]+)", expr)
+    if m:
+        return lambda n, a=m.group(1): a in n.attrs
+    m = re.fullmatch(r"(?:text\(\)|normalize-space\(\.?\)|\.)\s*=\s*(['\"])(.*)\1", expr)
+    if m:
+        return lambda n, v=m.group(2): n.text == v
+    m = re.fullmatch(r"contains\(\s*(@[\w:-]+|text\(\)|\.)\s*,\s*(['\"])(.*)\2\s*\)", expr)
+    if m:
+        source, want = m.group(1), m.group(3)
+        if source.startswith("@"):
+            return lambda n, a=source[1:], v=want: v in (n.attrs.get(a) or "")
+        return lambda n, v=want: v in n.text
+    raise ValueError(f"Unsupported XPath predicate: [{expr}]")
+
+
+def _xpath_steps(root, context, path):
+    pos = 0
+    while pos < len(path):
+        m = _XPATH_STEP.match(path, pos)
+        if m is None:
+            raise ValueError(f"Unsupported XPath: {path!r}")
+        pos = m.end()
+        sep, axis, test, preds = m.groups()
+        predicates = [_xpath_predicate(p) for p in _XPATH_PRED.findall(preds)]
+
+        nxt = []
+        for node in context:
+            if test == "..":
+                candidates = [node.parent] if node.parent else []
+            elif axis == "ancestor":
+                candidates = list(node.iter_ancestors())[::-1]
+            elif axis == "parent":
+                candidates = [node.parent] if node.parent else []
+            elif sep == "//" or axis == "descendant":
+                candidates = list(node.iter_descendants())
+            else:
+                candidates = node.children
+            if test not in ("*", ".."):
+                candidates = [c for c in candidates if c.tag_name == test.lower()]
+            for predicate in predicates:
+                if isinstance(predicate, int):
+                    candidates = candidates[predicate - 1:predicate]
+                else:
+                    candidates = [c for c in candidates if predicate(c)]
+            nxt.extend(c for c in candidates if c not in nxt)
+        context = nxt
+    return context
+
+
+def _xpath_select(root, xpath):
+    xpath = xpath.strip()
+    if xpath.startswith("("):
+        depth = 0
+        for i, ch in enumerate(xpath):
+            depth += ch == "("
+            depth -= ch == ")"
+            if depth == 0:
+                break
+        inner, rest = xpath[1:i], xpath[i + 1:]
+        nodes = _document_order(root, _xpath_steps(root, [root], inner))
+        m = re.match(r"\[(\d+)\]", rest)
+        if m:
+            index = int(m.group(1))
+            nodes = nodes[index - 1:index]
+            rest = rest[m.end():]
+        return _xpath_steps(root, nodes, rest) if rest else nodes
+    return _document_order(root, _xpath_steps(root, [root], xpath))
+
+
+# ----------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        if handle not in self._driver.window_handles:
+            raise NoSuchElementException(f"No window {handle}")
+        self._driver._switch_tab(handle)
+
+    def new_window(self, type_hint=None):
+        """Opens a blank tab and switches to it; each tab keeps its own page and history."""
+        self._driver.tabs_opened += 1
+        handle = f"fake-window-{self._driver.tabs_opened}"
+        self._driver.window_handles.append(handle)
+        self._driver._switch_tab(handle)
+
+    def frame(self, reference):
+        pass
+
+    def default_content(self):
+        pass
+
+    @property
+    def alert(self):
+        raise NoSuchElementException("No alert open")
+
+
+class FakeWebDriver:
+    """
+    Args:
+        router: callable(url) -> html string (or None for a blank page)
+        on_click: optional callable(driver, element) run before the default
+            click behaviour; return True to suppress it
+        on_submit: optional callable(driver, element) run when a special key
+            (e.g. ENTER) is sent to an element
+        responses: optional callable(url) -> [(response_url, json_payload)],
+            the XHR responses a page "downloads" on load; surfaced through
+            the "getLog" command (performance log) and Network.getResponseBody
+    """
+
+    def __init__(self, router, on_click=None, on_submit=None, responses=None):
+        self._router = router
+        self._responses = responses
+        self._perf_log = []
+        self._response_bodies = {}
+        self._click_hook = on_click
+        self._submit_hook = on_submit
+        self._cookies = {}
+        self._history = []
+        self._forward = []
+        self.current_url = "about:blank"
+        self.window_handles = ["fake-window"]
+        self.current_window_handle = "fake-window"
+        self.tabs_opened = 0
+        self._tabs = {}  # handle -> saved page state of each tab in the background
+        self.switch_to = _SwitchTo(self)
+        self.commands = 0  # WebDriver-equivalent commands issued
+        self.navigations = 0  # get() calls
+        self.clicks = []   # elements clicked, in order
+        self._load("about:blank")
+
+    # -- tabs -----------------------------------------------------------
+
+    _TAB_STATE = ("current_url", "page_source", "_document", "title", "_history", "_forward", "_response_bodies")
+
+    def _switch_tab(self, handle):
+        if self.current_window_handle in self.window_handles:
+            self._tabs[self.current_window_handle] = {name: getattr(self, name) for name in self._TAB_STATE}
+        self.current_window_handle = handle
+        state = self._tabs.pop(handle, None)
+        if state is None:
+            self._history, self._forward = [], []
+            self._load("about:blank")
+        else:
+            for name, value in state.items():
+                setattr(self, name, value)
+
+    # -- navigation -----------------------------------------------------
+
+    def _load(self, url):
+        html = self._router(url) if url != "about:blank" else None
+        builder = _DomBuilder(self)
+        self.page_source = html or "<html><body></body></html>"
+        builder.feed(self.page_source)
+        builder.close()
+        self._document = builder.root
+        self.current_url = url
+        titles = _css_select(self._document, "title")
+        self.title = titles[0]._raw_text().strip() if titles else ""
+
+        # A new document drops the previous page's response bodies, as in Chrome
+        self._response_bodies = {}
+        if self._responses and url != "about:blank":
+            for response_url, payload in self._responses(url):
+                request_id = f"fake-{len(self._perf_log)}"
+                self._response_bodies[request_id] = json.dumps(payload)
+                for method, params in (
+                    ("Network.responseReceived", {"requestId": request_id, "type": "XHR",
+                                                  "response": {"url": response_url, "status": 200,
+                                                               "mimeType": "application/json"}}),
+                    ("Network.loadingFinished", {"requestId": request_id}),
+                ):
+                    self._perf_log.append({"level": "INFO", "message": json.dumps(
+                        {"message": {"method": method, "params": params}, "webview": "fake-window"})})
+
+    def get(self, url):
+        self.commands += 1
+        self.navigations += 1
+        if self.current_url != "about:blank":
+            self._history.append(self.current_url)
+        self._forward.clear()
+        self._load(url)
+
+    def refresh(self):
+        self.commands += 1
+        self._load(self.current_url)
+
+    def back(self):
+        self.commands += 1
+        if self._history:
+            self._forward.append(self.current_url)
+            self._load(self._history.pop())
+
+    def forward(self):
+        self.commands += 1
+        if self._forward:
+            self._history.append(self.current_url)
+            self._load(self._forward.pop())
+
+    # -- lookups --------------------------------------------------------
+
+    def _query(self, by, value, root=None):
+        root = root or self._document
+        if by == By.CSS_SELECTOR:
+            return _css_select(root, value)
+        if by == By.XPATH:
+            return _xpath_select(root, value)
+        if by == By.ID:
+            return _css_select(root, f'[id="{value}"]')
+        if by == By.NAME:
+            return _css_select(root, f'[name="{value}"]')
+        if by == By.TAG_NAME:
+            return _css_select(root, value)
+        if by == By.CLASS_NAME:
+            return _css_select(root, f".{value}")
+        if by == By.LINK_TEXT:
+            return [a for a in _css_select(root, "a") if a.text == value]
+        if by == By.PARTIAL_LINK_TEXT:
+            return [a for a in _css_select(root, "a") if value in a.text]
+        raise ValueError(f"Unsupported locator: {by}")
+
+    def find_element(self, by, value):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"{by}={value}")
+        return found[0]
+
+    def find_elements(self, by, value):
+        self.commands += 1
+        return self._query(by, value)
+
+    # -- interaction ----------------------------------------------------
+
+    def _on_click(self, element):
+        self.commands += 1
+        self.clicks.append(element)
+        if self._click_hook and self._click_hook(self, element):
+            return
+        # Follow the element's own link, or the first link inside it (tweet
+        # articles navigate on click)
+        link = element if element.tag_name == "a" and element.attrs.get("href") else None
+        if link is None:
+            links = [n for n in element.iter_descendants() if n.tag_name == "a" and n.attrs.get("href")]
+            link = links[0] if links else None
+        if link is not None:
+            self.get(urljoin(self.current_url, link.attrs["href"]))
+
+    def _on_submit(self, element):
+        if self._submit_hook:
+            self._submit_hook(self, element)
+
+    def execute_script(self, script, *args):
+        """Emulate the scripts the bot injects; anything else raises."""
+        self.commands += 1
+        from Helpers.SeleniumSingleton import SeleniumSingleton
+
+        from Helpers.TimelineHarvester import _HARVEST_JS
+
+        if script is SeleniumSingleton._BATCH_QUERY_JS:
+            return self._batch_query(*args)
+        if script is _HARVEST_JS:
+            article_css, link_css, text_css = args
+            rows = []
+            for article in self._query(By.CSS_SELECTOR, article_css):
+                links = article.find_elements(By.CSS_SELECTOR, link_css)
+                texts = article.find_elements(By.CSS_SELECTOR, text_css)
+                rows.append([links[0].attrs.get("href") if links else None, texts[0].text if texts else ""])
+            return rows
+        if script is SeleniumSingleton._NAVIGATION_METRICS_JS:
+            return [0.0, 0]
+        if script is SeleniumSingleton._PENDING_REQUESTS_JS:
+            return [0, 0, 0]  # requests in flight, fetch/XHR started, resources finished
+        if script is SeleniumSingleton._DOM_SNAPSHOT_JS:
+            html = re.sub(r"(?is)<(script|style|svg)\b.*?</\1>", "", self.page_source)
+            return {"html": html[:args[0]], "truncated": len(html) > args[0], "url": self.current_url,
+                    "title": self.title, "width": 1280, "height": 800}
+        if "click()" in script:
+            args[0].click()
+            return None
+        if "scrollIntoView" in script or "scrollBy" in script or "scrollTo" in script:
+            return None
+        if "document.readyState" in script:
+            return "complete"
+        if "getBoundingClientRect" in script:
+            return [0, 0, 100, 20]
+        raise JavascriptException(f"FakeWebDriver can't run script: {script[:80]!r}")
+
+    def execute_async_script(self, script, *args):
+        self.commands += 1
+        from Helpers.SeleniumSingleton import SeleniumSingleton
+
+        if script is SeleniumSingleton._PROBE_JS:
+            probe_type, value = args[0], args[1]
+            found = self._query(By.XPATH if probe_type == "xpath" else By.CSS_SELECTOR, value)
+            return found[0] if found else None
+        raise JavascriptException(f"FakeWebDriver can't run async script: {script[:80]!r}")
+
+    def _batch_query(self, locators, attrs, limit):
+        out = {}
+        for name, (selector_type, value) in locators.items():
+            nodes = self._query(By.XPATH if selector_type == "xpath" else By.CSS_SELECTOR, value)
+            out[name] = {
+                "count": len(nodes),
+                "matches": [
+                    {"element": n, "text": n.text, "attributes": {a: n.attrs.get(a) for a in attrs}}
+                    for n in nodes[:limit]
+                ],
+            }
+        return out
+
+    def execute(self, command, params=None):
+        """Handles getLog and the CDP passthrough used by SeleniumSingleton.execute_cdp."""
+        self.commands += 1
+        if command == "getLog":
+            return {"value": self.get_log(params["type"])}
+        if command != "executeCdpCommand":
+            raise WebDriverException(f"unsupported command: {command}")
+        cmd, cdp_params = params["cmd"], params.get("params", {})
+        if cmd == "Network.setCookies":
+            for cookie in cdp_params.get("cookies", []):
+                self._cookies[cookie["name"]] = dict(cookie)
+        elif cmd == "Network.getAllCookies":
+            cookies = []
+            for cookie in self._cookies.values():
+                expires = cookie.get("expires", cookie.get("expiry", -1))
+                cookies.append({"name": cookie["name"], "value": cookie["value"],
+                                "domain": cookie.get("domain") or "", "path": cookie.get("path", "/"),
+                                "secure": cookie.get("secure", False), "httpOnly": cookie.get("httpOnly", False),
+                                "expires": expires, "session": expires == -1})
+            return {"value": {"cookies": cookies}}
+        elif cmd == "Network.getResponseBody":
+            body = self._response_bodies.get(cdp_params.get("requestId"))
+            if body is None:
+                raise JavascriptException("No resource with given identifier found")
+            return {"value": {"body": body, "base64Encoded": False}}
+        elif cmd == "Page.captureScreenshot":
+            # Not a real image: a marker with the requested format, so callers can check what was asked
+            marker = f"fake-{cdp_params.get('format', 'png')}-screenshot".encode()
+            return {"value": {"data": base64.b64encode(marker).decode("ascii")}}
+        elif cmd == "Performance.getMetrics":
+            return {"value": {"metrics": [
+                {"name": "JSHeapUsedSize", "value": 0},
+                {"name": "Nodes", "value": sum(1 for _ in self._document.iter_descendants())},
+                {"name": "JSEventListeners", "value": 0},
+            ]}}
+        return {"value": {}}
+
+    def get_log(self, log_type):
+        if log_type != "performance":
+            return []
+        entries, self._perf_log = self._perf_log, []
+        return entries
+
+    # -- cookies --------------------------------------------------------
+
+    def add_cookie(self, cookie):
+        self.commands += 1
+        self._cookies[cookie["name"]] = dict(cookie)
+
+    def get_cookies(self):
+        self.commands += 1
+        return list(self._cookies.values())
+
+    def delete_all_cookies(self):
+        self._cookies.clear()
+
+    # -- session --------------------------------------------------------
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def get_screenshot_as_base64(self):
+        self.commands += 1
+        return base64.b64encode(b"fake-png-screenshot").decode("ascii")
+
+    def save_screenshot(self, filename):
+        return False
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+        self._tabs.pop(self.current_window_handle, None)
+
+    def quit(self):
+        pass
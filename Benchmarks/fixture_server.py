@@ -0,0 +1,167 @@
+"""
+Local stand-in for the X pages the bot visits.
+
+Serves /search?q=<keyword> (a timeline whose first tweet links to a status
+page) and /<user>/status/<id> (a detail page with tweetText, the reply box
+and reply button), using the DOM shapes in Data/xpaths.json. Like the real
+site, both pages render from GraphQL-shaped JSON they fetch after load
+(/i/api/graphql/fixture/SearchTimeline and /TweetDetail). Replies posted
+by the page are recorded in `FixtureServer.replies` with a monotonic
+`received_at` timestamp.
+"""
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def _render(template, **values):
+    html = (FIXTURES_DIR / template).read_text(encoding="utf-8")
+    for key, value in values.items():
+        html = html.replace("{{" + key + "}}", str(value))
+    return html
+
+
+def fixture_tweet(tweet_id, nonce=""):
+    """Deterministic tweet record for an id (nonce makes text unique per run)."""
+    user = f"fixture_user{tweet_id % 7}"
+    text = (f"Fixture tweet {tweet_id} {nonce}: a short post about deen, community "
+            f"and the news of the day, long enough to be worth summarizing.")
+    return {"id": str(tweet_id), "user": user, "text": text}
+
+
+def search_first_id(keyword):
+    """First tweet id on a keyword's search page; stable per keyword, distinct across keywords."""
+    return 1_000_000 + zlib.crc32(keyword.encode()) % 1_000_000 * 100
+
+
+def timeline_payload(tweets, operation="SearchTimeline"):
+    """Tweets wrapped the way X's GraphQL timeline responses nest them."""
+    entries = [
+        {
+            "entryId": f"tweet-{t['id']}",
+            "sortIndex": t["id"],
+            "content": {
+                "entryType": "TimelineTimelineItem",
+                "itemContent": {
+                    "itemType": "TimelineTweet",
+                    "tweet_results": {"result": {
+                        "__typename": "Tweet",
+                        "rest_id": t["id"],
+                        "core": {"user_results": {"result": {
+                            "__typename": "User",
+                            "rest_id": str(zlib.crc32(t["user"].encode())),
+                            "legacy": {"screen_name": t["user"], "name": t["user"].replace("_", " ").title()},
+                        }}},
+                        "views": {"count": str(int(t["id"]) % 5000), "state": "EnabledWithCount"},
+                        "legacy": {
+                            "id_str": t["id"],
+                            "full_text": t["text"],
+                            "lang": "en",
+                            "created_at": "Mon Jan 01 00:00:00 +0000 2024",
+                            "reply_count": int(t["id"]) % 11,
+                            "retweet_count": int(t["id"]) % 13,
+                            "favorite_count": int(t["id"]) % 97,
+                            "quote_count": int(t["id"]) % 3,
+                        },
+                    }},
+                },
+            },
+        }
+        for t in tweets
+    ]
+    instructions = [{"type": "TimelineAddEntries", "entries": entries}]
+    if operation == "TweetDetail":
+        return {"data": {"threaded_conversation_with_injections_v2": {"instructions": instructions}}}
+    return {"data": {"search_by_raw_query": {"search_timeline": {"timeline": {"instructions": instructions}}}}}
+
+
+class FixtureServer:
+    """Threaded HTTP server; use as a context manager or start()/stop()."""
+
+    def __init__(self, host="127.0.0.1", port=0, render_delay_ms=150, tweets_per_page=10, nonce=""):
+        self.render_delay_ms = render_delay_ms
+        self.tweets_per_page = tweets_per_page
+        self.nonce = nonce
+        self.replies = []
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def search_url(self, keyword):
+        return f"{self.base_url}/search?q={keyword}&src=typed_query&f=live"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type="text/html; charset=utf-8"):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                parts = url.path.strip("/").split("/")
+
+                query = parse_qs(url.query)
+                if url.path == "/search":
+                    self._send(200, _render("search.html", render_delay_ms=server.render_delay_ms))
+                elif url.path == "/i/api/graphql/fixture/SearchTimeline":
+                    first_id = search_first_id(query.get("q", [""])[0])
+                    tweets = [fixture_tweet(first_id + i, server.nonce) for i in range(server.tweets_per_page)]
+                    self._send(200, json.dumps(timeline_payload(tweets)), "application/json")
+                elif len(parts) == 3 and parts[1] == "status" and parts[2].isdigit():
+                    tweet = fixture_tweet(int(parts[2]), server.nonce)
+                    self._send(200, _render("tweet.html", user=tweet["user"],
+                                            render_delay_ms=server.render_delay_ms))
+                elif url.path == "/i/api/graphql/fixture/TweetDetail":
+                    tweet = fixture_tweet(int(query.get("id", ["0"])[0]), server.nonce)
+                    self._send(200, json.dumps(timeline_payload([tweet], "TweetDetail")), "application/json")
+                elif url.path in ("/", "/home"):
+                    self._send(200, "<html><body><main>home</main></body></html>")
+                else:
+                    self._send(404, "not found", "text/plain")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                if self.path == "/i/api/reply":
+                    reply = json.loads(body or b"{}")
+                    reply["received_at"] = time.monotonic()
+                    server.replies.append(reply)
+                    self._send(200, "{}", "application/json")
+                else:
+                    self._send(404, "not found", "text/plain")
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
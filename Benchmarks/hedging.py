@@ -0,0 +1,77 @@
+"""
+Tail latency of summarization with and without hedging.
+
+Two stub LLM servers: a fast primary whose every Nth request stalls, and a
+slower but steady backup. The same sequence of requests is sent through
+APIs.HedgedOpenAi.HedgedSummarizer with only the primary (no hedging
+possible) and with both providers.
+
+    python -m Benchmarks.hedging --requests 60 --stall-every 10
+"""
+import argparse
+import os
+import statistics
+import time
+
+from Benchmarks.stub_llm import StubLLMServer
+
+
+def run(summarizer, count, warmup):
+    latencies = []
+    failures = 0
+    for i in range(warmup + count):
+        started = time.perf_counter()
+        summary = summarizer.summarize(f"Benchmark tweet number {i} about the news of the day.")
+        elapsed = time.perf_counter() - started
+        if i >= warmup:  # hedge delays need some latency history first
+            latencies.append(elapsed)
+            failures += summary is None
+    latencies.sort()
+    return {
+        "p50_s": statistics.median(latencies),
+        "p95_s": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))],
+        "max_s": latencies[-1],
+        "failures": failures,
+        "providers": summarizer.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=60)
+    parser.add_argument("--warmup", type=int, default=12)
+    parser.add_argument("--primary-latency", type=float, default=0.2)
+    parser.add_argument("--stall-every", type=int, default=10)
+    parser.add_argument("--stall-latency", type=float, default=5.0)
+    parser.add_argument("--backup-latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENROUTER_API_KEY", "stub-key")
+    from APIs.HedgedOpenAi import HedgedSummarizer
+
+    results = {}
+    for label, with_backup in (("single", False), ("hedged", True)):
+        # Fresh servers per mode so both see the same stall pattern
+        with StubLLMServer(latency=args.primary_latency, jitter=args.primary_latency / 2,
+                           slow_every=args.stall_every, slow_latency=args.stall_latency) as primary, \
+                StubLLMServer(latency=args.backup_latency, jitter=args.backup_latency / 4) as backup:
+            providers = [{"name": "primary", "model": "stub-fast", "base_url": primary.base_url}]
+            if with_backup:
+                providers.append({"name": "backup", "model": "stub-steady", "base_url": backup.base_url})
+
+            summarizer = HedgedSummarizer(providers=providers, deadline=args.stall_latency * 2)
+            try:
+                results[label] = run(summarizer, args.requests, args.warmup)
+            finally:
+                summarizer.close()
+
+    print(f"Summarization latency over {args.requests} requests "
+          f"(primary stalls {args.stall_latency}s every {args.stall_every}):")
+    for label, result in results.items():
+        print(f"  {label:<7} p50 {result['p50_s']:6.3f}s  p95 {result['p95_s']:6.3f}s  "
+              f"max {result['max_s']:6.3f}s  failures {result['failures']}")
+        print(f"          {result['providers']}")
+
+
+if __name__ == "__main__":
+    main()
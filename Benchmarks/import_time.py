@@ -0,0 +1,113 @@
+"""
+Import-time budget for the entry points the scheduler launches.
+
+Imports each entry point in a fresh interpreter under `python -X importtime`
+and fails (exit status 1) if its median cumulative import time is over
+budget, if it pulls in a module that should only load on first use
+(openai, httpx, dotenv, selenium.webdriver), or if importing it touches
+the filesystem beyond reading code (e.g. loading JSON or creating
+directories).
+
+    python -m Benchmarks.import_time
+    python -m Benchmarks.import_time --repeat 9 --scale 2   # slower machine
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Entry point -> budget in milliseconds (cumulative, excluding interpreter startup)
+BUDGETS_MS = {
+    "main": 120,
+    "Scripts.twitterSearch": 100,
+    "Scripts.login": 80,
+    "Scripts.TweetOperations": 80,
+    "APIs.OpenAi": 50,
+    "APIs.AsyncOpenAi": 100,  # asyncio itself is most of it
+}
+
+# Heavy modules that must only be imported when first used
+DEFERRED_MODULES = ("openai", "httpx", "dotenv", "selenium.webdriver")
+
+# Runs in the child: records file opens and directory changes under the repo while importing
+_PROBE = """
+import json, os, sys
+root = sys.argv[1]
+io_events = []
+
+def audit(event, args):
+    if event == "open" and isinstance(args[0], str):
+        path = os.path.abspath(args[0])
+        if path.startswith(root) and not path.endswith((".py", ".pyc", ".pth", ".so")):
+            io_events.append(f"open {os.path.relpath(path, root)} ({args[1]})")
+    elif event in ("os.mkdir", "os.makedirs", "os.remove", "os.rename") and isinstance(args[0], str):
+        io_events.append(f"{event} {os.path.relpath(os.path.abspath(args[0]), root)}")
+
+sys.addaudithook(audit)
+import {module}
+print(json.dumps(io_events))
+"""
+
+
+def measure(module):
+    """One cold import: (cumulative ms, imported module names, filesystem events)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.replace("{module}", module), str(BASE_DIR)],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    imported = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported[name.strip()] = int(cumulative)
+    return imported[module] / 1000, set(imported), json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def check(module, budget_ms, repeat):
+    timings = []
+    imported, io_events = set(), []
+    for _ in range(repeat):
+        elapsed, imported, io_events = measure(module)
+        timings.append(elapsed)
+
+    problems = []
+    median = statistics.median(timings)
+    if median > budget_ms:
+        problems.append(f"{median:.1f}ms is over its {budget_ms:.0f}ms budget")
+    deferred = sorted(name for name in imported
+                      if any(name == heavy or name.startswith(heavy + ".") for heavy in DEFERRED_MODULES))
+    if deferred:
+        problems.append(f"imports {', '.join(deferred[:5])}{' ...' if len(deferred) > 5 else ''} eagerly")
+    problems.extend(f"does I/O at import: {event}" for event in io_events)
+    return median, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. on slow CI machines")
+    parser.add_argument("modules", nargs="*", help="entry points to check (default: all budgeted ones)")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"Import time, median of {args.repeat} cold imports:")
+    for module in args.modules or BUDGETS_MS:
+        budget = BUDGETS_MS.get(module, min(BUDGETS_MS.values())) * args.scale
+        median, problems = check(module, budget, args.repeat)
+        print(f"  {'❌' if problems else '✅'} {module:<26} {median:7.1f}ms  (budget {budget:.0f}ms)")
+        for problem in problems:
+            print(f"      {problem}")
+        failed |= bool(problems)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
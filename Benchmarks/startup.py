@@ -0,0 +1,52 @@
+"""
+Browser startup time: cold profile vs warm persistent profile vs attach.
+
+Run with:  python -m Benchmarks.startup [url]
+Needs Chrome + chromedriver. Uses CHROME_PROFILE_DIR and CHROME_DEBUG_PORT
+from Config.settings, so don't run it while a bot run is using them.
+"""
+import sys
+import time
+from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+
+
+def timed_start(mode, url):
+    """Seconds from driver creation until `url` has loaded, plus the driver."""
+    started = time.perf_counter()
+    driver = SS.build_driver('chrome', True, mode)
+    driver.get(url)
+    return time.perf_counter() - started, driver
+
+
+def main(url="https://x.com/", repeats=3):
+    results = {"cold": [], "profile": [], "attach": []}
+
+    for _ in range(repeats):
+        elapsed, driver = timed_start("cold", url)
+        results["cold"].append(elapsed)
+        driver.quit()
+
+    # First profile launch only populates the disk cache
+    _, driver = timed_start("profile", url)
+    driver.quit()
+    for _ in range(repeats):
+        elapsed, driver = timed_start("profile", url)
+        results["profile"].append(elapsed)
+        driver.quit()
+
+    # Keep one profile browser alive and attach to it repeatedly
+    _, host = timed_start("profile", url)
+    for _ in range(repeats):
+        elapsed, attached = timed_start("attach", url)
+        results["attach"].append(elapsed)
+        attached.quit()  # ends the session only; the host browser stays up
+    host.quit()
+    SS.stop_service()
+
+    print(f"Startup to first load of {url} ({repeats} runs each):")
+    for mode, samples in results.items():
+        print(f"  {mode:<8} min={min(samples):6.2f}s avg={sum(samples) / len(samples):6.2f}s")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
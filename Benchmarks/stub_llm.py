@@ -0,0 +1,121 @@
+"""
+Minimal OpenAI-compatible chat completions server with configurable latency.
+
+Point the bot at it with OPENROUTER_BASE_URL=<stub.base_url>. Supports
+POST /v1/chat/completions and GET /v1/models. With `rate_limit_every=N`
+every Nth completion request gets a 429 with a Retry-After header, and with
+`slow_every=N` every Nth one takes `slow_latency` seconds (a stalled call).
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubLLMServer:
+    """Threaded stub; latency = `latency` + uniform(0, `jitter`) seconds per request."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.5, jitter=0.0, model="stub-model",
+                 rate_limit_every=0, retry_after=1.0, slow_every=0, slow_latency=10.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.model = model
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.slow_every = slow_every
+        self.slow_latency = slow_latency
+        self.requests = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _completion(self, payload):
+        prompt = ""
+        for message in payload.get("messages", []):
+            if isinstance(message.get("content"), str):
+                prompt = message["content"]
+        words = prompt.split()
+        return {
+            "id": f"chatcmpl-stub-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", self.model),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "Summary: " + " ".join(words[-12:])},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": len(words), "completion_tokens": 13, "total_tokens": len(words) + 13},
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status, payload, headers=None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.rstrip("/") == "/v1/models":
+                    self._send_json(200, {"object": "list", "data": [{"id": server.model, "object": "model"}]})
+                else:
+                    self._send_json(404, {"error": {"message": "not found"}})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if self.path.rstrip("/") != "/v1/chat/completions":
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+
+                with server._lock:
+                    server.requests += 1
+                    limited = server.rate_limit_every and server.requests % server.rate_limit_every == 0
+                    slow = server.slow_every and server.requests % server.slow_every == 0
+                    if limited:
+                        server.rate_limited += 1
+                if limited:
+                    self._send_json(429, {"error": {"message": "Rate limit exceeded", "code": 429}},
+                                    {"Retry-After": str(server.retry_after)})
+                    return
+                time.sleep(server.slow_latency if slow else server.latency + random.uniform(0, server.jitter))
+                try:
+                    self._send_json(200, server._completion(payload))
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client gave up (e.g. a cancelled hedge)
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -1,16 +1,186 @@
+import os
 from pathlib import Path
 from typing import Final
 
 BASE_DIR: Final[Path] = Path(__file__).resolve().parent.parent
-DATA_DIR: Final[Path] = BASE_DIR / "data"
+DATA_DIR: Final[Path] = BASE_DIR / "Data"
 COOKIES_DIR: Final[Path] = DATA_DIR / "cookies"
 TWITTER_COOKIES_DIR: Final[Path] = COOKIES_DIR / "twitter"
 PROMPT_DIR = BASE_DIR / "Prompts"
 
 ACCOUNTS_FILE: Final[Path] = DATA_DIR / "accounts.json"
+SESSIONS_FILE: Final[Path] = DATA_DIR / "sessions.json"
 URLS_FILE: Final[Path] = DATA_DIR / "urls.json"
 KEYWORDS_FILE: Final[Path] = DATA_DIR / "keywords.txt"
 XPATH_FILE: Final[Path] = DATA_DIR / "xpaths.json"
 PROMPT_FILE: Final[Path] = PROMPT_DIR / "summerize.poml"
 
-TWITTER_COOKIES_DIR.mkdir(parents=True, exist_ok=True)
+# Minimum time each readiness wait takes, to keep a human-like pace (0 disables)
+MIN_DWELL_SECONDS: Final[float] = 0
+
+# OpenAI-compatible client pool (seconds / connection counts)
+LLM_CONNECT_TIMEOUT: Final[float] = 10.0
+LLM_READ_TIMEOUT: Final[float] = 60.0
+LLM_MAX_CONNECTIONS: Final[int] = 10
+LLM_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 5
+LLM_KEEPALIVE_EXPIRY: Final[float] = 60.0
+
+# Async summarization: requests in flight, token-bucket rate (requests/sec and
+# burst size) and retries after a rate-limit response
+LLM_MAX_IN_FLIGHT: Final[int] = 4
+LLM_RATE_PER_SECOND: Final[float] = 20 / 60  # OpenRouter free tier: 20 req/min
+LLM_BURST: Final[int] = 3
+LLM_MAX_RETRIES: Final[int] = 3
+
+# Summarization model; bump the prompt version whenever the prompt changes so
+# cached summaries from the old prompt are not reused
+SUMMARY_MODEL: Final[str] = "deepseek/deepseek-chat-v3-0324:free"
+SUMMARY_PROMPT_VERSION: Final[str] = "v1"
+SUMMARY_MAX_TOKENS: Final[int] = 50
+# Tweet text beyond this many tokens is cut before it goes into the prompt
+SUMMARY_INPUT_TOKEN_BUDGET: Final[int] = 400
+
+# Summarization providers, tried best-first by recent health. `base_url` None
+# means OpenRouter (OPENROUTER_BASE_URL or urls.json); keys come from `api_key_env`.
+SUMMARY_PROVIDERS: Final[list] = [
+    {"name": "deepseek", "model": SUMMARY_MODEL, "base_url": None, "api_key_env": "OPENROUTER_API_KEY"},
+    {"name": "llama", "model": "meta-llama/llama-3.3-70b-instruct:free", "base_url": None,
+     "api_key_env": "OPENROUTER_API_KEY"},
+]
+# Hedged requests: set LLM_HEDGING=1 in the environment (settings are read
+# before .env is loaded, so not there) to race a backup provider.
+# A backup request goes out once the first has taken longer than the
+# provider's p95 latency (the default delay until there's enough history).
+LLM_HEDGING: Final[bool] = os.getenv("LLM_HEDGING", "0") == "1"
+LLM_REQUEST_DEADLINE: Final[float] = 30.0
+LLM_HEDGE_DEFAULT_DELAY: Final[float] = 4.0
+LLM_HEDGE_MIN_DELAY: Final[float] = 0.5
+LLM_HEDGE_PERCENTILE: Final[int] = 95
+LLM_HEDGE_MAX_P50_MULTIPLE: Final[float] = 3.0
+LLM_HEALTH_WINDOW: Final[int] = 50
+# A provider cancelled after outliving its hedge delay (or the deadline) counts
+# as failed; from its second stall in a row it cools down this long per extra stall
+LLM_STALL_COOLDOWN: Final[float] = 5.0
+
+# Summary cache (in-memory LRU in front of SQLite)
+SUMMARY_CACHE_FILE: Final[Path] = DATA_DIR / "summary_cache.sqlite3"
+SUMMARY_CACHE_MEMORY_SIZE: Final[int] = 256
+SUMMARY_CACHE_MAX_ENTRIES: Final[int] = 10_000
+SUMMARY_CACHE_TTL: Final[float] = 7 * 24 * 3600
+
+# Tweets already handled (SQLite, with an in-memory Bloom filter in front)
+PROCESSED_INDEX_FILE: Final[Path] = DATA_DIR / "processed.sqlite3"
+PROCESSED_BLOOM_CAPACITY: Final[int] = 100_000
+PROCESSED_BLOOM_ERROR_RATE: Final[float] = 0.01
+
+# Timeline harvesting (Helpers.TimelineHarvester): limits per page load
+HARVEST_MAX_TWEETS: Final[int] = 20
+HARVEST_MAX_SECONDS: Final[float] = 60.0
+HARVEST_MAX_STALE_SCROLLS: Final[int] = 3
+HARVEST_SCROLL_IDLE: Final[float] = 0.3
+
+# Durable job queue for run_script: per-URL step checkpoints, retries per job,
+# and how long shutdown waits for the browser to quit
+JOBS_FILE: Final[Path] = DATA_DIR / "jobs.sqlite3"
+JOB_MAX_ATTEMPTS: Final[int] = 3
+SHUTDOWN_DEADLINE: Final[float] = 10.0
+
+# Pipelined run mode: posts in flight and summarization worker threads
+PIPELINE_DEPTH: Final[int] = 2
+SUMMARY_WORKERS: Final[int] = 2
+
+# Browser startup: 'cold' (fresh profile), 'profile' (persistent profile under
+# DATA_DIR, leaves the browser running) or 'attach' (reuse that browser)
+BROWSER_STARTUP_MODE: Final[str] = os.getenv("BROWSER_STARTUP_MODE", "cold")
+CHROME_PROFILE_DIR: Final[Path] = DATA_DIR / "chrome-profile"
+CHROME_DEBUG_PORT: Final[int] = int(os.getenv("CHROME_DEBUG_PORT", "9222"))
+# Optional already-running chromedriver (e.g. http://127.0.0.1:9515)
+CHROMEDRIVER_URL: Final[str] = os.getenv("CHROMEDRIVER_URL", "")
+
+# Tweet extraction: 'dom' reads rendered elements, 'network' decodes the
+# timeline JSON responses the page already downloads (Chrome only)
+EXTRACTION_MODES: Final[tuple] = ("dom", "network")
+EXTRACTION_MODE: Final[str] = os.getenv("EXTRACTION_MODE", "dom")
+# URL substrings of the responses decoded in 'network' mode
+TIMELINE_RESPONSE_PATTERNS: Final[tuple] = ("/i/api/graphql/",)
+# Decoded tweets kept for lookups; the least recently seen are dropped beyond this
+CAPTURED_TWEETS_MAX: Final[int] = 2000
+
+# Page-loading profiles, picked per run with LOAD_PROFILE. `block_urls` are
+# Network.setBlockedURLs patterns (wildcards allowed).
+LOAD_PROFILES: Final[dict] = {
+    "full": {
+        "page_load_strategy": "normal",
+        "block_images": False,
+        "block_urls": [],
+    },
+    "lean": {
+        "page_load_strategy": "eager",
+        "block_images": True,
+        "block_urls": [
+            "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+            "*.mp4", "*.m3u8", "*.m4s", "*.ts",
+            "*.woff", "*.woff2", "*.ttf",
+            "*video.twimg.com*", "*pbs.twimg.com/media*", "*pbs.twimg.com/profile_images*",
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*ads-twitter.com*", "*analytics.twitter.com*",
+        ],
+    },
+}
+LOAD_PROFILE: Final[str] = os.getenv("LOAD_PROFILE", "full")
+# Record load time and bytes transferred for every navigate_to()
+MEASURE_NAVIGATION: Final[bool] = os.getenv("MEASURE_NAVIGATION", "0") == "1"
+
+# Skip re-validating saved cookies that were confirmed working this recently
+SESSION_VALIDATION_TTL: Final[float] = 6 * 3600
+
+# Seconds to coalesce account/session changes before writing them to disk
+ACCOUNT_FLUSH_DELAY: Final[float] = 2.0
+
+# Timed spans for the hot path (TRACE=1), exported under TRACE_DIR
+TRACE_ENABLED: Final[bool] = os.getenv("TRACE", "0") == "1"
+TRACE_DIR: Final[Path] = DATA_DIR / "traces"
+# Every span is appended to the run's JSONL file as it's recorded; only the
+# most recent ones are kept in memory for the Chrome trace and percentiles
+TRACE_MAX_SPANS: Final[int] = 50_000
+TRACE_FLUSH_EVERY: Final[int] = 500
+
+# Logging: JSON lines at LOG_LEVEL and up to LOG_FILE (rotated at LOG_MAX_BYTES,
+# LOG_BACKUP_COUNT old files kept); only LOG_CONSOLE_LEVEL and up reach the
+# terminal. A message repeated more than LOG_RATE_LIMIT times within
+# LOG_RATE_WINDOW seconds is then kept 1 in LOG_SAMPLE_EVERY.
+LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_CONSOLE_LEVEL: Final[str] = os.getenv("LOG_CONSOLE_LEVEL", "WARNING").upper()
+LOG_FILE: Final[Path] = DATA_DIR / "logs" / "bot.jsonl"
+LOG_MAX_BYTES: Final[int] = 5 * 2 ** 20
+LOG_BACKUP_COUNT: Final[int] = 5
+LOG_RATE_LIMIT: Final[int] = 20
+LOG_RATE_WINDOW: Final[float] = 60.0
+LOG_SAMPLE_EVERY: Final[int] = 50
+
+# Failure artifacts: a compressed screenshot (ARTIFACT_FORMAT "jpeg" or
+# "webp" at ARTIFACT_QUALITY, scaled by ARTIFACT_SCALE) and a trimmed DOM
+# snapshot per failure. Each run keeps its last ARTIFACT_KEEP captures under
+# ARTIFACTS_DIR; only the newest ARTIFACT_KEEP_RUNS runs are kept.
+ARTIFACTS_DIR: Final[Path] = DATA_DIR / "artifacts"
+ARTIFACT_FORMAT: Final[str] = "jpeg"
+ARTIFACT_QUALITY: Final[int] = 60
+ARTIFACT_SCALE: Final[float] = 0.5
+ARTIFACT_DOM_MAX_CHARS: Final[int] = 300_000
+ARTIFACT_KEEP: Final[int] = 20
+ARTIFACT_KEEP_RUNS: Final[int] = 10
+
+# Browser memory watchdog (MEMORY_WATCHDOG=0 disables). Every
+# WATCHDOG_SAMPLE_EVERY posts it reads the tab's JS heap, DOM nodes and event
+# listeners (CDP Performance.getMetrics) and the browser's RSS (needs psutil).
+# A tab over its limits is swapped for a fresh one; if that didn't help, or
+# the browser is over WATCHDOG_MAX_BROWSER_RSS_MB, the browser is restarted
+# with the session cookies. WATCHDOG_RESTART_EVERY_POSTS > 0 also restarts it
+# on a fixed schedule.
+WATCHDOG_ENABLED: Final[bool] = os.getenv("MEMORY_WATCHDOG", "1") == "1"
+WATCHDOG_SAMPLE_EVERY: Final[int] = 1
+WATCHDOG_MAX_JS_HEAP_MB: Final[float] = 400
+WATCHDOG_MAX_NODES: Final[int] = 100_000
+WATCHDOG_MAX_LISTENERS: Final[int] = 20_000
+WATCHDOG_MAX_BROWSER_RSS_MB: Final[float] = 2048
+WATCHDOG_RESTART_EVERY_POSTS: Final[int] = 0
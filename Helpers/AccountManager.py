@@ -1,24 +1,70 @@
-from Config.settings import ACCOUNTS_FILE
+from Config.settings import ACCOUNTS_FILE, SESSIONS_FILE, ACCOUNT_FLUSH_DELAY
 from Helpers.UrlManager import URLManager
+import atexit
 import json
+import os
+import tempfile
+import threading
+import time
+
+
+def _atomic_write_json(path, data):
+    """Write JSON to a temp file in the same directory, then rename over `path`.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_json(path, label):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError as e:
+        print(f"{label} file not found: {e}")
+    except json.JSONDecodeError as e:
+        print(f"Error decoding JSON from {label.lower()} file: {e}")
+    return {}
+
 
 class AccountManager:
+    """
+    Credentials live in accounts.json; session metadata (cookie freshness,
+    last login) lives in sessions.json so routine logins never rewrite the
+    credentials file. Changes are coalesced and flushed atomically after
+    ACCOUNT_FLUSH_DELAY seconds, on flush(), or at exit.
+    """
+
     _accounts = None  # cache
+    _sessions = None  # cache
+    _dirty = set()    # files with unflushed changes: {"accounts", "sessions"}
+    _flush_timer = None
+    _lock = threading.RLock()
 
     @classmethod
     def _load_accounts(cls):
         if cls._accounts is None:
-            try:
-                with open(ACCOUNTS_FILE, "r") as f:
-                    cls._accounts = json.load(f)
-            except FileNotFoundError as e:
-                print(f"Accounts file not found: {e}")
-                cls._accounts = {}
-            except json.JSONDecodeError as e:
-                print(f"Error decoding JSON from accounts file: {e}")
-                cls._accounts = {}
+            cls._accounts = _load_json(ACCOUNTS_FILE, "Accounts")
         return cls._accounts
 
+    @classmethod
+    def _load_sessions(cls):
+        if cls._sessions is None:
+            cls._sessions = _load_json(SESSIONS_FILE, "Sessions") if SESSIONS_FILE.exists() else {}
+        return cls._sessions
+
     @classmethod
     def get_account(cls, account_name):
         accounts = cls._load_accounts()
@@ -46,9 +92,58 @@ class AccountManager:
         if account_name not in accounts:
             raise ValueError(f"Account '{account_name}' not found.")
 
-        accounts[account_name]['has_cookies'] = value
+        with cls._lock:
+            if accounts[account_name].get('has_cookies') == value:
+                return  # no-op, nothing to write
+            accounts[account_name]['has_cookies'] = value
+            cls._mark_dirty("accounts")
+
+    @classmethod
+    def get_session(cls, account_name):
+        """Session metadata for an account ({} if none recorded yet)."""
+        return dict(cls._load_sessions().get(account_name, {}))
+
+    @classmethod
+    def update_session(cls, account_name, **fields):
+        """Merge fields (e.g. cookies_validated_at, last_login_at) into the session record."""
+        with cls._lock:
+            session = cls._load_sessions().setdefault(account_name, {})
+            changed = {k: v for k, v in fields.items() if session.get(k) != v}
+            if not changed:
+                return
+            session.update(changed)
+            cls._mark_dirty("sessions")
+
+    @classmethod
+    def record_login(cls, account_name, cookies_validated=True):
+        now = time.time()
+        fields = {"last_login_at": now}
+        if cookies_validated:
+            fields["cookies_validated_at"] = now
+        cls.update_session(account_name, **fields)
+
+    @classmethod
+    def _mark_dirty(cls, name):
+        cls._dirty.add(name)
+        if cls._flush_timer is None:
+            cls._flush_timer = threading.Timer(ACCOUNT_FLUSH_DELAY, cls.flush)
+            cls._flush_timer.daemon = True
+            cls._flush_timer.start()
+
+    @classmethod
+    def flush(cls):
+        """Write any pending changes now."""
+        with cls._lock:
+            if cls._flush_timer is not None:
+                cls._flush_timer.cancel()
+                cls._flush_timer = None
+
+            if "accounts" in cls._dirty:
+                _atomic_write_json(ACCOUNTS_FILE, cls._accounts)
+            if "sessions" in cls._dirty:
+                SESSIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write_json(SESSIONS_FILE, cls._sessions)
+            cls._dirty.clear()
 
-        with open(ACCOUNTS_FILE, "w") as f:
-            json.dump(accounts, f, indent=4)
 
-        cls._accounts = accounts  # update cache
+atexit.register(AccountManager.flush)
@@ -0,0 +1,125 @@
+import atexit
+import gzip
+import json
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from Config.settings import (
+    ARTIFACTS_DIR,
+    ARTIFACT_FORMAT,
+    ARTIFACT_QUALITY,
+    ARTIFACT_SCALE,
+    ARTIFACT_KEEP,
+    ARTIFACT_KEEP_RUNS,
+)
+from Helpers.LogManager import LogManager
+from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+
+log = LogManager.get_logger("artifacts")
+
+
+class ArtifactCapture:
+    """
+    Evidence for failures: a compressed screenshot and a trimmed DOM snapshot.
+
+    capture() only does the two browser round trips (DOM snapshot, then a
+    downscaled JPEG/WebP via CDP) on the calling thread; compression and
+    file writes happen on a background writer. Each run
+    gets its own directory under ARTIFACTS_DIR holding a ring buffer of
+    ARTIFACT_KEEP slots, so a run that fails repeatedly overwrites its
+    oldest evidence instead of filling the disk:
+
+        Data/artifacts/20260101-120000/07.jpg, 07.html.gz, 07.json
+
+    The .json file names the failure, page, time and sequence number.
+    """
+
+    enabled = True
+    keep = ARTIFACT_KEEP
+
+    _seq = 0
+    _run_dir = None
+    _writer = None
+    _pending = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def capture(cls, reason, **context):
+        """Record the current page for failure `reason`; `context` is saved alongside.
+
+        Never raises and returns quickly; the files appear shortly after.
+        """
+        if not cls.enabled or not SS.has_driver():
+            return None
+        started = time.perf_counter()
+        try:
+            snapshot = SS.dom_snapshot() or {}
+            viewport = (snapshot["width"], snapshot["height"]) if snapshot.get("width") else None
+            screenshot = SS.capture_screenshot(ARTIFACT_FORMAT, ARTIFACT_QUALITY, ARTIFACT_SCALE, viewport)
+        except Exception as e:  # evidence is best effort; never turn one failure into two
+            log.warning("Could not capture artifacts for %s: %s", reason, e)
+            return None
+
+        with cls._lock:
+            seq = cls._seq
+            cls._seq += 1
+            if cls._writer is None:
+                cls._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+                atexit.register(cls.flush)
+            meta = {
+                "seq": seq,
+                "reason": reason,
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "url": snapshot.get("url"),
+                "title": snapshot.get("title"),
+                "dom_truncated": snapshot.get("truncated"),
+                "capture_ms": round((time.perf_counter() - started) * 1000, 1),
+                **{key: str(value) for key, value in context.items()},
+            }
+            future = cls._writer.submit(cls._write, seq % cls.keep, meta, screenshot, snapshot.get("html"))
+            cls._pending.add(future)
+        future.add_done_callback(cls._pending.discard)
+        return seq
+
+    @classmethod
+    def _run_directory(cls):
+        """This run's directory, created on first write; older runs beyond ARTIFACT_KEEP_RUNS are removed."""
+        if cls._run_dir is None:
+            ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+            runs = sorted(p for p in ARTIFACTS_DIR.iterdir() if p.is_dir())
+            for old in runs[:max(0, len(runs) - ARTIFACT_KEEP_RUNS + 1)]:
+                shutil.rmtree(old, ignore_errors=True)
+            cls._run_dir = ARTIFACTS_DIR / time.strftime("%Y%m%d-%H%M%S")
+            cls._run_dir.mkdir(exist_ok=True)
+        return cls._run_dir
+
+    @classmethod
+    def _write(cls, slot, meta, screenshot, html):
+        try:
+            run_dir = cls._run_directory()
+            prefix = f"{slot:02d}"
+            for stale in run_dir.glob(f"{prefix}.*"):  # the slot's previous occupant
+                stale.unlink()
+
+            if screenshot is not None:
+                image, image_format = screenshot  # Firefox returns a PNG whatever was asked for
+                extension = SS.image_extension(image_format)
+                (run_dir / f"{prefix}.{extension}").write_bytes(image)
+                meta["screenshot"] = f"{prefix}.{extension}"
+            if html:
+                with gzip.open(run_dir / f"{prefix}.html.gz", "wt", encoding="utf-8", compresslevel=6) as f:
+                    f.write(html)
+                meta["dom"] = f"{prefix}.html.gz"
+            (run_dir / f"{prefix}.json").write_text(json.dumps(meta, indent=2, ensure_ascii=False))
+            log.info("Saved %s artifacts to %s/%s.*", meta["reason"], run_dir, prefix)
+        except Exception as e:
+            log.warning("Could not write %s artifacts: %s", meta["reason"], e)
+
+    @classmethod
+    def flush(cls, timeout=5):
+        """Wait (up to `timeout` seconds) for pending writes; called on shutdown."""
+        with cls._lock:
+            pending = list(cls._pending)
+        if pending:
+            wait(pending, timeout=timeout)
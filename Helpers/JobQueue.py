@@ -0,0 +1,177 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from Config.settings import JOBS_FILE, JOB_MAX_ATTEMPTS
+from Helpers.LogManager import LogManager
+
+log = LogManager.get_logger("jobs")
+
+PENDING = "pending"
+EXTRACTED = "extracted"    # tweet opened and its text read
+SUMMARIZED = "summarized"  # comment text ready
+DONE = "done"
+FAILED = "failed"
+
+TERMINAL_STATES = (DONE, FAILED)
+
+
+class Job:
+    """One post URL's progress; a snapshot of its row in the jobs table."""
+
+    __slots__ = ("id", "run_id", "position", "url", "state", "tweet_id", "tweet_url",
+                 "tweet_text", "summary", "attempts", "error")
+
+    def __init__(self, row):
+        for name, value in zip(self.__slots__, row):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return f"<Job {self.position} {self.state} {self.url}>"
+
+
+class JobQueue:
+    """
+    Durable per-URL work queue with step checkpoints (SQLite under DATA_DIR).
+
+    A run is the ordered list of post URLs handed to open_run(). Each step's
+    result is committed as soon as it completes (pending -> extracted ->
+    summarized -> done), so after a crash or interrupt the next open_run()
+    with the same URLs resumes at the first incomplete step instead of
+    redoing navigation, extraction or LLM calls.
+    """
+
+    _conn = None
+    _lock = threading.RLock()
+    run_id = None
+
+    _COLUMNS = "id, run_id, position, url, state, tweet_id, tweet_url, tweet_text, summary, attempts, error"
+
+    @classmethod
+    def _get_conn(cls):
+        if cls._conn is None:
+            JOBS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            cls._conn = sqlite3.connect(JOBS_FILE, check_same_thread=False)
+            cls._conn.execute("PRAGMA journal_mode=WAL")
+            cls._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                " id INTEGER PRIMARY KEY,"
+                " urls_key TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " finished_at REAL);"
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id INTEGER PRIMARY KEY,"
+                " run_id INTEGER NOT NULL REFERENCES runs(id),"
+                " position INTEGER NOT NULL,"
+                " url TEXT NOT NULL,"
+                " state TEXT NOT NULL,"
+                " tweet_id TEXT,"
+                " tweet_url TEXT,"
+                " tweet_text TEXT,"
+                " summary TEXT,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " error TEXT,"
+                " updated_at REAL NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS idx_jobs_run ON jobs(run_id, position);"
+            )
+        return cls._conn
+
+    @staticmethod
+    def _urls_key(urls):
+        return hashlib.sha1("\n".join(urls).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def open_run(cls, urls):
+        """Resume the unfinished run over the same URLs, or start a new one. Returns the run id."""
+        urls = list(urls)
+        key = cls._urls_key(urls)
+        with cls._lock:
+            conn = cls._get_conn()
+            row = conn.execute(
+                "SELECT id FROM runs WHERE urls_key = ? AND finished_at IS NULL ORDER BY id DESC LIMIT 1",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                cls.run_id = row[0]
+                counts = cls.counts()
+                log.info("↩️ Resuming run %s: %s", cls.run_id, counts)
+                return cls.run_id
+
+            now = time.time()
+            cls.run_id = conn.execute(
+                "INSERT INTO runs (urls_key, created_at) VALUES (?, ?)", (key, now)
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO jobs (run_id, position, url, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(cls.run_id, position, url, PENDING, now) for position, url in enumerate(urls)],
+            )
+            conn.commit()
+            return cls.run_id
+
+    @classmethod
+    def incomplete(cls):
+        """Jobs of the current run not yet done or failed, in position order."""
+        with cls._lock:
+            rows = cls._get_conn().execute(
+                f"SELECT {cls._COLUMNS} FROM jobs WHERE run_id = ? AND state NOT IN (?, ?) ORDER BY position",
+                (cls.run_id, *TERMINAL_STATES),
+            ).fetchall()
+        return [Job(row) for row in rows]
+
+    @classmethod
+    def checkpoint(cls, job, state, **fields):
+        """Commit `job`'s new state and step results (tweet_id, tweet_url, tweet_text, summary, error)."""
+        fields["state"] = state
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with cls._lock:
+            conn = cls._get_conn()
+            conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ?",
+                (*fields.values(), time.time(), job.id),
+            )
+            conn.commit()
+        for name, value in fields.items():
+            setattr(job, name, value)
+
+    @classmethod
+    def record_failure(cls, job, error):
+        """Count a failed attempt; the job stays at its last checkpoint until attempts run out."""
+        attempts = job.attempts + 1
+        step = job.state
+        state = FAILED if attempts >= JOB_MAX_ATTEMPTS else step
+        with cls._lock:
+            conn = cls._get_conn()
+            conn.execute(
+                "UPDATE jobs SET attempts = ?, error = ?, state = ?, updated_at = ? WHERE id = ?",
+                (attempts, str(error)[:500], state, time.time(), job.id),
+            )
+            conn.commit()
+        job.attempts, job.error, job.state = attempts, str(error)[:500], state
+        log.warning("⚠️ Job %s failed after '%s' (attempt %s/%s): %s",
+                    job.position, step, attempts, JOB_MAX_ATTEMPTS, error)
+
+    @classmethod
+    def finish_run_if_complete(cls):
+        """Mark the current run finished once every job is done or failed."""
+        with cls._lock:
+            if cls.incomplete():
+                return False
+            conn = cls._get_conn()
+            conn.execute("UPDATE runs SET finished_at = ? WHERE id = ?", (time.time(), cls.run_id))
+            conn.commit()
+            return True
+
+    @classmethod
+    def counts(cls):
+        with cls._lock:
+            rows = cls._get_conn().execute(
+                "SELECT state, COUNT(*) FROM jobs WHERE run_id = ? GROUP BY state", (cls.run_id,)
+            ).fetchall()
+        return dict(rows)
+
+    @classmethod
+    def close(cls):
+        with cls._lock:
+            if cls._conn is not None:
+                cls._conn.close()
+                cls._conn = None
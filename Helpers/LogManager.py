@@ -0,0 +1,182 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from Config.settings import (
+    LOG_LEVEL,
+    LOG_CONSOLE_LEVEL,
+    LOG_FILE,
+    LOG_MAX_BYTES,
+    LOG_BACKUP_COUNT,
+    LOG_RATE_LIMIT,
+    LOG_RATE_WINDOW,
+    LOG_SAMPLE_EVERY,
+)
+
+# Attributes every LogRecord has; anything else was passed via `extra=` and becomes a JSON field
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, thread, msg, extra fields, exc."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Thins out repetitive messages.
+
+    Records are grouped by logger and message template (the unformatted
+    `msg`, so "Element not found: %s" is one group whatever the selector).
+    The first `limit` per `window` seconds pass, then one in `sample_every`;
+    the next record that passes carries the number dropped as `suppressed`.
+    Errors always pass.
+    """
+
+    _MAX_KEYS = 2000
+
+    def __init__(self, limit=LOG_RATE_LIMIT, window=LOG_RATE_WINDOW, sample_every=LOG_SAMPLE_EVERY):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self.sample_every = sample_every
+        self._groups = {}  # (logger, template) -> [window start, count, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.ERROR or self.limit <= 0:
+            return True
+
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            group = self._groups.get(key)
+            if group is None or now - group[0] >= self.window:
+                if len(self._groups) >= self._MAX_KEYS:
+                    self._groups.clear()
+                # Drops from the last window are reported with the first record of this one
+                group = self._groups[key] = [now, 0, group[2] if group else 0]
+            group[1] += 1
+            over = group[1] - self.limit
+            if over > 0 and (self.sample_every <= 0 or over % self.sample_every):
+                group[2] += 1
+                return False
+            if group[2]:
+                record.suppressed = group[2]
+                group[2] = 0
+        return True
+
+
+class _QueueHandler(logging.Handler):
+    """Formats in the caller, hands the record to the writer thread; never blocks on I/O."""
+
+    def __init__(self, records):
+        super().__init__()
+        self.records = records
+
+    def emit(self, record):
+        try:
+            LogManager._start_writer()
+            # Resolve args and tracebacks now; they may not be picklable or may change later
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+            self.records.put_nowait(record)
+        except Exception:
+            self.handleError(record)
+
+
+class LogManager:
+    """
+    Levelled, structured logging that keeps terminal and file I/O off the hot path.
+
+    Loggers from get_logger() are children of "bot". Records are queued and
+    written by a background thread: JSON lines to LOG_FILE (size-rotated),
+    and plain text to stdout for LOG_CONSOLE_LEVEL and above. Repetitive
+    messages are rate-limited (RateLimitFilter). Nothing touches the disk
+    until the first record is written, and call sites below LOG_LEVEL
+    cost one level check.
+
+        log = LogManager.get_logger("selenium")
+        log.debug("Navigated to %s", url)
+        log.info("Element not found: %s=%r", by, value, extra={"timeout_s": 5})
+    """
+
+    ROOT = "bot"
+
+    _records = queue.SimpleQueue()
+    _handler = None
+    _listener = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_logger(cls, name):
+        if cls._handler is None:
+            cls._configure()
+        return logging.getLogger(f"{cls.ROOT}.{name}")
+
+    @classmethod
+    def _configure(cls):
+        with cls._lock:
+            if cls._handler is not None:
+                return
+            root = logging.getLogger(cls.ROOT)
+            root.setLevel(min(logging.getLevelName(LOG_LEVEL), logging.getLevelName(LOG_CONSOLE_LEVEL)))
+            root.propagate = False
+            handler = _QueueHandler(cls._records)
+            handler.addFilter(RateLimitFilter())
+            root.addHandler(handler)
+            cls._handler = handler
+
+    @classmethod
+    def _start_writer(cls):
+        if cls._listener is not None:
+            return
+        with cls._lock:
+            if cls._listener is not None:
+                return
+            from logging.handlers import QueueListener, RotatingFileHandler
+
+            LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = RotatingFileHandler(
+                LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+            )
+            file_handler.setLevel(LOG_LEVEL)
+            file_handler.setFormatter(JsonFormatter())
+
+            console = logging.StreamHandler(sys.stdout)
+            console.setLevel(LOG_CONSOLE_LEVEL)
+            console.setFormatter(logging.Formatter("%(message)s"))
+
+            cls._listener = QueueListener(cls._records, file_handler, console, respect_handler_level=True)
+            cls._listener.start()
+            atexit.register(cls.flush)
+
+    @classmethod
+    def flush(cls):
+        """Write out everything queued and close the log file (called on shutdown)."""
+        with cls._lock:
+            listener, cls._listener = cls._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
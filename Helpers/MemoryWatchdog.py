@@ -0,0 +1,187 @@
+import functools
+import os
+from Config.settings import (
+    WATCHDOG_ENABLED,
+    WATCHDOG_SAMPLE_EVERY,
+    WATCHDOG_MAX_JS_HEAP_MB,
+    WATCHDOG_MAX_NODES,
+    WATCHDOG_MAX_LISTENERS,
+    WATCHDOG_MAX_BROWSER_RSS_MB,
+    WATCHDOG_RESTART_EVERY_POSTS,
+)
+from Helpers.LogManager import LogManager
+from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+
+log = LogManager.get_logger("watchdog")
+
+_MB = 2 ** 20
+
+
+@functools.lru_cache(maxsize=None)
+def _load_psutil():
+    """psutil if installed, otherwise None (no browser RSS; said once)."""
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        log.warning("⚠️ psutil is not installed; the browser RSS limit is not checked.")
+        return None
+
+
+def _python_rss_mb():
+    psutil = _load_psutil()
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / _MB
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / _MB
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _browser_rss_mb():
+    """Total RSS of chromedriver and every browser process under it, or None if unknown."""
+    psutil = _load_psutil()
+    pid = SS.browser_process_id()
+    if psutil is None or pid is None:
+        return None
+    try:
+        root = psutil.Process(pid)
+        total = 0
+        for process in [root] + root.children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass  # exited while we were looking
+        return total / _MB
+    except psutil.Error:
+        return None
+
+
+class MemoryWatchdog:
+    """
+    Keeps browser memory bounded on long runs.
+
+    check() is called between posts. It samples the tab (CDP
+    Performance.getMetrics: JS heap, DOM nodes, event listeners) and the
+    browser's RSS, then escalates:
+
+        tab over a WATCHDOG_MAX_* limit       -> recycle the tab
+        still over right after a recycle,
+        or browser over its RSS limit          -> restart the browser
+
+    A restart keeps the session cookies. The run's place in the queue is
+    unaffected: every post's progress is already checkpointed in JobQueue,
+    and the next post navigates from scratch either way.
+    """
+
+    enabled = WATCHDOG_ENABLED
+
+    _posts = 0
+    _posts_since_restart = 0
+    _recycled = False  # last action was a recycle and nothing has been healthy since
+    _metrics_enabled = None  # window handle Performance.enable was sent to
+    _last_sample = None
+    _peak = {}
+    _counts = {"samples": 0, "tab_recycles": 0, "restarts": 0, "errors": 0}
+
+    @classmethod
+    def sample(cls):
+        """Current memory metrics (MB / counts); None for ones that can't be read."""
+        sample = {"js_heap_mb": None, "nodes": None, "listeners": None,
+                  "browser_rss_mb": _browser_rss_mb(), "python_rss_mb": _python_rss_mb()}
+        # Without CDP (e.g. Firefox) only the RSS figures are available
+        if SS.supports_cdp():
+            try:
+                driver = SS.get_driver()
+                handle = driver.current_window_handle
+                if cls._metrics_enabled != handle:
+                    SS.execute_cdp("Performance.enable")
+                    cls._metrics_enabled = handle
+                metrics = {m["name"]: m["value"] for m in SS.execute_cdp("Performance.getMetrics")["metrics"]}
+                sample["js_heap_mb"] = metrics.get("JSHeapUsedSize", 0) / _MB
+                sample["nodes"] = int(metrics.get("Nodes", 0))
+                sample["listeners"] = int(metrics.get("JSEventListeners", 0))
+            except Exception as e:
+                log.warning("Could not read browser metrics: %s", e)
+
+        cls._counts["samples"] += 1
+        cls._last_sample = sample
+        for name, value in sample.items():
+            if value is not None:
+                cls._peak[name] = max(cls._peak.get(name, value), value)
+        return sample
+
+    @staticmethod
+    def _over_tab_limits(sample):
+        limits = {"js_heap_mb": WATCHDOG_MAX_JS_HEAP_MB, "nodes": WATCHDOG_MAX_NODES,
+                  "listeners": WATCHDOG_MAX_LISTENERS}
+        return [name for name, limit in limits.items()
+                if sample[name] is not None and sample[name] > limit]
+
+    @classmethod
+    def check(cls):
+        """Sample (every WATCHDOG_SAMPLE_EVERY posts) and recycle or restart if needed.
+
+        Returns the action taken: None, 'recycle' or 'restart'.
+        """
+        if not cls.enabled or not SS.has_driver():
+            return None
+        _load_psutil()  # warns on the first check if the RSS limit can't be enforced
+        cls._posts += 1
+        cls._posts_since_restart += 1
+        if cls._posts % WATCHDOG_SAMPLE_EVERY:
+            return None
+
+        sample = cls.sample()
+        over = cls._over_tab_limits(sample)
+        rss = sample["browser_rss_mb"]
+        log.info("Browser memory after post %s", cls._posts, extra={"memory": sample, "over": over})
+
+        if rss is not None and rss > WATCHDOG_MAX_BROWSER_RSS_MB:
+            reason = f"browser RSS {rss:.0f}MB"
+        elif over and cls._recycled:
+            reason = f"{', '.join(over)} still over the limit after a tab recycle"
+        elif WATCHDOG_RESTART_EVERY_POSTS and cls._posts_since_restart >= WATCHDOG_RESTART_EVERY_POSTS:
+            reason = f"scheduled after {cls._posts_since_restart} posts"
+        elif over:
+            return cls._recycle_tab(over)
+        else:
+            cls._recycled = False
+            return None
+        return cls._restart(reason)
+
+    @classmethod
+    def _recycle_tab(cls, over):
+        log.warning("♻️ Tab over its memory limits (%s); opening a fresh tab.", ", ".join(over))
+        try:
+            SS.recycle_tab()
+        except Exception as e:
+            log.warning("Could not recycle the tab (%s); restarting the browser.", e)
+            return cls._restart("tab recycle failed")
+        cls._recycled = True
+        cls._counts["tab_recycles"] += 1
+        return "recycle"
+
+    @classmethod
+    def _restart(cls, reason):
+        log.warning("♻️ Restarting the browser: %s.", reason)
+        if not SS.restart_driver():
+            return None
+        cls._recycled = False
+        cls._posts_since_restart = 0
+        cls._metrics_enabled = None
+        cls._counts["restarts"] += 1
+        return "restart"
+
+    @classmethod
+    def record_error(cls, error):
+        """Count and log a check() that raised; the run carries on with the current browser."""
+        cls._counts["errors"] += 1
+        log.error("Memory watchdog failed: %s", error, exc_info=error)
+
+    @classmethod
+    def stats(cls):
+        def rounded(values):
+            return {k: round(v, 1) for k, v in (values or {}).items() if v is not None}
+        return {**cls._counts, "last": rounded(cls._last_sample), "peak": rounded(cls._peak)}
@@ -0,0 +1,130 @@
+import hashlib
+import math
+import re
+import sqlite3
+import threading
+import time
+from Config.settings import PROCESSED_INDEX_FILE, PROCESSED_BLOOM_CAPACITY, PROCESSED_BLOOM_ERROR_RATE
+from Helpers.LogManager import LogManager
+
+log = LogManager.get_logger("processed")
+
+_STATUS_ID_RE = re.compile(r"/status(?:es)?/(\d+)")
+
+
+def tweet_id_from_url(url):
+    """Tweet ID from a status URL or href ('/user/status/123?s=20' -> '123'), else None."""
+    if not url:
+        return None
+    match = _STATUS_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity, error_rate):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class ProcessedIndex:
+    """
+    Persistent set of tweet IDs the bot has already handled.
+
+    A Bloom filter built from the SQLite table at startup answers most
+    lookups in memory: a negative is definitive, and only possible positives
+    are confirmed against the table. Check before opening a tweet so repeat
+    runs skip navigation, extraction and LLM calls for it.
+    """
+
+    _conn = None
+    _bloom = None
+    _lock = threading.Lock()
+    skipped = 0
+
+    @classmethod
+    def _load(cls):
+        if cls._conn is None:
+            PROCESSED_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+            cls._conn = sqlite3.connect(PROCESSED_INDEX_FILE, check_same_thread=False)
+            cls._conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed ("
+                " tweet_id TEXT PRIMARY KEY,"
+                " action TEXT,"
+                " processed_at REAL NOT NULL)"
+            )
+            cls._conn.commit()
+
+            count = cls._conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+            # Keep the false-positive rate near target as the table grows
+            cls._bloom = BloomFilter(max(PROCESSED_BLOOM_CAPACITY, count * 2), PROCESSED_BLOOM_ERROR_RATE)
+            for (tweet_id,) in cls._conn.execute("SELECT tweet_id FROM processed"):
+                cls._bloom.add(tweet_id)
+        return cls._conn
+
+    @classmethod
+    def contains(cls, tweet_id):
+        """True if `tweet_id` was processed in this or an earlier run."""
+        if not tweet_id:
+            return False
+        with cls._lock:
+            conn = cls._load()
+            if tweet_id not in cls._bloom:
+                return False
+            return conn.execute(
+                "SELECT 1 FROM processed WHERE tweet_id = ?", (tweet_id,)
+            ).fetchone() is not None
+
+    @classmethod
+    def should_skip(cls, tweet_id):
+        """contains() that also counts skips for the end-of-run report."""
+        if cls.contains(tweet_id):
+            cls.skipped += 1
+            log.info("⏭️ Tweet %s already processed, skipping.", tweet_id)
+            return True
+        return False
+
+    @classmethod
+    def add(cls, tweet_id, action="commented"):
+        if not tweet_id:
+            return
+        with cls._lock:
+            conn = cls._load()
+            conn.execute(
+                "INSERT OR IGNORE INTO processed (tweet_id, action, processed_at) VALUES (?, ?, ?)",
+                (tweet_id, action, time.time()),
+            )
+            conn.commit()
+            cls._bloom.add(tweet_id)
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            conn = cls._load()
+            total = conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+        return {"processed": total, "skipped_this_run": cls.skipped}
+
+    @classmethod
+    def close(cls):
+        with cls._lock:
+            if cls._conn is not None:
+                cls._conn.close()
+                cls._conn = None
+                cls._bloom = None
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import re
+import threading
+from Config.settings import PROMPT_FILE, SUMMARY_PROMPT_VERSION, SUMMARY_INPUT_TOKEN_BUDGET
+
+# Placeholder rendered into the template once; swapped for the real text per call.
+# Alphanumeric only so POML's markdown rendering leaves it untouched.
+_TEXT_SLOT = "PROMPTTEXTSLOT7F3A"
+
+# Used when the POML file is empty or the poml package is unavailable
+_DEFAULT_TEMPLATE = [{"role": "user", "content": f"Summarize this: {_TEXT_SLOT}"}]
+
+_SPEAKER_ROLES = {"human": "user", "ai": "assistant", "system": "system"}
+
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Runs of emoji / pictographs (with joiners and variation selectors)
+_EMOJI_RUN_RE = re.compile("[\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\u200D\uFE0F]{4,}")
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def _load_tokenizer():
+    """tiktoken's cl100k encoding if installed, otherwise None (regex estimate)."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+class PromptManager:
+    """
+    Summary prompt compiled once from PROMPT_FILE.
+
+    Rendering POML starts a Node process, so the template is rendered a single
+    time with a placeholder and re-rendered only when the file's mtime changes;
+    each call then substitutes the (normalized, token-budgeted) text.
+    """
+
+    _template = None     # list of {"role", "content"} with _TEXT_SLOT in it
+    _mtime = None
+    _version = None
+    _lock = threading.Lock()
+    _tokenizer = False   # False = not loaded yet
+
+    @classmethod
+    def _file_mtime(cls):
+        try:
+            return os.stat(PROMPT_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @classmethod
+    def _render_poml(cls):
+        if not PROMPT_FILE.exists() or not PROMPT_FILE.read_text(encoding="utf-8").strip():
+            return None
+        try:
+            from poml import poml
+        except ImportError:
+            print("⚠️ poml is not installed, using the built-in summary prompt.")
+            return None
+
+        try:
+            rendered = poml(PROMPT_FILE, context={"text": _TEXT_SLOT}, chat=True)
+        except Exception as e:
+            print(f"⚠️ Failed to render {PROMPT_FILE.name}, using the built-in summary prompt: {e}")
+            return None
+
+        messages = []
+        for message in rendered:
+            content = message.get("content")
+            if isinstance(content, list):  # multi-part content; keep the text parts
+                content = "".join(part for part in content if isinstance(part, str))
+            messages.append({"role": _SPEAKER_ROLES.get(message.get("speaker"), "user"), "content": content})
+
+        if not any(_TEXT_SLOT in m["content"] for m in messages):
+            messages.append({"role": "user", "content": _TEXT_SLOT})
+        return messages
+
+    @classmethod
+    def compile(cls, force=False):
+        """Render the template if it is not cached or the file changed; returns it."""
+        mtime = cls._file_mtime()
+        if not force and cls._template is not None and mtime == cls._mtime:
+            return cls._template
+
+        with cls._lock:
+            if force or cls._template is None or mtime != cls._mtime:
+                template = cls._render_poml() or _DEFAULT_TEMPLATE
+                digest = hashlib.sha1(repr(template).encode("utf-8")).hexdigest()[:8]
+                cls._template, cls._mtime = template, mtime
+                cls._version = f"{SUMMARY_PROMPT_VERSION}-{digest}"
+        return cls._template
+
+    @classmethod
+    def version(cls):
+        """Prompt version for cache keys; changes whenever the compiled template does."""
+        cls.compile()
+        return cls._version
+
+    # ------------------------------------------------------------------
+    # Input budget
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def normalize_text(text):
+        """Drop URLs, shorten emoji runs to three and collapse whitespace."""
+        text = _URL_RE.sub("", text)
+        text = _EMOJI_RUN_RE.sub(lambda m: m.group(0)[:3], text)
+        return _WHITESPACE_RE.sub(" ", text).strip()
+
+    @classmethod
+    def _get_tokenizer(cls):
+        if cls._tokenizer is False:
+            cls._tokenizer = _load_tokenizer()
+        return cls._tokenizer
+
+    @classmethod
+    def count_tokens(cls, text):
+        tokenizer = cls._get_tokenizer()
+        if tokenizer is not None:
+            return len(tokenizer.encode(text))
+        return len(_TOKEN_RE.findall(text))
+
+    @classmethod
+    def fit_to_budget(cls, text, budget=SUMMARY_INPUT_TOKEN_BUDGET):
+        """Normalized text, cut to at most `budget` tokens."""
+        text = cls.normalize_text(text)
+        tokenizer = cls._get_tokenizer()
+        if tokenizer is not None:
+            tokens = tokenizer.encode(text)
+            if len(tokens) <= budget:
+                return text
+            return tokenizer.decode(tokens[:budget]).rstrip() + "…"
+
+        matches = list(_TOKEN_RE.finditer(text))
+        if len(matches) <= budget:
+            return text
+        return text[:matches[budget - 1].end()].rstrip() + "…"
+
+    @classmethod
+    def messages(cls, text, budget=SUMMARY_INPUT_TOKEN_BUDGET):
+        """Chat messages for summarizing `text`."""
+        template = cls.compile()
+        text = cls.fit_to_budget(text, budget)
+        return [
+            {"role": m["role"], "content": m["content"].replace(_TEXT_SLOT, text)}
+            for m in template
+        ]
@@ -0,0 +1,232 @@
+import json
+import threading
+import time
+from Config.settings import XPATH_FILE
+from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+from Helpers.LogManager import LogManager
+
+log = LogManager.get_logger("selectors")
+
+
+class Locator:
+    """One precompiled selector plus its observed hit/miss record."""
+
+    __slots__ = ("selector_type", "by", "value", "hits", "misses", "hit_time", "dead")
+
+    def __init__(self, selector_type, value):
+        self.selector_type = selector_type
+        self.by = "xpath" if selector_type == "xpath" else "css selector"  # By.XPATH / By.CSS_SELECTOR
+        self.value = value
+        self.hits = 0
+        self.misses = 0
+        self.hit_time = 0.0  # total seconds spent on successful lookups
+        self.dead = False    # flagged by validate(): didn't match on its page; cleared by a hit
+
+    @property
+    def success_rate(self):
+        total = self.hits + self.misses
+        # Untried selectors keep their file order ahead of known-bad ones
+        return self.hits / total if total else 0.5
+
+    @property
+    def avg_hit_latency(self):
+        return self.hit_time / self.hits if self.hits else 0.0
+
+    def as_tuple(self):
+        return self.selector_type, self.value
+
+    def __repr__(self):
+        return f"Locator({self.selector_type}={self.value!r}, hits={self.hits}, misses={self.misses})"
+
+
+class SelectorRegistry:
+    """
+    Typed view of Data/xpaths.json.
+
+    Each element maps to one or more Locators (a JSON string or a list of
+    fallbacks). The file is parsed once; lookups try every fallback inside a
+    single wait and reorder them by observed success, so a stale selector
+    costs one poll instead of a full timeout.
+    """
+
+    _entries = None  # (page, element) -> [Locator, ...]
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _infer_type(element, value):
+        if element.endswith("_xpath") or value.startswith(("/", "(")):
+            return "xpath"
+        return "css"
+
+    @classmethod
+    def _load(cls):
+        if cls._entries is None:
+            with cls._lock:
+                if cls._entries is None:
+                    try:
+                        with open(XPATH_FILE, "r") as f:
+                            data = json.load(f)
+                    except (FileNotFoundError, json.JSONDecodeError) as e:
+                        log.error("Error loading selectors file: %s", e)
+                        data = {}
+
+                    entries = {}
+                    for page, elements in data.items():
+                        for element, values in elements.items():
+                            if isinstance(values, str):
+                                values = [values]
+                            entries[(page, element)] = [
+                                Locator(cls._infer_type(element, v), v) for v in values
+                            ]
+                    cls._entries = entries
+        return cls._entries
+
+    @classmethod
+    def get(cls, page, element):
+        """Return the ordered fallback list for an element ([] if unknown)."""
+        return cls._load().get((page, element), [])
+
+    @classmethod
+    def primary(cls, page, element):
+        """Best current locator as a (selector_type, value) tuple, or None."""
+        locators = cls.get(page, element)
+        return locators[0].as_tuple() if locators else None
+
+    @classmethod
+    def _reorder(cls, locators):
+        locators.sort(key=lambda loc: (loc.dead, -loc.success_rate, loc.avg_hit_latency))
+
+    @classmethod
+    def find(cls, page, element, timeout=None):
+        """Find an element trying every fallback in each poll.
+
+        Returns the first WebElement matched, or None after `timeout`.
+        """
+        locators = cls.get(page, element)
+        if not locators:
+            log.warning("No selector registered for %s.%s", page, element)
+            return None
+
+        wait_time = timeout or SS.default_timeout()
+        started = time.monotonic()
+        winner = {}
+
+        def any_match(d):
+            for loc in locators:
+                found = d.find_elements(loc.by, loc.value)
+                if found:
+                    winner["loc"] = loc
+                    return found[0]
+            return False
+
+        result = SS.wait_until(any_match, wait_time)
+
+        cls._record(locators, winner.get("loc"), time.monotonic() - started)
+        if result is None:
+            log.info("Element not found: %s.%s (tried %s selectors) within %s seconds",
+                     page, element, len(locators), wait_time)
+
+        return result
+
+    @classmethod
+    def _record(cls, locators, hit, elapsed):
+        """Count a lookup: the winner gets a hit, every locator tried before it a miss."""
+        with cls._lock:
+            for loc in locators:
+                if loc is hit:
+                    loc.hits += 1
+                    loc.hit_time += elapsed
+                    loc.dead = False  # validate() saw the page before this rendered
+                    break
+                loc.misses += 1
+            cls._reorder(locators)
+
+    @classmethod
+    def read(cls, page, element, attributes=(), timeout=None):
+        """Like find(), but returns the first match's text and `attributes`.
+
+        All fallbacks go into one query_batch round trip per poll. Returns a
+        query_batch match dict ({"element", "text", "attributes"}) or None.
+        """
+        locators = cls.get(page, element)
+        if not locators:
+            log.warning("No selector registered for %s.%s", page, element)
+            return None
+
+        names = {f"{element}#{i}": loc for i, loc in enumerate(locators)}
+        started = time.monotonic()
+        winner = {}
+
+        def any_match(_driver):
+            result = SS.query_batch({name: loc.as_tuple() for name, loc in names.items()},
+                                    attributes=attributes) or {}
+            for name, loc in names.items():
+                match = SS.first_match(result, name)
+                if match:
+                    winner["loc"] = loc
+                    return match
+            return False
+
+        match = SS.wait_until(any_match, timeout)
+        cls._record(locators, winner.get("loc"), time.monotonic() - started)
+        if match is None:
+            log.info("Element not found: %s.%s (tried %s selectors) within %s seconds",
+                     page, element, len(locators), timeout or SS.default_timeout())
+        return match
+
+    @classmethod
+    def validate(cls, page, anchor=None, timeout=None):
+        """Check every selector of `page` against the current DOM in one round trip.
+
+        Waits for `anchor` (one of the page's elements) first: a single-page
+        app is "ready" well before its content renders, and checking then
+        would flag working selectors. Selectors that match nothing are
+        flagged dead and moved behind their fallbacks until they next match.
+
+        Returns a list of (element, value) pairs that did not match, or None
+        if nothing was checked (the anchor never appeared).
+        """
+        if anchor is not None and cls.find(page, anchor, timeout) is None:
+            log.info("Skipped validating %s selectors: %s never appeared", page, anchor)
+            return None
+
+        entries = {
+            f"{element}#{i}": loc
+            for (p, element), locators in cls._load().items() if p == page
+            for i, loc in enumerate(locators)
+        }
+        if not entries:
+            return []
+
+        result = SS.query_batch({name: loc.as_tuple() for name, loc in entries.items()}, limit=0)
+        if result is None:
+            return None
+
+        missing = []
+        with cls._lock:
+            for name, loc in entries.items():
+                loc.dead = not result.get(name, {}).get("count")
+                if loc.dead:
+                    missing.append((name.split("#")[0], loc.value))
+            for (p, _), locators in cls._entries.items():
+                if p == page:
+                    cls._reorder(locators)
+
+        for element, value in missing:
+            log.warning("⚠️ Selector did not match on %s: %s = %s", page, element, value)
+        return missing
+
+    @classmethod
+    def report(cls):
+        """Per-selector hit/miss and latency summary."""
+        lines = []
+        for (page, element), locators in sorted(cls._load().items()):
+            for loc in locators:
+                if loc.hits or loc.misses or loc.dead:
+                    lines.append(
+                        f"  {page}.{element}: {loc.value} hits={loc.hits} misses={loc.misses} "
+                        f"avg_hit={loc.avg_hit_latency * 1000:.0f}ms{' DEAD' if loc.dead else ''}"
+                    )
+        print("Selector report:" if lines else "Selector report: no lookups recorded.")
+        for line in lines:
+            print(line)
@@ -1,13 +1,44 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import threading
 import time
 import json
+import base64
 import atexit
+from collections import OrderedDict
+from Config.settings import (
+    BROWSER_STARTUP_MODE,
+    CHROME_PROFILE_DIR,
+    CHROME_DEBUG_PORT,
+    CHROMEDRIVER_URL,
+    LOAD_PROFILES,
+    LOAD_PROFILE,
+    MEASURE_NAVIGATION,
+    EXTRACTION_MODES,
+    EXTRACTION_MODE,
+    CAPTURED_TWEETS_MAX,
+    TIMELINE_RESPONSE_PATTERNS,
+    ARTIFACT_FORMAT,
+    ARTIFACT_QUALITY,
+    ARTIFACT_SCALE,
+    ARTIFACT_DOM_MAX_CHARS,
+)
+from Helpers.Tracer import Tracer
+from Helpers.TimelineParser import parse_timeline
+from Helpers.LogManager import LogManager
+
+log = LogManager.get_logger("selenium")
+
+
+def _support():
+    """WebDriverWait and expected_conditions, imported on first use.
+
+    Any selenium.webdriver import loads every browser's driver package, so
+    it is deferred until a driver is actually needed.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions
+    return WebDriverWait, expected_conditions
+
 
 class SeleniumSingleton:
     """
@@ -19,10 +50,37 @@ class SeleniumSingleton:
     _lock = threading.Lock()
     _timeout = 10
     _headless = False
-    
+    _poll_interval = 0.1
+    _settle_idle_time = 0.5
+    _min_dwell = 0
+    _wait_stats = []  # (label, baseline, actual) per readiness wait
+    _browser = 'chrome'
+    _startup_mode = 'cold'
+    _service = None
+    _atexit_registered = False
+    _load_profile = LOAD_PROFILES["full"]
+    _load_profile_name = "full"
+    _driver_factory = None  # rebuilds a driver installed with use_driver(), for restart_driver()
+    _nav_stats = []  # (url, load_seconds, transfer_bytes) per navigation
+    _extraction_mode = 'dom'
+    _pending_responses = {}  # CDP requestId -> url of timeline responses not yet read
+    _captured_tweets = OrderedDict()  # tweet id -> record decoded from timeline responses, LRU-bounded
+
     @classmethod
-    def initialize_driver(cls, browser='chrome', headless=False, timeout=10):
-        """Initialize the WebDriver if not already done."""
+    def initialize_driver(cls, browser='chrome', headless=False, timeout=10, startup_mode=None, load_profile=None,
+                          extraction_mode=None):
+        """Initialize the WebDriver if not already done.
+
+        Args:
+            startup_mode (str): 'cold' (throwaway profile), 'profile' (persistent
+                --user-data-dir under DATA_DIR, warm caches) or 'attach'
+                (reconnect to a browser left running by a 'profile' run).
+                Defaults to BROWSER_STARTUP_MODE.
+            load_profile (str): Name of a LOAD_PROFILES entry controlling page
+                load strategy and resource blocking. Defaults to LOAD_PROFILE.
+            extraction_mode (str): 'dom' or 'network' (also record timeline
+                responses for capture_timeline). Defaults to EXTRACTION_MODE.
+        """
         if cls._driver is not None:
             return cls._driver
         
@@ -32,45 +90,303 @@ class SeleniumSingleton:
             
             cls._timeout = timeout
             cls._headless = headless
+            cls._browser = browser
+            cls._startup_mode = startup_mode or BROWSER_STARTUP_MODE
+            profile_name = load_profile or LOAD_PROFILE
+            if profile_name not in LOAD_PROFILES:
+                raise ValueError(f"Unknown load profile: '{profile_name}'. "
+                                 f"Available: {list(LOAD_PROFILES.keys())}")
+            cls._load_profile = LOAD_PROFILES[profile_name]
+            cls._load_profile_name = profile_name
+            cls._extraction_mode = extraction_mode or EXTRACTION_MODE
+            if cls._extraction_mode not in EXTRACTION_MODES:
+                raise ValueError(f"Unknown extraction mode: '{cls._extraction_mode}'. "
+                                 f"Available: {list(EXTRACTION_MODES)}")
             
             try:
-                if browser.lower() == 'chrome':
-                    options = Options()
-                    if headless:
-                        options.add_argument('--headless')
-                    options.add_argument('--no-sandbox')
-                    options.add_argument('--disable-dev-shm-usage')
-                    options.add_argument('--disable-gpu')
-                    options.add_argument("--log-level=3")
-                    options.add_experimental_option("excludeSwitches", ["enable-logging"])
-                    cls._driver = webdriver.Chrome(options=options)
-                elif browser.lower() == 'firefox':
-                    from selenium.webdriver.firefox.options import Options as FirefoxOptions
-                    options = FirefoxOptions()
-                    if headless:
-                        options.add_argument('--headless')
-                    cls._driver = webdriver.Firefox(options=options)
-                else:
-                    raise ValueError(f"Unsupported browser: {browser}")
+                cls._driver = cls.build_driver(browser, headless, cls._startup_mode)
+                cls._apply_request_blocking()
+                cls._install_request_counter()
                 
-                cls._driver.implicitly_wait(cls._timeout)
+                # All waiting is explicit (WebDriverWait / readiness waits). An
+                # implicit wait on top of that multiplies timeouts on misses.
+                cls._driver.implicitly_wait(0)
+                cls._driver.set_script_timeout(cls._timeout + 5)
                 
                 # Register cleanup on program exit
-                atexit.register(cls.quit_driver)
+                if not cls._atexit_registered:
+                    atexit.register(cls.quit_driver)
+                    atexit.register(cls.stop_service)
+                    cls._atexit_registered = True
                 
-                print(f"WebDriver initialized successfully ({browser})")
+                log.info("WebDriver initialized successfully (%s, %s)", browser, cls._startup_mode)
                 return cls._driver
             
             except Exception as e:
-                print(f"Error initializing WebDriver: {e}")
+                log.error("Error initializing WebDriver: %s", e)
                 raise
+
+    @classmethod
+    def _chrome_options(cls, headless, startup_mode):
+        from selenium.webdriver.chrome.options import Options
+        options = Options()
+        if cls._extraction_mode == 'network':
+            # Network events only; page/timeline tracing would flood the log
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        if startup_mode == 'attach':
+            # Command-line switches can't be applied to a running browser
+            options.add_experimental_option("debuggerAddress", f"127.0.0.1:{CHROME_DEBUG_PORT}")
+            return options
+
+        options.page_load_strategy = cls._load_profile["page_load_strategy"]
+        if cls._load_profile["block_images"]:
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+
+        if headless:
+            options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument("--log-level=3")
+        options.add_experimental_option("excludeSwitches", ["enable-logging"])
+
+        if startup_mode == 'profile':
+            CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            options.add_argument(f"--user-data-dir={CHROME_PROFILE_DIR}")
+            # Lets later runs attach to this browser instead of starting one
+            options.add_argument(f"--remote-debugging-port={CHROME_DEBUG_PORT}")
+            # Keep the browser alive after chromedriver's session ends
+            options.add_experimental_option("detach", True)
+        elif startup_mode != 'cold':
+            raise ValueError(f"Unsupported startup mode: {startup_mode}")
+        return options
+
+    @classmethod
+    def _get_service_url(cls, options):
+        """URL of a long-lived chromedriver, started once and reused by every driver.
+
+        CHROMEDRIVER_URL points at one that outlives this process. Otherwise
+        chromedriver (and the browser binary, set on `options`) is resolved
+        the way webdriver.Chrome does: SE_CHROMEDRIVER, then Selenium Manager.
+        """
+        if CHROMEDRIVER_URL:
+            return CHROMEDRIVER_URL
+        from selenium.webdriver.common.driver_finder import DriverFinder
+        finder = None
+        if cls._service is None:
+            from selenium.webdriver.chrome.service import Service as ChromeService
+            service = ChromeService()
+            finder = DriverFinder(service, options)
+            service.path = service.env_path() or finder.get_driver_path()
+            service.start()
+            cls._service = service
+        if not options.binary_location:
+            finder = finder or DriverFinder(cls._service, options)
+            if finder.get_browser_path():
+                options.binary_location = finder.get_browser_path()
+                options.browser_version = None
+        return cls._service.service_url
+
+    @classmethod
+    def build_driver(cls, browser, headless, startup_mode):
+        """Create a new WebDriver without touching the singleton state."""
+        from selenium import webdriver
+        if browser.lower() == 'chrome':
+            from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+            options = cls._chrome_options(headless, startup_mode)
+            executor = ChromiumRemoteConnection(
+                remote_server_addr=cls._get_service_url(options),
+                vendor_prefix="goog",
+                browser_name="chrome",
+            )
+            return webdriver.Remote(command_executor=executor, options=options)
+        elif browser.lower() == 'firefox':
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
+            options = FirefoxOptions()
+            if headless:
+                options.add_argument('--headless')
+            return webdriver.Firefox(options=options)
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    @classmethod
+    def _apply_request_blocking(cls):
+        """Block the load profile's URL patterns via CDP (Chrome only).
+
+        Also the only blocking that works in attach mode, where launch
+        options can't be changed.
+        """
+        patterns = cls._load_profile["block_urls"]
+        if not patterns or cls._browser.lower() != 'chrome':
+            return
+        try:
+            cls.execute_cdp("Network.enable")
+            cls.execute_cdp("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            log.warning("Could not apply request blocking: %s", e)
+
+    @classmethod
+    def _install_request_counter(cls):
+        """Have every new document in this tab count its fetch/XHR requests (CDP only).
+
+        Without CDP the counter is installed by the first settle wait on a
+        page, so requests started before that are only seen once they finish.
+        """
+        if not cls.supports_cdp():
+            return
+        try:
+            cls.execute_cdp("Page.addScriptToEvaluateOnNewDocument", {"source": cls._REQUEST_COUNTER_JS})
+        except Exception as e:
+            log.warning("Could not install the request counter: %s", e)
+
+    @classmethod
+    def stop_service(cls):
+        """Stop the chromedriver started by this process, if any."""
+        if cls._service is not None:
+            try:
+                cls._service.stop()
+            except Exception as e:
+                log.warning("Error stopping chromedriver: %s", e)
+            finally:
+                cls._service = None
+
+    @classmethod
+    def supports_cdp(cls):
+        """Whether execute_cdp() works: Chrome, or a use_driver() driver that emulates it."""
+        return cls._browser.lower() in ('chrome', 'custom')
+
+    @classmethod
+    def execute_cdp(cls, cmd, params=None):
+        """Run a Chrome DevTools Protocol command on the current driver."""
+        driver = cls.get_driver()
+        return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
     
+    @classmethod
+    def use_driver(cls, driver, browser='custom', timeout=10, extraction_mode='dom', factory=None):
+        """Install an already-built driver (e.g. Benchmarks.fake_webdriver) as the singleton.
+
+        Anything implementing the WebDriver methods used here works, which
+        lets the script logic run without a browser. `factory()` builds a
+        replacement when restart_driver() is called.
+        """
+        with cls._lock:
+            if cls._driver is not None and cls._driver is not driver:
+                raise RuntimeError("A WebDriver is already initialized; call quit_driver() first")
+            cls._driver = driver
+            cls._browser = browser
+            cls._timeout = timeout
+            cls._startup_mode = 'cold'
+            cls._load_profile = LOAD_PROFILES["full"]
+            cls._load_profile_name = "full"
+            cls._extraction_mode = extraction_mode
+            cls._driver_factory = factory
+        return driver
+
+    @classmethod
+    def recycle_tab(cls):
+        """Replace the current tab with a fresh, blank one.
+
+        The old tab's renderer and JS heap go away with it; cookies belong
+        to the browser profile, so the session survives.
+        """
+        driver = cls.get_driver()
+        old_handle = driver.current_window_handle
+        driver.switch_to.new_window('tab')
+        new_handle = driver.current_window_handle
+        driver.switch_to.window(old_handle)
+        driver.close()
+        driver.switch_to.window(new_handle)
+        # Per-tab state: pending response bodies died with the tab, CDP settings didn't carry over
+        cls._pending_responses = {}
+        cls._apply_request_blocking()
+        cls._install_request_counter()
+        log.info("Recycled browser tab")
+
+    @classmethod
+    def restart_driver(cls):
+        """Quit the browser and start a new one with the same settings and session cookies.
+
+        Unlike quit_driver() this really closes a 'profile'/'attach'
+        browser, which is then relaunched in 'profile' mode. Returns False
+        if the driver can't be rebuilt (use_driver() without a factory).
+        """
+        if cls._driver is None:
+            return False
+        if cls._browser == 'custom' and cls._driver_factory is None:
+            log.warning("Can't restart a driver installed with use_driver() without a factory")
+            return False
+
+        try:
+            cookies = cls.get_all_cookies()
+            url = cls.get_current_url()  # a page of the session's domain, for add_cookie without CDP
+        except Exception as e:
+            log.warning("Could not save session cookies before restarting: %s", e)
+            cookies, url = [], None
+        try:
+            cls._driver.quit()
+        except Exception as e:
+            log.warning("Error quitting WebDriver: %s", e)
+        cls._driver = None
+        cls._pending_responses = {}
+
+        if cls._driver_factory is not None:
+            cls.use_driver(cls._driver_factory(), cls._browser, cls._timeout, cls._extraction_mode,
+                           factory=cls._driver_factory)
+        else:
+            startup_mode = 'profile' if cls._startup_mode == 'attach' else cls._startup_mode
+            cls.initialize_driver(cls._browser, cls._headless, cls._timeout, startup_mode,
+                                  cls._load_profile_name, cls._extraction_mode)
+
+        if cookies:
+            cls.inject_cookies(cookies, url)
+        log.info("Restarted WebDriver with %s session cookies", len(cookies))
+        return True
+
+    @classmethod
+    def get_all_cookies(cls):
+        """Every cookie in the browser, in get_cookies() format.
+
+        get_cookies() only returns the current page's cookies; CDP
+        Network.getAllCookies covers every domain. Falls back to
+        get_cookies() without CDP.
+        """
+        driver = cls.get_driver()
+        if cls.supports_cdp():
+            try:
+                return [cls._from_cdp_cookie(c) for c in cls.execute_cdp("Network.getAllCookies")["cookies"]]
+            except Exception as e:
+                log.warning("Could not read cookies via CDP: %s", e)
+        return driver.get_cookies()
+
+    @classmethod
+    def browser_process_id(cls):
+        """PID of the local chromedriver (the browser runs as its child), or None."""
+        process = getattr(cls._service, "process", None) if cls._service is not None else None
+        return process.pid if process is not None else None
+
     @classmethod
     def get_driver(cls):
         """Get the current WebDriver instance."""
         if cls._driver is None:
             cls.initialize_driver()
         return cls._driver
+
+    @classmethod
+    def has_driver(cls):
+        """Whether a driver is running; unlike get_driver() this never starts one."""
+        return cls._driver is not None
+
+    @classmethod
+    def extraction_mode(cls):
+        """'dom' or 'network' (see EXTRACTION_MODES)."""
+        return cls._extraction_mode
+
+    @classmethod
+    def default_timeout(cls):
+        """Seconds a wait given no timeout of its own lasts."""
+        return cls._timeout
     
     @staticmethod
     def navigate_to(url):
@@ -78,66 +394,186 @@ class SeleniumSingleton:
         driver = SeleniumSingleton.get_driver()
         try:
             driver.get(url)
-            print(f"Navigated to: {url}")
+            log.debug("Navigated to: %s", url)
+            if MEASURE_NAVIGATION:
+                SeleniumSingleton._record_navigation(url)
             return True
         except Exception as e:
-            print(f"Error navigating to {url}: {e}")
+            log.error("Error navigating to %s: %s", url, e)
             return False
+
+    _NAVIGATION_METRICS_JS = """
+        const nav = performance.getEntriesByType('navigation')[0];
+        if (!nav) return null;
+        const end = nav.loadEventEnd || nav.domContentLoadedEventEnd || performance.now();
+        let bytes = nav.transferSize || 0;
+        for (const r of performance.getEntriesByType('resource')) bytes += r.transferSize || 0;
+        return [end / 1000, bytes];
+    """
+
+    @classmethod
+    def _record_navigation(cls, url):
+        # transferSize is 0 for cross-origin resources without Timing-Allow-Origin,
+        # so byte counts are a lower bound; good enough to compare load profiles
+        metrics = cls._driver.execute_script(cls._NAVIGATION_METRICS_JS)
+        if metrics:
+            cls._nav_stats.append((url, metrics[0], metrics[1]))
+
+    @classmethod
+    def navigation_report(cls, reset=False):
+        """Print load time and bytes transferred per navigation."""
+        if not cls._nav_stats:
+            print("No navigations recorded (set MEASURE_NAVIGATION=1).")
+            return
+        print("Navigation report:")
+        for url, seconds, transferred in cls._nav_stats:
+            print(f"  {seconds:6.2f}s {transferred / 1024:9.1f} KiB  {url}")
+        total_time = sum(n[1] for n in cls._nav_stats)
+        total_bytes = sum(n[2] for n in cls._nav_stats)
+        count = len(cls._nav_stats)
+        print(f"  avg {total_time / count:.2f}s, {total_bytes / count / 1024:.1f} KiB over {count} navigations")
+        if reset:
+            cls._nav_stats = []
     
+    @classmethod
+    def capture_timeline(cls):
+        """Decode timeline responses received since the last call (network mode).
+
+        Drains the Chrome performance log, fetches the body of each finished
+        response matching TIMELINE_RESPONSE_PATTERNS with
+        Network.getResponseBody, and parses the tweets in it. Bodies are only
+        kept while their page is open, so call this before navigating away.
+
+        Returns:
+            list: newly seen tweet records (id, text, author, counts...)
+        """
+        if cls._extraction_mode != 'network':
+            return []
+        driver = cls.get_driver()
+        try:
+            # Chrome is a webdriver.Remote (see build_driver), which has no
+            # get_log(); issue the command ChromiumDriver.get_log() would send
+            entries = driver.execute("getLog", {"type": "performance"})["value"]
+        except Exception as e:
+            log.warning("Could not read the performance log: %s", e)
+            return []
+
+        new_records = []
+        page_url = None
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+
+            if method == "Network.responseReceived":
+                url = params.get("response", {}).get("url", "")
+                if any(pattern in url for pattern in TIMELINE_RESPONSE_PATTERNS):
+                    cls._pending_responses[params["requestId"]] = url
+            elif method == "Network.loadingFailed":
+                cls._pending_responses.pop(params.get("requestId"), None)
+            elif method == "Network.loadingFinished" and params.get("requestId") in cls._pending_responses:
+                url = cls._pending_responses.pop(params["requestId"])
+                try:
+                    body = cls.execute_cdp("Network.getResponseBody", {"requestId": params["requestId"]})
+                    raw = body["body"]
+                    if body.get("base64Encoded"):
+                        raw = base64.b64decode(raw).decode("utf-8")
+                    records = parse_timeline(json.loads(raw))
+                except Exception as e:
+                    log.warning("Could not decode timeline response %s: %s", url, e)
+                    continue
+
+                if page_url is None:
+                    page_url = driver.current_url
+                for record in records:
+                    record["source_url"] = page_url
+                    if record["id"] not in cls._captured_tweets:
+                        new_records.append(record)
+                    cls._captured_tweets[record["id"]] = record
+                    cls._captured_tweets.move_to_end(record["id"])
+        # Long runs see far more tweets than they look up; keep the recent ones
+        while len(cls._captured_tweets) > CAPTURED_TWEETS_MAX:
+            cls._captured_tweets.popitem(last=False)
+        return new_records
+
+    @classmethod
+    def captured_tweets(cls, source_url=None):
+        """All captured records (optionally only those captured on `source_url`), oldest first."""
+        return [r for r in cls._captured_tweets.values() if source_url is None or r["source_url"] == source_url]
+
+    @classmethod
+    def get_captured_tweet(cls, tweet_id):
+        """Record for `tweet_id` from captured timeline responses, or None."""
+        cls.capture_timeline()
+        return cls._captured_tweets.get(str(tweet_id))
+
+    @classmethod
+    def clear_captured_tweets(cls):
+        cls._captured_tweets = OrderedDict()
+        cls._pending_responses = {}
+    
+    # Values of selenium's By constants, spelled out so this module doesn't import selenium.webdriver
+    _SELECTOR_MAP = {
+        'id': 'id',
+        'name': 'name',
+        'class': 'class name',
+        'classname': 'class name',
+        'class_name': 'class name',
+        'tag': 'tag name',
+        'tagname': 'tag name',
+        'tag_name': 'tag name',
+        'css': 'css selector',
+        'css_selector': 'css selector',
+        'xpath': 'xpath',
+        'link': 'link text',
+        'linktext': 'link text',
+        'link_text': 'link text',
+        'partial_link': 'partial link text',
+        'partial_link_text': 'partial link text',
+        'partiallink': 'partial link text',
+        'partiallinktext': 'partial link text'
+    }
+
     @staticmethod
     def _get_by_locator(selector_type, selector_value):
         """Convert string selector type to Selenium By locator."""
-        selector_type = selector_type.lower().strip()
-        
-        selector_map = {
-            'id': By.ID,
-            'name': By.NAME,
-            'class': By.CLASS_NAME,
-            'classname': By.CLASS_NAME,
-            'class_name': By.CLASS_NAME,
-            'tag': By.TAG_NAME,
-            'tagname': By.TAG_NAME,
-            'tag_name': By.TAG_NAME,
-            'css': By.CSS_SELECTOR,
-            'css_selector': By.CSS_SELECTOR,
-            'xpath': By.XPATH,
-            'link': By.LINK_TEXT,
-            'linktext': By.LINK_TEXT,
-            'link_text': By.LINK_TEXT,
-            'partial_link': By.PARTIAL_LINK_TEXT,
-            'partial_link_text': By.PARTIAL_LINK_TEXT,
-            'partiallink': By.PARTIAL_LINK_TEXT,
-            'partiallinktext': By.PARTIAL_LINK_TEXT
-        }
+        by = SeleniumSingleton._SELECTOR_MAP.get(selector_type)
+        if by is None:
+            by = SeleniumSingleton._SELECTOR_MAP.get(selector_type.lower().strip())
         
-        if selector_type not in selector_map:
+        if by is None:
             raise ValueError(f"Unsupported selector type: '{selector_type}'. "
-                           f"Supported types: {list(selector_map.keys())}")
+                           f"Supported types: {list(SeleniumSingleton._SELECTOR_MAP.keys())}")
         
-        return selector_map[selector_type], selector_value
+        return by, selector_value
     
     @staticmethod
-    def find_element(selector_type, selector_value, timeout=None):
+    def find_element(selector_type, selector_value, timeout=None, probe=False):
         """Find a single element with optional explicit wait.
         
         Args:
             selector_type (str): Type of selector ('id', 'css', 'xpath', 'name', etc.)
             selector_value (str): The selector value
             timeout (int): Optional timeout in seconds
+            probe (bool): Return None as soon as the page has settled without
+                the element, instead of waiting out the full timeout
         """
+        if probe:
+            return SeleniumSingleton.probe_element(selector_type, selector_value, timeout=timeout)
+
         driver = SeleniumSingleton.get_driver()
         wait_time = timeout or SeleniumSingleton._timeout
         
         try:
             by, value = SeleniumSingleton._get_by_locator(selector_type, selector_value)
-            wait = WebDriverWait(driver, wait_time)
+            WebDriverWait, EC = _support()
+            wait = WebDriverWait(driver, wait_time, poll_frequency=SeleniumSingleton._poll_interval)
             element = wait.until(EC.presence_of_element_located((by, value)))
             return element
         except TimeoutException:
-            print(f"Element not found: {selector_type}='{selector_value}' within {wait_time} seconds")
+            log.info("Element not found: %s='%s' within %s seconds", selector_type, selector_value, wait_time)
             return None
         except ValueError as e:
-            print(f"Invalid selector: {e}")
+            log.error("Invalid selector: %s", e)
             return None
     
     @staticmethod
@@ -154,15 +590,14 @@ class SeleniumSingleton:
         
         try:
             by, value = SeleniumSingleton._get_by_locator(selector_type, selector_value)
-            wait = WebDriverWait(driver, wait_time)
-            wait.until(EC.presence_of_element_located((by, value)))
-            elements = driver.find_elements(by, value)
-            return elements
+            WebDriverWait, EC = _support()
+            wait = WebDriverWait(driver, wait_time, poll_frequency=SeleniumSingleton._poll_interval)
+            return wait.until(EC.presence_of_all_elements_located((by, value)))
         except TimeoutException:
-            print(f"Elements not found: {selector_type}='{selector_value}' within {wait_time} seconds")
+            log.info("Elements not found: %s='%s' within %s seconds", selector_type, selector_value, wait_time)
             return []
         except ValueError as e:
-            print(f"Invalid selector: {e}")
+            log.error("Invalid selector: %s", e)
             return []
     
     @staticmethod
@@ -179,16 +614,17 @@ class SeleniumSingleton:
         
         try:
             by, value = SeleniumSingleton._get_by_locator(selector_type, selector_value)
-            wait = WebDriverWait(driver, wait_time)
+            WebDriverWait, EC = _support()
+            wait = WebDriverWait(driver, wait_time, poll_frequency=SeleniumSingleton._poll_interval)
             element = wait.until(EC.element_to_be_clickable((by, value)))
             element.click()
-            print(f"Clicked element: {selector_type}='{selector_value}'")
+            log.debug("Clicked element: %s='%s'", selector_type, selector_value)
             return True
         except TimeoutException:
-            print(f"Element not clickable: {selector_type}='{selector_value}' within {wait_time} seconds")
+            log.info("Element not clickable: %s='%s' within %s seconds", selector_type, selector_value, wait_time)
             return False
         except ValueError as e:
-            print(f"Invalid selector: {e}")
+            log.error("Invalid selector: %s", e)
             return False
     
     @staticmethod
@@ -208,10 +644,10 @@ class SeleniumSingleton:
                 if clear_first:
                     element.clear()
                 element.send_keys(text)
-                print(f"Sent keys to element: {selector_type}='{selector_value}'")
+                log.debug("Sent keys to element: %s='%s'", selector_type, selector_value)
                 return True
             except Exception as e:
-                print(f"Error sending keys: {e}")
+                log.warning("Error sending keys: %s", e)
                 return False
         return False
     
@@ -258,40 +694,445 @@ class SeleniumSingleton:
         
         try:
             by, value = SeleniumSingleton._get_by_locator(selector_type, selector_value)
-            wait = WebDriverWait(driver, wait_time)
+            WebDriverWait, EC = _support()
+            wait = WebDriverWait(driver, wait_time, poll_frequency=SeleniumSingleton._poll_interval)
             element = wait.until(EC.visibility_of_element_located((by, value)))
             return element
         except TimeoutException:
-            print(f"Element not visible: {selector_type}='{selector_value}' within {wait_time} seconds")
+            log.info("Element not visible: %s='%s' within %s seconds", selector_type, selector_value, wait_time)
             return None
         except ValueError as e:
-            print(f"Invalid selector: {e}")
+            log.error("Invalid selector: %s", e)
             return None
     
     @staticmethod
-    def wait_for_element_clickable(selector_type, selector_value, timeout=None):
+    def wait_for_element_clickable(selector_type, selector_value, timeout=None, baseline=0, probe=False):
         """Wait for an element to be clickable.
         
         Args:
             selector_type (str): Type of selector ('id', 'css', 'xpath', 'name', etc.)
             selector_value (str): The selector value
             timeout (int): Optional timeout in seconds
+            baseline (float): Fixed sleep this wait replaces, for the wait report
+            probe (bool): Fail fast if the element is absent from a settled page
         """
         driver = SeleniumSingleton.get_driver()
         wait_time = timeout or SeleniumSingleton._timeout
+        started = time.monotonic()
         
         try:
+            if probe and SeleniumSingleton.probe_element(selector_type, selector_value, timeout=timeout) is None:
+                return None
             by, value = SeleniumSingleton._get_by_locator(selector_type, selector_value)
-            wait = WebDriverWait(driver, wait_time)
+            WebDriverWait, EC = _support()
+            wait = WebDriverWait(driver, wait_time, poll_frequency=SeleniumSingleton._poll_interval)
             element = wait.until(EC.element_to_be_clickable((by, value)))
             return element
         except TimeoutException:
-            print(f"Element not clickable: {selector_type}='{selector_value}' within {wait_time} seconds")
+            log.info("Element not clickable: %s='%s' within %s seconds", selector_type, selector_value, wait_time)
             return None
         except ValueError as e:
-            print(f"Invalid selector: {e}")
+            log.error("Invalid selector: %s", e)
             return None
-    
+        finally:
+            if baseline:
+                SeleniumSingleton._finish_wait("element_clickable", started, baseline)
+
+    # ------------------------------------------------------------------
+    # Readiness waits
+    #
+    # These replace fixed time.sleep() calls: each returns as soon as the
+    # page reaches the requested state. `baseline` is the fixed sleep the
+    # call site used to pay and is only used for the savings report.
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def set_min_dwell(cls, seconds):
+        """Set a minimum time every readiness wait should take (0 disables)."""
+        cls._min_dwell = max(0, seconds or 0)
+
+    @classmethod
+    def set_wait_timing(cls, poll_interval=None, settle_idle_time=None):
+        """Change how often waits poll and how long wait_for_requests_settled() wants quiet.
+
+        WebDriverWait treats a poll interval of 0 as its 0.5s default, so use
+        a small positive value for the fastest polling.
+        """
+        if poll_interval is not None:
+            cls._poll_interval = poll_interval
+        if settle_idle_time is not None:
+            cls._settle_idle_time = settle_idle_time
+
+    @classmethod
+    def _finish_wait(cls, label, started, baseline):
+        """Apply the minimum-dwell policy and record the wait for reporting."""
+        elapsed = time.monotonic() - started
+        if elapsed < cls._min_dwell:
+            with Tracer.span("SeleniumSingleton.min_dwell", "sleep", label=label):
+                time.sleep(cls._min_dwell - elapsed)
+            elapsed = cls._min_dwell
+        cls._wait_stats.append((label, baseline, elapsed))
+        return elapsed
+
+    @classmethod
+    def wait_until(cls, condition, timeout):
+        """Poll `condition(driver)` until truthy; return its value or None on timeout."""
+        driver = cls.get_driver()
+        wait_time = timeout or cls._timeout
+        try:
+            WebDriverWait, _ = _support()
+            return WebDriverWait(driver, wait_time, poll_frequency=cls._poll_interval).until(condition)
+        except TimeoutException:
+            return None
+
+    @classmethod
+    def wait_for_page_ready(cls, timeout=None, baseline=0):
+        """Wait until document.readyState is 'complete' ('interactive' for lean loading)."""
+        started = time.monotonic()
+        # With an eager/none load strategy the blocked or skipped subresources
+        # are irrelevant; an interactive DOM is all the bot needs
+        ready_states = ("complete",)
+        if cls._load_profile["page_load_strategy"] != "normal":
+            ready_states = ("interactive", "complete")
+        ready = cls.wait_until(
+            lambda d: d.execute_script("return document.readyState") in ready_states,
+            timeout,
+        )
+        cls._finish_wait("page_ready", started, baseline)
+        if not ready:
+            log.info("Page not ready within %s seconds", timeout or cls._timeout)
+        return bool(ready)
+
+    @classmethod
+    def wait_for_element_stable(cls, selector_type, selector_value, timeout=None, baseline=0):
+        """Wait until an element is present and its bounding box stops moving.
+
+        Useful after scrolling or while a component is still animating in.
+        """
+        started = time.monotonic()
+        try:
+            by, value = cls._get_by_locator(selector_type, selector_value)
+        except ValueError as e:
+            log.error("Invalid selector: %s", e)
+            return None
+
+        last_rect = {}
+
+        def stable(driver):
+            elements = driver.find_elements(by, value)
+            if not elements:
+                return False
+            rect = driver.execute_script(
+                "const r = arguments[0].getBoundingClientRect();"
+                "return [r.x, r.y, r.width, r.height];",
+                elements[0],
+            )
+            previous = last_rect.get("rect")
+            last_rect["rect"] = rect
+            return elements[0] if rect == previous else False
+
+        element = cls.wait_until(stable, timeout)
+        cls._finish_wait("element_stable", started, baseline)
+        if element is None:
+            log.info("Element not stable: %s='%s' within %s seconds", selector_type, selector_value, timeout or cls._timeout)
+        return element
+
+    @classmethod
+    def wait_for_url_change(cls, old_url, timeout=None, baseline=0):
+        """Wait until the current URL differs from `old_url`."""
+        started = time.monotonic()
+        changed = cls.wait_until(lambda d: d.current_url != old_url, timeout)
+        cls._finish_wait("url_changed", started, baseline)
+        if not changed:
+            log.info("URL did not change from %s within %s seconds", old_url, timeout or cls._timeout)
+        return bool(changed)
+
+    @classmethod
+    def wait_for_url_contains(cls, fragment, timeout=None, baseline=0):
+        """Wait until the current URL contains `fragment`."""
+        started = time.monotonic()
+        matched = cls.wait_until(lambda d: fragment in d.current_url, timeout)
+        cls._finish_wait("url_contains", started, baseline)
+        return bool(matched)
+
+    # Counts fetch/XHR requests in flight on the page. Resource Timing alone
+    # can't tell: an entry appears only once its request has finished, and the
+    # buffer stops recording at 250 entries unless it is enlarged or cleared.
+    _REQUEST_COUNTER_JS = """
+        if (!window.__botRequests) {
+            const state = window.__botRequests = {inFlight: 0, started: 0};
+            const begin = () => { state.inFlight++; state.started++; };
+            const end = () => { state.inFlight = Math.max(0, state.inFlight - 1); };
+            const fetch = window.fetch;
+            if (fetch) {
+                window.fetch = function () {
+                    begin();
+                    try {
+                        return fetch.apply(this, arguments).finally(end);
+                    } catch (e) {
+                        end();
+                        throw e;
+                    }
+                };
+            }
+            const send = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function () {
+                begin();
+                this.addEventListener('loadend', end);
+                try {
+                    return send.apply(this, arguments);
+                } catch (e) {
+                    end();
+                    throw e;
+                }
+            };
+            performance.setResourceTimingBufferSize(5000);
+            performance.addEventListener('resourcetimingbufferfull', () => performance.clearResourceTimings());
+        }
+    """
+    _PENDING_REQUESTS_JS = _REQUEST_COUNTER_JS + """
+        const state = window.__botRequests;
+        return [state.inFlight, state.started, performance.getEntriesByType('resource').length];
+    """
+
+    @classmethod
+    def wait_for_requests_settled(cls, idle_time=None, timeout=None, baseline=0):
+        """Wait until no request is in flight and none has started or finished for `idle_time` seconds.
+
+        fetch/XHR requests are counted by a script in the page, installed
+        on every new document where CDP is available and by the first poll
+        otherwise; other resources (images, scripts) are seen once they
+        finish, through Resource Timing. Works on any browser.
+        """
+        idle_time = cls._settle_idle_time if idle_time is None else idle_time
+        started = time.monotonic()
+        state = {"activity": None, "since": started}
+
+        def settled(driver):
+            in_flight, *activity = driver.execute_script(cls._PENDING_REQUESTS_JS)
+            now = time.monotonic()
+            if in_flight or activity != state["activity"]:
+                state["activity"] = activity
+                state["since"] = now
+                return False
+            return now - state["since"] >= idle_time
+
+        done = cls.wait_until(settled, timeout)
+        cls._finish_wait("requests_settled", started, baseline)
+        return bool(done)
+
+    @classmethod
+    def wait_report(cls, reset=False):
+        """Print how much time readiness waits saved versus the fixed-sleep baseline."""
+        if not cls._wait_stats:
+            print("No readiness waits recorded.")
+            return 0
+
+        totals = {}
+        for label, baseline, actual in cls._wait_stats:
+            count, base_sum, actual_sum = totals.get(label, (0, 0, 0))
+            totals[label] = (count + 1, base_sum + baseline, actual_sum + actual)
+
+        print("Readiness wait report:")
+        saved_total = 0
+        for label, (count, base_sum, actual_sum) in sorted(totals.items()):
+            saved = base_sum - actual_sum
+            saved_total += saved
+            print(f"  {label:<18} n={count:<4} baseline={base_sum:7.2f}s "
+                  f"actual={actual_sum:7.2f}s saved={saved:7.2f}s")
+        print(f"  total saved: {saved_total:.2f}s")
+
+        if reset:
+            cls._wait_stats = []
+        return saved_total
+
+    # ------------------------------------------------------------------
+    # Probes (fast negative lookups)
+    # ------------------------------------------------------------------
+
+    _PROBE_JS = """
+        const type = arguments[0], sel = arguments[1], quietMs = arguments[2], maxMs = arguments[3];
+        const done = arguments[arguments.length - 1];
+        const find = () => type === 'xpath'
+            ? document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(sel);
+
+        const found = find();
+        if (found) return done(found);
+
+        let quietTimer = null, maxTimer = null, observer = null;
+        const finish = (value) => {
+            if (observer) observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(maxTimer);
+            done(value);
+        };
+        // The page counts as settled once it has loaded and the DOM has been
+        // quiet for quietMs; any mutation restarts the quiet period.
+        const armQuiet = () => {
+            clearTimeout(quietTimer);
+            if (document.readyState === 'complete') quietTimer = setTimeout(() => finish(null), quietMs);
+        };
+        observer = new MutationObserver(() => {
+            const el = find();
+            if (el) finish(el); else armQuiet();
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        window.addEventListener('load', armQuiet, {once: true});
+        maxTimer = setTimeout(() => finish(find()), maxMs);
+        armQuiet();
+    """
+
+    _PROBE_TYPES = {
+        'css': lambda v: ('css', v),
+        'css_selector': lambda v: ('css', v),
+        'xpath': lambda v: ('xpath', v),
+        'id': lambda v: ('css', f'[id="{v}"]'),
+        'name': lambda v: ('css', f'[name="{v}"]'),
+        'tag': lambda v: ('css', v),
+        'tag_name': lambda v: ('css', v),
+        'tagname': lambda v: ('css', v),
+    }
+
+    @staticmethod
+    def probe_element(selector_type, selector_value, timeout=None, quiet_time=0.3):
+        """Answer "is this element there?" without burning the full timeout.
+
+        Resolves immediately if the element exists, as soon as it is inserted,
+        or with None once the page has loaded and the DOM has been free of
+        mutations for `quiet_time` seconds. `timeout` caps the whole probe.
+        """
+        # Capped so the in-page timer always fires before the script timeout
+        wait_time = min(timeout or SeleniumSingleton._timeout, SeleniumSingleton._timeout)
+        convert = SeleniumSingleton._PROBE_TYPES.get(selector_type.lower().strip())
+        if convert is None:
+            # Link-text style selectors have no DOM equivalent; use a normal wait
+            return SeleniumSingleton.find_element(selector_type, selector_value, timeout=timeout)
+
+        probe_type, probe_value = convert(selector_value)
+        driver = SeleniumSingleton.get_driver()
+        try:
+            return driver.execute_async_script(
+                SeleniumSingleton._PROBE_JS,
+                probe_type,
+                probe_value,
+                int(quiet_time * 1000),
+                int(wait_time * 1000),
+            )
+        except TimeoutException:
+            log.info("Probe timed out: %s='%s' after %s seconds", selector_type, selector_value, wait_time)
+            return None
+        except Exception as e:
+            log.warning("Error probing %s='%s': %s", selector_type, selector_value, e)
+            return None
+
+    @staticmethod
+    def is_absent(selector_type, selector_value, timeout=None, quiet_time=0.3):
+        """True if the element is not on the page once it has settled."""
+        return SeleniumSingleton.probe_element(selector_type, selector_value, timeout, quiet_time) is None
+
+    # ------------------------------------------------------------------
+    # Batch queries
+    # ------------------------------------------------------------------
+
+    _BATCH_QUERY_JS = """
+        const locators = arguments[0], attrs = arguments[1], limit = arguments[2];
+        const out = {};
+        for (const [name, loc] of Object.entries(locators)) {
+            let nodes = [];
+            try {
+                if (loc[0] === 'xpath') {
+                    const snap = document.evaluate(loc[1], document, null,
+                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    for (let i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+                } else {
+                    nodes = Array.from(document.querySelectorAll(loc[1]));
+                }
+            } catch (e) {
+                out[name] = {count: 0, matches: [], error: String(e)};
+                continue;
+            }
+            out[name] = {
+                count: nodes.length,
+                matches: nodes.slice(0, limit).map(el => {
+                    const a = {};
+                    for (const attr of attrs) a[attr] = el.getAttribute(attr);
+                    return {element: el, text: el.innerText, attributes: a};
+                }),
+            };
+        }
+        return out;
+    """
+
+    @staticmethod
+    def _batch_selector_type(name, locator):
+        """Normalize a batch locator to ('css' | 'xpath', value).
+
+        Accepts a (type, value) tuple or a bare string; bare strings take their
+        type from the key suffix used in Data/xpaths.json (`*_css`, `*_xpath`).
+        """
+        if isinstance(locator, (tuple, list)):
+            selector_type, value = locator
+        else:
+            selector_type = "xpath" if name.endswith("_xpath") else "css"
+            value = locator
+        selector_type = selector_type.lower().strip()
+        if selector_type in ("css", "css_selector"):
+            return "css", value
+        if selector_type == "xpath":
+            return "xpath", value
+        raise ValueError(f"Batch queries support css and xpath only, got '{selector_type}' for '{name}'")
+
+    @staticmethod
+    def query_batch(locators, attributes=(), limit=1, wait_for=(), timeout=None):
+        """Resolve many locators with a single injected script (one WebDriver round trip).
+
+        Args:
+            locators (dict): name -> (type, value) or bare selector string
+            attributes (iterable): attribute names to read from each match
+            limit (int): max matches returned per locator (count is always total)
+            wait_for (iterable): names that must match before returning; the
+                query is re-run (one round trip per poll) until they do
+            timeout (int): Optional timeout in seconds for `wait_for`
+
+        Returns:
+            dict: name -> {"count", "matches": [{"element", "text", "attributes"}]}
+            or None if `wait_for` names did not appear in time.
+        """
+        try:
+            normalized = {
+                name: SeleniumSingleton._batch_selector_type(name, loc)
+                for name, loc in locators.items()
+            }
+        except ValueError as e:
+            log.error("Invalid selector: %s", e)
+            return None
+
+        attributes = list(attributes)
+        required = list(wait_for)
+
+        def run(driver):
+            result = driver.execute_script(SeleniumSingleton._BATCH_QUERY_JS, normalized, attributes, limit)
+            if all(result.get(name, {}).get("count") for name in required):
+                return result
+            return False
+
+        if not required:
+            return run(SeleniumSingleton.get_driver())
+
+        result = SeleniumSingleton.wait_until(run, timeout)
+        if result is None:
+            log.info("Batch query: %s not all found within %s seconds", required, timeout or SeleniumSingleton._timeout)
+        return result
+
+    @staticmethod
+    def first_match(batch_result, name):
+        """Return the first match dict for `name` from a query_batch result, or None."""
+        if not batch_result:
+            return None
+        matches = batch_result.get(name, {}).get("matches") or []
+        return matches[0] if matches else None
+
     @staticmethod
     def execute_script(script, *args):
         """Execute JavaScript in the browser."""
@@ -299,36 +1140,110 @@ class SeleniumSingleton:
         try:
             return driver.execute_script(script, *args)
         except Exception as e:
-            print(f"Error executing script: {e}")
+            log.warning("Error executing script: %s", e)
             return None
     
+    # Trimmed copy of the page for failure reports: no scripts, styles, SVG or inline styles
+    _DOM_SNAPSHOT_JS = """
+        const maxChars = arguments[0];
+        const root = document.documentElement.cloneNode(true);
+        root.querySelectorAll('script, style, noscript, svg, link, meta, iframe, template')
+            .forEach(n => n.remove());
+        root.querySelectorAll('[style]').forEach(n => n.removeAttribute('style'));
+        const html = root.outerHTML;
+        return {html: html.slice(0, maxChars), truncated: html.length > maxChars,
+                url: location.href, title: document.title,
+                width: window.innerWidth, height: window.innerHeight};
+    """
+
+    @classmethod
+    def capture_screenshot(cls, image_format=ARTIFACT_FORMAT, quality=ARTIFACT_QUALITY, scale=ARTIFACT_SCALE,
+                           viewport=None):
+        """Screenshot of the viewport as (image bytes, format), or None.
+
+        Chrome encodes it via CDP Page.captureScreenshot as JPEG/WebP at
+        `quality`, downscaled by `scale` (needs `viewport`, a (width, height)
+        pair); far smaller and faster than save_screenshot's full-size PNG.
+        Browsers without CDP return a PNG whatever `image_format` asks for.
+        """
+        driver = cls.get_driver()
+        try:
+            if cls.supports_cdp():
+                params = {"format": image_format, "quality": quality, "captureBeyondViewport": False}
+                if viewport and scale != 1:
+                    params["clip"] = {"x": 0, "y": 0, "width": viewport[0], "height": viewport[1], "scale": scale}
+                data = cls.execute_cdp("Page.captureScreenshot", params).get("data")
+            else:
+                data, image_format = driver.get_screenshot_as_base64(), "png"
+            return (base64.b64decode(data), image_format) if data else None
+        except Exception as e:
+            log.warning("Error taking screenshot: %s", e)
+            return None
+
     @staticmethod
-    def take_screenshot(filename=None):
-        """Take a screenshot and save it."""
-        driver = SeleniumSingleton.get_driver()
+    def image_extension(image_format):
+        """File extension for a capture_screenshot() format."""
+        return "jpg" if image_format == "jpeg" else image_format
+
+    @classmethod
+    def dom_snapshot(cls, max_chars=ARTIFACT_DOM_MAX_CHARS):
+        """Trimmed outerHTML (cut at `max_chars`) plus url, title and viewport size, or None."""
+        try:
+            return cls.get_driver().execute_script(cls._DOM_SNAPSHOT_JS, max_chars)
+        except Exception as e:
+            log.warning("Error taking DOM snapshot: %s", e)
+            return None
+
+    @staticmethod
+    def take_screenshot(filename=None, image_format=ARTIFACT_FORMAT, quality=ARTIFACT_QUALITY):
+        """Take a compressed screenshot and save it; see capture_screenshot()."""
+        screenshot = SeleniumSingleton.capture_screenshot(image_format, quality, scale=1)
+        if screenshot is None:
+            return None
+        image, actual_format = screenshot
         if filename is None:
-            filename = f"screenshot_{int(time.time())}.png"
-        
+            filename = f"screenshot_{int(time.time())}.{SeleniumSingleton.image_extension(actual_format)}"
         try:
-            driver.save_screenshot(filename)
-            print(f"Screenshot saved: {filename}")
+            with open(filename, "wb") as f:
+                f.write(image)
+            log.info("Screenshot saved: %s", filename)
             return filename
-        except Exception as e:
-            print(f"Error taking screenshot: {e}")
+        except OSError as e:
+            log.warning("Error taking screenshot: %s", e)
             return None
-    
+
     @staticmethod
     def switch_to_window(window_handle):
         """Switch to a specific browser window."""
         driver = SeleniumSingleton.get_driver()
         try:
             driver.switch_to.window(window_handle)
-            print(f"Switched to window: {window_handle}")
+            log.debug("Switched to window: %s", window_handle)
             return True
         except Exception as e:
-            print(f"Error switching to window: {e}")
+            log.warning("Error switching to window: %s", e)
             return False
     
+    @staticmethod
+    def get_current_window_handle():
+        """Get the handle of the current browser window/tab."""
+        driver = SeleniumSingleton.get_driver()
+        return driver.current_window_handle
+
+    @staticmethod
+    def open_tab():
+        """Open a blank tab, switch to it and return its handle.
+
+        The tab left behind keeps its page (and scroll position), so work
+        can be done here without reloading it.
+        """
+        driver = SeleniumSingleton.get_driver()
+        driver.switch_to.new_window('tab')
+        SeleniumSingleton._apply_request_blocking()  # CDP settings are per tab
+        SeleniumSingleton._install_request_counter()
+        log.debug("Opened tab: %s", driver.current_window_handle)
+        return driver.current_window_handle
+
     @staticmethod
     def get_current_url():
         """Get the current page URL."""
@@ -352,28 +1267,28 @@ class SeleniumSingleton:
         """Refresh the current page."""
         driver = SeleniumSingleton.get_driver()
         driver.refresh()
-        print("Page refreshed")
+        log.debug("Page refreshed")
     
     @staticmethod
     def go_back():
         """Navigate back in browser history."""
         driver = SeleniumSingleton.get_driver()
         driver.back()
-        print("Navigated back")
+        log.debug("Navigated back")
     
     @staticmethod
     def go_forward():
         """Navigate forward in browser history."""
         driver = SeleniumSingleton.get_driver()
         driver.forward()
-        print("Navigated forward")
+        log.debug("Navigated forward")
     
     @staticmethod
     def close_current_tab():
         """Close the current browser tab."""
         driver = SeleniumSingleton.get_driver()
         driver.close()
-        print("Current tab closed")
+        log.debug("Current tab closed")
     
     @staticmethod
     def switch_to_frame(frame_reference):
@@ -381,10 +1296,10 @@ class SeleniumSingleton:
         driver = SeleniumSingleton.get_driver()
         try:
             driver.switch_to.frame(frame_reference)
-            print(f"Switched to frame: {frame_reference}")
+            log.debug("Switched to frame: %s", frame_reference)
             return True
         except Exception as e:
-            print(f"Error switching to frame: {e}")
+            log.warning("Error switching to frame: %s", e)
             return False
     
     @staticmethod
@@ -392,7 +1307,7 @@ class SeleniumSingleton:
         """Switch back to the main document."""
         driver = SeleniumSingleton.get_driver()
         driver.switch_to.default_content()
-        print("Switched to default content")
+        log.debug("Switched to default content")
     
     @staticmethod
     def accept_alert():
@@ -401,10 +1316,10 @@ class SeleniumSingleton:
         try:
             alert = driver.switch_to.alert
             alert.accept()
-            print("Alert accepted")
+            log.debug("Alert accepted")
             return True
         except Exception as e:
-            print(f"Error accepting alert: {e}")
+            log.warning("Error accepting alert: %s", e)
             return False
     
     @staticmethod
@@ -414,10 +1329,10 @@ class SeleniumSingleton:
         try:
             alert = driver.switch_to.alert
             alert.dismiss()
-            print("Alert dismissed")
+            log.debug("Alert dismissed")
             return True
         except Exception as e:
-            print(f"Error dismissing alert: {e}")
+            log.warning("Error dismissing alert: %s", e)
             return False
     
     @staticmethod
@@ -428,18 +1343,32 @@ class SeleniumSingleton:
             alert = driver.switch_to.alert
             return alert.text
         except Exception as e:
-            print(f"Error getting alert text: {e}")
+            log.warning("Error getting alert text: %s", e)
             return None
     
     @classmethod
     def quit_driver(cls):
         """Quit the WebDriver and clean up resources."""
         if cls._driver:
+            mode = cls._startup_mode if cls._browser.lower() == 'chrome' else 'cold'
             try:
-                cls._driver.quit()
-                print("WebDriver quit successfully")
+                if mode == 'profile' and not CHROMEDRIVER_URL:
+                    # Ending our chromedriver ends the session; 'detach' keeps the
+                    # browser running so the next run can attach to it
+                    cls.stop_service()
+                    log.info("Detached from browser session")
+                elif mode == 'attach':
+                    # chromedriver never closes a browser it attached to, so this
+                    # only ends the session
+                    cls._driver.quit()
+                    log.info("Detached from browser session")
+                else:
+                    # Includes 'profile' on a shared CHROMEDRIVER_URL, where the
+                    # session can only be ended by closing its browser
+                    cls._driver.quit()
+                    log.info("WebDriver quit successfully")
             except Exception as e:
-                print(f"Error quitting WebDriver: {e}")
+                log.warning("Error quitting WebDriver: %s", e)
             finally:
                 cls._driver = None
 
@@ -447,18 +1376,120 @@ class SeleniumSingleton:
     def save_cookies(driver, path):
         with open(path, "w") as f:
             json.dump(driver.get_cookies(), f)
-            print(f'Cookies saved at path:{path}')
+            log.info("Cookies saved at path: %s", path)
 
     @staticmethod
     def load_cookies(driver, path):
         with open(path, "r") as f:
             cookies = json.load(f)
+        SeleniumSingleton._add_cookies(driver, cookies)
+
+    @staticmethod
+    def _add_cookies(driver, cookies):
+        """add_cookie each one; the page of their domain must already be loaded."""
         for cookie in cookies:
+            cookie = dict(cookie)
             # Selenium requires expiry as int, ensure it's int if present
             if isinstance(cookie.get("expiry", None), float):
                 cookie["expiry"] = int(cookie["expiry"])
             driver.add_cookie(cookie)
 
+    @classmethod
+    def inject_cookies(cls, cookies, url=None):
+        """Add get_cookies()-format cookies to the browser; True on success.
+
+        With CDP this is one Network.setCookies call that works before any
+        navigation. Otherwise (Firefox) it falls back to add_cookie, which
+        only accepts cookies for the loaded page's domain, so `url` is
+        loaded first unless it's already open.
+        """
+        try:
+            if cls.supports_cdp():
+                cls.execute_cdp("Network.setCookies", {"cookies": [cls._to_cdp_cookie(c) for c in cookies]})
+            else:
+                if url and cls.get_current_url() != url:
+                    cls.navigate_to(url)
+                cls._add_cookies(cls.get_driver(), cookies)
+            return True
+        except Exception as e:
+            log.warning("Error injecting cookies: %s", e)
+            return False
+
+    @staticmethod
+    def _to_cdp_cookie(cookie):
+        """Convert a Selenium get_cookies() entry to a CDP Network.CookieParam."""
+        param = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain"),
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+            param["sameSite"] = cookie["sameSite"]
+        if cookie.get("expiry") is not None:
+            param["expires"] = int(cookie["expiry"])
+        return param
+
+    @staticmethod
+    def _from_cdp_cookie(cookie):
+        """Convert a CDP Network.Cookie to the get_cookies() format."""
+        converted = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain"),
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("sameSite"):
+            converted["sameSite"] = cookie["sameSite"]
+        if not cookie.get("session") and cookie.get("expires", -1) > 0:
+            converted["expiry"] = int(cookie["expires"])
+        return converted
+
+    @staticmethod
+    def load_cookies_bulk(path, url=None):
+        """Inject all saved cookies, in one CDP call before any navigation where possible.
+
+        Unlike load_cookies() this doesn't need the cookie domain to be loaded
+        first, except on browsers without CDP, where `url` (a page on the
+        cookies' domain) is loaded first; see inject_cookies(). Returns the
+        list of cookies read, or None if injection failed.
+        """
+        with open(path, "r") as f:
+            cookies = json.load(f)
+        return cookies if SeleniumSingleton.inject_cookies(cookies, url) else None
+
+Tracer.instrument(SeleniumSingleton, {
+    'initialize_driver': 'startup',
+    'navigate_to': 'navigation',
+    'refresh_page': 'navigation',
+    'go_back': 'navigation',
+    'go_forward': 'navigation',
+    'find_element': 'element_wait',
+    'find_elements': 'element_wait',
+    'click_element': 'element_wait',
+    'send_keys': 'input',
+    'get_text': 'element_wait',
+    'get_attribute': 'element_wait',
+    'wait_for_element_visible': 'element_wait',
+    'wait_for_element_clickable': 'element_wait',
+    'probe_element': 'element_wait',
+    'wait_for_page_ready': 'readiness_wait',
+    'wait_for_element_stable': 'readiness_wait',
+    'wait_for_url_change': 'readiness_wait',
+    'wait_for_url_contains': 'readiness_wait',
+    'wait_for_requests_settled': 'readiness_wait',
+    'query_batch': 'js',
+    'capture_timeline': 'extraction',
+    'execute_script': 'js',
+    'execute_cdp': 'js',
+    'take_screenshot': 'artifacts',
+    'load_cookies_bulk': 'cookies',
+})
+
 # Usage Example
 # if __name__ == "__main__":
 #     try:
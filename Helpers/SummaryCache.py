@@ -0,0 +1,161 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from Config.settings import (
+    SUMMARY_CACHE_FILE,
+    SUMMARY_CACHE_MEMORY_SIZE,
+    SUMMARY_CACHE_MAX_ENTRIES,
+    SUMMARY_CACHE_TTL,
+)
+
+
+class SummaryCache:
+    """
+    Content-addressed cache for LLM summaries.
+
+    An in-memory LRU sits in front of a SQLite table so repeat runs over the
+    same tweets skip the API entirely. Entries expire after SUMMARY_CACHE_TTL
+    seconds and the table is trimmed to SUMMARY_CACHE_MAX_ENTRIES rows.
+    """
+
+    _memory = OrderedDict()  # key -> (summary, created_at)
+    _conn = None
+    _lock = threading.Lock()
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def _normalize(text):
+        return re.sub(r"\s+", " ", text or "").strip().lower()
+
+    @classmethod
+    def make_key(cls, text, model, prompt_version):
+        raw = f"{prompt_version}\x00{model}\x00{cls._normalize(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _get_conn(cls):
+        if cls._conn is None:
+            SUMMARY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            cls._conn = sqlite3.connect(SUMMARY_CACHE_FILE, check_same_thread=False)
+            cls._conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                " key TEXT PRIMARY KEY,"
+                " summary TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            cls._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON summaries(last_used)")
+            cls._conn.commit()
+        return cls._conn
+
+    @classmethod
+    def _remember(cls, key, summary, created_at):
+        cls._memory[key] = (summary, created_at)
+        cls._memory.move_to_end(key)
+        while len(cls._memory) > SUMMARY_CACHE_MEMORY_SIZE:
+            cls._memory.popitem(last=False)
+
+    @classmethod
+    def get(cls, key):
+        """Return the cached summary for `key`, or None on a miss/expired entry."""
+        summary = cls._lookup(key)
+        with cls._lock:
+            if summary is None:
+                cls.misses += 1
+            else:
+                cls.hits += 1
+        return summary
+
+    @classmethod
+    def _lookup(cls, key):
+        now = time.time()
+        with cls._lock:
+            entry = cls._memory.get(key)
+            if entry is not None and now - entry[1] < SUMMARY_CACHE_TTL:
+                cls._memory.move_to_end(key)
+                return entry[0]
+
+            conn = cls._get_conn()
+            row = conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] >= SUMMARY_CACHE_TTL:
+                if row is not None:
+                    conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                    conn.commit()
+                cls._memory.pop(key, None)
+                return None
+
+            conn.execute("UPDATE summaries SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+            cls._remember(key, row[0], row[1])
+            return row[0]
+
+    @classmethod
+    def put(cls, key, summary):
+        now = time.time()
+        with cls._lock:
+            conn = cls._get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, summary, now, now),
+            )
+            cls._evict(conn, now)
+            conn.commit()
+            cls._remember(key, summary, now)
+
+    @staticmethod
+    def _evict(conn, now):
+        conn.execute("DELETE FROM summaries WHERE created_at <= ?", (now - SUMMARY_CACHE_TTL,))
+        conn.execute(
+            "DELETE FROM summaries WHERE key IN ("
+            " SELECT key FROM summaries ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (SUMMARY_CACHE_MAX_ENTRIES,),
+        )
+
+    @classmethod
+    def get_or_compute(cls, text, model, prompt_version, compute):
+        """Return a cached summary or call `compute(text)` and cache its result.
+
+        `model` is a model name or a list of acceptable ones, looked up in
+        order. `compute` may return None to signal a failure that must not be
+        cached, or (summary, model) when the model that answered can differ
+        from the first one (hedged backups); the summary is cached under that.
+        """
+        models = [model] if isinstance(model, str) else list(model)
+        for candidate in models:
+            summary = cls._lookup(cls.make_key(text, candidate, prompt_version))
+            if summary is not None:
+                with cls._lock:
+                    cls.hits += 1
+                return summary
+        with cls._lock:
+            cls.misses += 1
+
+        result = compute(text)
+        summary, answered_by = result if isinstance(result, tuple) else (result, models[0])
+        if summary:
+            cls.put(cls.make_key(text, answered_by or models[0], prompt_version), summary)
+        return summary
+
+    @classmethod
+    def stats(cls):
+        total = cls.hits + cls.misses
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": cls.hits / total if total else 0.0,
+            "memory_entries": len(cls._memory),
+        }
+
+    @classmethod
+    def close(cls):
+        with cls._lock:
+            if cls._conn is not None:
+                cls._conn.close()
+                cls._conn = None
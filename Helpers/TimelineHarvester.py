@@ -0,0 +1,104 @@
+import time
+from urllib.parse import urljoin
+from Config.settings import (
+    HARVEST_MAX_TWEETS,
+    HARVEST_MAX_SECONDS,
+    HARVEST_MAX_STALE_SCROLLS,
+    HARVEST_SCROLL_IDLE,
+)
+from Helpers.XpathManager import XpathManager
+from Helpers.ProcessedIndex import tweet_id_from_url
+from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+
+# Reads every rendered article, then scrolls by most of a viewport, in one round trip.
+# Returns [href, text] per article; no element references, since the timeline
+# is virtualized and recycles nodes as it scrolls.
+_HARVEST_JS = """
+    const articleCss = arguments[0], linkCss = arguments[1], textCss = arguments[2];
+    const out = [];
+    for (const article of document.querySelectorAll(articleCss)) {
+        const link = article.querySelector(linkCss);
+        const text = article.querySelector(textCss);
+        out.push([link ? link.getAttribute('href') : null, text ? text.innerText : '']);
+    }
+    window.scrollBy(0, Math.round(window.innerHeight * 0.9));
+    return out;
+"""
+
+_SCROLL_JS = "window.scrollBy(0, Math.round(window.innerHeight * 0.9));"
+
+
+def _author_from_url(url):
+    parts = url.split("?", 1)[0].rstrip("/").split("/")
+    return parts[-3] if len(parts) >= 3 and parts[-2] in ("status", "statuses") else None
+
+
+def _rendered_tweets(page_url):
+    rows = SS.execute_script(
+        _HARVEST_JS,
+        XpathManager.get_xpath('tweet_page', 'article_css'),
+        XpathManager.get_xpath('tweet_page', 'article_link_css'),
+        XpathManager.get_xpath('detailed_tweet_page', 'tweet_content_css'),
+    ) or []
+    for href, text in rows:
+        tweet_id = tweet_id_from_url(href)
+        if tweet_id:
+            url = urljoin(page_url, href)
+            yield {"id": tweet_id, "text": (text or "").strip(), "author": _author_from_url(url), "url": url}
+
+
+def _captured_tweets(page_url):
+    SS.capture_timeline()
+    # Includes responses captured on this page before harvesting started
+    records = SS.captured_tweets(source_url=page_url)
+    SS.execute_script(_SCROLL_JS)
+    for record in records:
+        url = urljoin(page_url, f"/{record['author']}/status/{record['id']}") if record["author"] else None
+        yield dict(record, url=url)
+
+
+def harvest_tweets(max_tweets=HARVEST_MAX_TWEETS, max_seconds=HARVEST_MAX_SECONDS,
+                   max_stale_scrolls=HARVEST_MAX_STALE_SCROLLS, scroll_idle=HARVEST_SCROLL_IDLE, skip=None):
+    """Yield tweets from the open search/timeline page as they render, scrolling for more.
+
+    Each round reads what's rendered (or, in network extraction mode, what
+    the timeline responses contained), scrolls, and waits for the requests
+    it triggered to settle. Tweets are deduplicated by ID, since the
+    virtualized list re-renders the same tweets as it scrolls.
+
+    Args:
+        max_tweets (int): stop after yielding this many
+        max_seconds (float): stop after this long
+        max_stale_scrolls (int): stop after this many scrolls in a row with nothing new
+        scroll_idle (float): network idle time that ends the wait after a scroll
+        skip (callable): tweet_id -> bool; matching tweets are not yielded
+            (but still count as seen), e.g. ProcessedIndex.contains
+
+    Yields:
+        dict: id, text, author, url (absolute status URL); network mode adds counts
+    """
+    page_url = SS.get_current_url()
+    read = _captured_tweets if SS.extraction_mode() == 'network' else _rendered_tweets
+    deadline = time.monotonic() + max_seconds
+    seen = set()
+    yielded = 0
+    stale = 0
+
+    while True:
+        new = 0
+        for record in read(page_url):
+            if record["id"] in seen:
+                continue
+            seen.add(record["id"])
+            new += 1
+            if skip is not None and skip(record["id"]):
+                continue
+            yield record
+            yielded += 1
+            if yielded >= max_tweets:
+                return
+
+        stale = 0 if new else stale + 1
+        if stale >= max_stale_scrolls or time.monotonic() >= deadline:
+            return
+        SS.wait_for_requests_settled(idle_time=scroll_idle, timeout=max(0.1, deadline - time.monotonic()))
@@ -0,0 +1,78 @@
+"""
+Structured tweets from X's GraphQL timeline responses.
+
+SearchTimeline, HomeTimeline, TweetDetail, UserTweets etc. all nest tweet
+results somewhere under `instructions[].entries[]`, in shapes that vary by
+endpoint and wrapper type (TweetWithVisibilityResults, modules,
+conversation threads). Rather than following each layout, the payload is
+walked and every object that looks like a tweet result is decoded.
+"""
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _author(result):
+    user = (result.get("core") or {}).get("user_results", {}).get("result") or {}
+    if user.get("__typename") == "UserUnavailable":
+        return None, None
+    # Newer payloads moved screen_name/name from `legacy` to `core`
+    core = user.get("core") or {}
+    legacy = user.get("legacy") or {}
+    return (core.get("screen_name") or legacy.get("screen_name"),
+            core.get("name") or legacy.get("name"))
+
+
+def tweet_record(result):
+    """Decode one tweet result object, or None if it isn't a usable tweet."""
+    if result.get("__typename") == "TweetWithVisibilityResults":
+        result = result.get("tweet") or {}
+
+    legacy = result.get("legacy")
+    tweet_id = result.get("rest_id") or (legacy or {}).get("id_str")
+    if not isinstance(legacy, dict) or not tweet_id:
+        return None
+
+    # Long posts carry the full text in note_tweet; legacy.full_text is truncated
+    note = (result.get("note_tweet") or {}).get("note_tweet_results", {}).get("result") or {}
+    text = note.get("text") or legacy.get("full_text") or ""
+    screen_name, name = _author(result)
+
+    return {
+        "id": str(tweet_id),
+        "text": text,
+        "author": screen_name,
+        "author_name": name,
+        "created_at": legacy.get("created_at"),
+        "lang": legacy.get("lang"),
+        "reply_count": _int(legacy.get("reply_count")),
+        "retweet_count": _int(legacy.get("retweet_count")),
+        "like_count": _int(legacy.get("favorite_count")),
+        "quote_count": _int(legacy.get("quote_count")),
+        "view_count": _int((result.get("views") or {}).get("count")),
+        "in_reply_to": legacy.get("in_reply_to_status_id_str"),
+    }
+
+
+def parse_timeline(payload):
+    """All tweets in a timeline response, in document order, without duplicates."""
+    records = []
+    seen = set()
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            # Users also have rest_id + legacy; only tweets have legacy.full_text
+            if node.get("__typename", "Tweet") == "Tweet" and "full_text" in (node.get("legacy") or {}):
+                record = tweet_record(node)
+                if record and record["id"] not in seen:
+                    seen.add(record["id"])
+                    records.append(record)
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return records
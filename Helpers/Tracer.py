@@ -0,0 +1,261 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from Config.settings import TRACE_ENABLED, TRACE_DIR, TRACE_MAX_SPANS, TRACE_FLUSH_EVERY
+
+
+class _NoopSpan:
+    """Shared do-nothing span returned while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "category", "attrs", "start", "child_time")
+
+    def __init__(self, name, category, attrs):
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.child_time = 0.0
+
+    def __enter__(self):
+        Tracer._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        stack = Tracer._stack()
+        stack.pop()
+        if stack:
+            stack[-1].child_time += duration
+        if exc_type is not None:
+            self.attrs["outcome"] = f"error:{exc_type.__name__}"
+        Tracer._record(self, duration)
+        return False
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """
+    Lightweight timed spans for the hot path.
+
+    Disabled by default (TRACE=1 enables it); a disabled span is a shared
+    no-op object and instrumented functions skip straight to the original.
+    Spans record self time (excluding nested spans) so the per-category
+    breakdown adds up to wall time.
+
+    Memory stays flat on long runs: spans are appended to a JSONL file
+    under TRACE_DIR in batches of TRACE_FLUSH_EVERY, and only the last
+    TRACE_MAX_SPANS are kept for the Chrome trace and latency percentiles.
+    """
+
+    enabled = TRACE_ENABLED
+    _spans = deque(maxlen=TRACE_MAX_SPANS)  # dicts: name, cat, start, dur, self, tid, attrs
+    _unwritten = []  # spans not yet appended to _jsonl_path
+    _jsonl_path = None
+    _recorded = 0
+    _category_time = {}  # category -> total self time, over every span
+    _lock = threading.Lock()
+    _local = threading.local()
+    _epoch = time.perf_counter()
+
+    @classmethod
+    def _stack(cls):
+        stack = getattr(cls._local, "stack", None)
+        if stack is None:
+            stack = cls._local.stack = []
+        return stack
+
+    @classmethod
+    def _record(cls, span, duration):
+        entry = {
+            "name": span.name,
+            "cat": span.category,
+            "start": span.start - cls._epoch,
+            "dur": duration,
+            "self": duration - span.child_time,
+            "tid": threading.get_ident(),
+            "attrs": span.attrs,
+        }
+        with cls._lock:
+            cls._spans.append(entry)
+            cls._unwritten.append(entry)
+            cls._recorded += 1
+            cls._category_time[entry["cat"]] = cls._category_time.get(entry["cat"], 0.0) + entry["self"]
+            if len(cls._unwritten) >= TRACE_FLUSH_EVERY:
+                cls._flush_locked()
+
+    @classmethod
+    def _flush_locked(cls):
+        """Append unwritten spans to this run's JSONL file (caller holds _lock)."""
+        if not cls._unwritten:
+            return
+        if cls._jsonl_path is None:
+            TRACE_DIR.mkdir(parents=True, exist_ok=True)
+            cls._jsonl_path = TRACE_DIR / f"trace-{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+        with open(cls._jsonl_path, "a", encoding="utf-8") as f:
+            for entry in cls._unwritten:
+                f.write(json.dumps(entry) + "\n")
+        cls._unwritten = []
+
+    @classmethod
+    def span(cls, name, category="app", **attrs):
+        """Context manager timing a block: `with Tracer.span("llm.call", "llm", model=m):`"""
+        if not cls.enabled:
+            return _NOOP_SPAN
+        return _Span(name, category, attrs)
+
+    @classmethod
+    def wrap(cls, fn, name, category, attr_params=("selector_type", "selector_value", "url", "page", "element")):
+        """Wrap `fn` so each call is a span; named parameters become span attributes."""
+        params = list(inspect.signature(fn).parameters)
+        picked = [(i, p) for i, p in enumerate(params) if p in attr_params]
+
+        @functools.wraps(fn)
+        def traced(*args, **kwargs):
+            if not cls.enabled:
+                return fn(*args, **kwargs)
+
+            attrs = {}
+            for i, param in picked:
+                value = args[i] if i < len(args) else kwargs.get(param)
+                if value is not None:
+                    attrs[param] = str(value)[:200]
+
+            with _Span(name, category, attrs) as span:
+                result = fn(*args, **kwargs)
+                span.attrs["outcome"] = "ok" if result is not None and result is not False else "miss"
+                return result
+
+        return traced
+
+    @classmethod
+    def traced(cls, name=None, category="app"):
+        """Decorator form of wrap()."""
+        def decorator(fn):
+            return cls.wrap(fn, name or fn.__qualname__, category)
+        return decorator
+
+    @classmethod
+    def instrument(cls, target, categories, prefix=None):
+        """Wrap methods of a class in place.
+
+        Args:
+            target: the class
+            categories (dict): method name -> span category
+            prefix (str): span name prefix, defaults to the class name
+        """
+        prefix = prefix or target.__name__
+        for method_name, category in categories.items():
+            raw = target.__dict__[method_name]
+            span_name = f"{prefix}.{method_name}"
+            if isinstance(raw, staticmethod):
+                setattr(target, method_name, staticmethod(cls.wrap(raw.__func__, span_name, category)))
+            elif isinstance(raw, classmethod):
+                setattr(target, method_name, classmethod(cls.wrap(raw.__func__, span_name, category)))
+            else:
+                setattr(target, method_name, cls.wrap(raw, span_name, category))
+
+    # ------------------------------------------------------------------
+    # Export and reporting
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def flush(cls):
+        """Write out spans not yet in the JSONL file; returns its path (None if nothing was recorded)."""
+        with cls._lock:
+            cls._flush_locked()
+            return cls._jsonl_path
+
+    @classmethod
+    def export_chrome_trace(cls, path):
+        """Trace-event format, loadable in chrome://tracing or Perfetto (the most recent spans)."""
+        pid = os.getpid()
+        with cls._lock:
+            spans = list(cls._spans)
+        events = [
+            {
+                "name": e["name"],
+                "cat": e["cat"],
+                "ph": "X",
+                "ts": e["start"] * 1e6,
+                "dur": e["dur"] * 1e6,
+                "pid": pid,
+                "tid": e["tid"],
+                "args": e["attrs"],
+            }
+            for e in spans
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    @classmethod
+    def export(cls):
+        """Flush the JSONL file and write a Chrome trace beside it; returns the paths."""
+        jsonl = cls.flush()
+        if jsonl is None:
+            return ()
+        return jsonl, cls.export_chrome_trace(jsonl.with_suffix(".json"))
+
+    @staticmethod
+    def _percentile(sorted_values, pct):
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    @classmethod
+    def summary(cls):
+        """Print self-time by category and p50/p95 latency per operation."""
+        with cls._lock:
+            spans = list(cls._spans)
+            by_category = dict(cls._category_time)
+            recorded = cls._recorded
+        if not recorded:
+            print("Trace summary: no spans recorded.")
+            return
+
+        by_name = {}
+        for e in spans:
+            by_name.setdefault(e["name"], []).append(e["dur"])
+
+        total = sum(by_category.values()) or 1.0
+        print("Trace summary (self time by category):")
+        for category, seconds in sorted(by_category.items(), key=lambda kv: -kv[1]):
+            print(f"  {category:<14} {seconds:8.2f}s {seconds / total:6.1%}")
+
+        print("Per operation:" if len(spans) == recorded else f"Per operation (last {len(spans)} of {recorded} spans):")
+        for name, durations in sorted(by_name.items()):
+            durations.sort()
+            print(f"  {name:<44} n={len(durations):<5} "
+                  f"p50={cls._percentile(durations, 50) * 1000:8.1f}ms "
+                  f"p95={cls._percentile(durations, 95) * 1000:8.1f}ms")
+
+    @classmethod
+    def reset(cls):
+        """Forget recorded spans; the next one starts a new JSONL file."""
+        with cls._lock:
+            cls._spans.clear()
+            cls._unwritten = []
+            cls._jsonl_path = None
+            cls._recorded = 0
+            cls._category_time = {}
@@ -23,6 +23,18 @@ class XpathManager:
     @classmethod
     def get_xpath(cls, page, element):
         data = cls._load_xpaths()
-        return data.get(page, {}).get(element, {})
-        
+        value = data.get(page, {}).get(element, {})
+        # Entries may list fallbacks; plain callers get the primary selector
+        if isinstance(value, list):
+            return value[0] if value else {}
+        return value
 
+    @classmethod
+    def get_page(cls, page):
+        """All selectors for a page, e.g. for SeleniumSingleton.query_batch."""
+        data = cls._load_xpaths()
+        return {
+            element: value[0] if isinstance(value, list) else value
+            for element, value in data.get(page, {}).items()
+            if value
+        }
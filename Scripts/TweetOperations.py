@@ -1,8 +1,15 @@
-import time
-from APIs.OpenAi import summerize_api
+from APIs.OpenAi import summerize_api, summary_models
 from Helpers.XpathManager import XpathManager
+from Helpers.SelectorRegistry import SelectorRegistry
+from Helpers.SummaryCache import SummaryCache
+from Helpers.Tracer import Tracer
+from Helpers.PromptManager import PromptManager
+from Helpers.ProcessedIndex import ProcessedIndex, tweet_id_from_url
 from Helpers.SeleniumSingleton import SeleniumSingleton as SS
+from Helpers.ArtifactCapture import ArtifactCapture
+from Helpers.LogManager import LogManager
 
+log = LogManager.get_logger("tweet")
 
 
 class Tweet:
@@ -10,25 +17,75 @@ class Tweet:
     def click_first_tweet(self):
 
         try:
-            self.tweet_xpath = XpathManager.get_xpath('tweet_page', 'first_tweet_xpath')
-            self.tweet = SS.find_element("xpath", self.tweet_xpath)
+            self.tweet = SelectorRegistry.find('tweet_page', 'first_tweet_xpath')
 
             if self.tweet:
                 # Scroll and bring the tweet into view (with offset to avoid headers)
                 self.scroll(self.tweet)
-                time.sleep(1)
+                SS.wait_for_element_stable(*SelectorRegistry.primary('tweet_page', 'first_tweet_xpath'), baseline=1)
 
                 # Wait for tweet to be clickable, then click
+                page_url = SS.get_current_url()
                 SS.execute_script("arguments[0].click();", self.tweet)
-                print("🖱️ Opened first tweet.")
-                time.sleep(4)
+                log.info("🖱️ Opened first tweet.")
+                SS.wait_for_url_change(page_url, baseline=4)
 
             else:
-                print("❌ Could not find the first tweet.")
+                log.warning("❌ Could not find the first tweet.")
+                ArtifactCapture.capture("first-tweet-not-found")
 
         except Exception as e:
-            print(f"❌ Error interacting with first post: {e}")
+            log.error("❌ Error interacting with first post: %s", e)
+            ArtifactCapture.capture("open-first-tweet-error", error=e)
+
+
+    def open_next_unprocessed(self, limit=20):
+        """Opens the first tweet on a listing page that wasn't processed in an earlier run.
+
+        Status links are read in one round trip and checked against
+        ProcessedIndex before anything is clicked. Returns the opened tweet's
+        ID, or None if nothing was opened.
+        """
+        if not SelectorRegistry.find('tweet_page', 'first_tweet_xpath'):
+            log.warning("❌ Could not find the first tweet.")
+            ArtifactCapture.capture("first-tweet-not-found")
+            return None
+
+        # Network mode: read the listing's timeline response before it's evicted by navigation
+        SS.capture_timeline()
+
+        listing = SS.query_batch(
+            {'status_link_css': XpathManager.get_xpath('tweet_page', 'status_link_css')},
+            attributes=['href'],
+            limit=limit,
+        )
+        candidates = []  # (tweet_id, link element), first link per tweet in page order
+        for match in (listing or {}).get('status_link_css', {}).get('matches', []):
+            tweet_id = tweet_id_from_url(match['attributes'].get('href'))
+            if tweet_id and tweet_id not in (c[0] for c in candidates):
+                candidates.append((tweet_id, match['element']))
+
+        if not candidates:
+            # Status links not found; open the first tweet and read its ID from the URL
+            self.click_first_tweet()
+            return tweet_id_from_url(SS.get_current_url())
+
+        for index, (tweet_id, link) in enumerate(candidates):
+            if ProcessedIndex.should_skip(tweet_id):
+                continue
+
+            if index == 0:
+                self.click_first_tweet()
+            else:
+                self.scroll(link)
+                page_url = SS.get_current_url()
+                SS.execute_script("arguments[0].click();", link)
+                log.info("🖱️ Opened tweet %s on the page.", index + 1)
+                SS.wait_for_url_change(page_url, baseline=4)
+            return tweet_id
 
+        log.info("⏭️ Every tweet on this page was already processed.")
+        return None
 
     def scroll(self, tweet):
 
@@ -39,50 +96,95 @@ class Tweet:
                 )
             
         except Exception as e:
-            print(f"❌ Error scrolling with post page: {e}")
+            log.warning("❌ Error scrolling with post page: %s", e)
 
 
     def comment_this_post(self, comment_text="Great post!", do_summerize=False):
-        comment_box_css = XpathManager.get_xpath('detailed_tweet_page', 'comment_box_css')
-        reply_button_css = XpathManager.get_xpath('detailed_tweet_page', 'reply_button_css')
-
         # ✅ Step 1: If summarization is requested, get summary instead of using comment_text
         if do_summerize:
             summary = self.summarize()
             if summary:
                 comment_text = summary
             else:
-                print("⚠️ Could not generate summary, using default comment instead.")
+                log.warning("⚠️ Could not generate summary, using default comment instead.")
 
         # ✅ Step 2: Comment on the tweet
-        comment_box = SS.find_element("css", comment_box_css)
+        return self.post_comment(comment_text)
+
+    def post_comment(self, comment_text):
+        """Types `comment_text` into the reply box of the open tweet and sends it"""
+        comment_box_css = XpathManager.get_xpath('detailed_tweet_page', 'comment_box_css')
+        reply_button_css = XpathManager.get_xpath('detailed_tweet_page', 'reply_button_css')
+
+        comment_box = SS.wait_for_element_stable("css", comment_box_css, baseline=1)
         if comment_box:
-            time.sleep(1)
             SS.send_keys("css", comment_box_css, comment_text)
-            time.sleep(1)
 
-            reply_button = SS.find_element("css", reply_button_css)
+            # The reply button only becomes enabled once the draft is registered
+            reply_button = SS.wait_for_element_clickable("css", reply_button_css, baseline=1, probe=True)
             if reply_button:
                 SS.execute_script("arguments[0].click();", reply_button)
-                print(f"💬 Commented on the post: {comment_text}")
+                log.info("💬 Commented on the post: %s", comment_text)
+                return True
             else:
-                print("⚠️ Reply button not found.")
+                log.warning("⚠️ Reply button not found.")
+                ArtifactCapture.capture("reply-button-not-found")
         else:
-            print("⚠️ Comment box not found.")
+            log.warning("⚠️ Comment box not found.")
+            ArtifactCapture.capture("comment-box-not-found")
+        return False
+
+    def read_tweet_text(self):
+        """Returns the text of the open tweet, or None if it can't be found"""
+        if SS.extraction_mode() == 'network':
+            # Already downloaded by the page; no DOM traversal needed
+            tweet_id = tweet_id_from_url(SS.get_current_url())
+            record = SS.get_captured_tweet(tweet_id) if tweet_id else None
+            if record and record['text']:
+                return record['text'].strip()
+
+        # One round trip per poll (all fallbacks included) returns the text
+        # directly, instead of find + stability checks + a separate .text call
+        match = SelectorRegistry.read('detailed_tweet_page', 'tweet_content_css')
+
+        if match:
+            return (match['text'] or '').strip()
+
+        log.warning("⚠️ Failed to get tweet text for summarization.")
+        ArtifactCapture.capture("tweet-text-not-found")
+        return None
 
     def summarize(self):
         """Extracts tweet text and summarizes it via API"""
-        tweet_text_css = XpathManager.get_xpath('detailed_tweet_page', 'tweet_content_css')
-        tweet_element = SS.find_element('css', tweet_text_css)
-
-        if tweet_element:
-            time.sleep(1)
-            tweet_text = tweet_element.text.strip()
-            try:
-                return summerize_api(tweet_text)
-            except Exception as e:
-                print(f"⚠️ Summarization API failed: {e}")
-                return None
-        else:
-            print("⚠️ Failed to get tweet text for summarization.")
-            return None
\ No newline at end of file
+        tweet_text = self.read_tweet_text()
+        if tweet_text is None:
+            return None
+        return self.summarize_text(tweet_text)
+
+    def summarize_text(self, tweet_text):
+        """Summarizes already-extracted tweet text (safe to call from worker threads)"""
+        try:
+            return SummaryCache.get_or_compute(
+                tweet_text, summary_models(), PromptManager.version(), self._summarize_uncached
+            )
+        except Exception as e:
+            log.warning("⚠️ Summarization API failed: %s", e)
+            return None
+
+    @staticmethod
+    def _summarize_uncached(tweet_text):
+        summary, model = summerize_api(tweet_text, with_model=True)
+        # summerize_api reports failures as "Error: ..." strings; never cache those
+        if not summary or summary.startswith("Error:"):
+            return None
+        return summary, model
+
+
+Tracer.instrument(Tweet, {
+    'click_first_tweet': 'tweet',
+    'open_next_unprocessed': 'tweet',
+    'comment_this_post': 'tweet',
+    'post_comment': 'tweet',
+    'read_tweet_text': 'tweet',
+    'summarize_text': 'tweet',
+})
@@ -1,12 +1,56 @@
 import json
 import time
-from Config.settings import TWITTER_COOKIES_DIR, ACCOUNTS_FILE
+from Config.settings import TWITTER_COOKIES_DIR, ACCOUNTS_FILE, SESSION_VALIDATION_TTL
 from Helpers.AccountManager import AccountManager
-from selenium.webdriver.common.keys import Keys
+from Helpers.UrlManager import URLManager
+from Helpers.Tracer import Tracer
 from Helpers.SeleniumSingleton import SeleniumSingleton
+from Helpers.ArtifactCapture import ArtifactCapture
+from Helpers.LogManager import LogManager
+
+log = LogManager.get_logger("login")
 
 accounts_file=ACCOUNTS_FILE
 
+SESSION_COOKIE = "auth_token"
+
+
+def _recently_validated(account_name):
+    validated_at = AccountManager.get_session(account_name).get("cookies_validated_at", 0)
+    return time.time() - validated_at < SESSION_VALIDATION_TTL
+
+
+def _login_with_cookies(account_name, cookie_file_path):
+    """Fast path: inject saved cookies before the first page load.
+
+    Costs no page load if the session was validated recently, one otherwise
+    (plus one to reach the cookies' domain on browsers without CDP).
+    """
+    home_url = URLManager.get_url(category='login', key='login')
+    cookies = SeleniumSingleton.load_cookies_bulk(cookie_file_path, url=home_url)
+    if cookies is None:
+        return False
+
+    # Cheap local check: without an unexpired session cookie there is nothing to validate
+    now = time.time()
+    if not any(c["name"] == SESSION_COOKIE and c.get("expiry", now + 1) > now for c in cookies):
+        return False
+
+    if _recently_validated(account_name):
+        AccountManager.record_login(account_name, cookies_validated=False)
+        log.info("✅ Logged in using recently validated cookies.")
+        return True
+
+    # X redirects an authenticated session to /home client-side after load
+    SeleniumSingleton.navigate_to(home_url)
+    if SeleniumSingleton.wait_for_url_contains("home", timeout=5, baseline=6):
+        AccountManager.record_login(account_name)
+        log.info("✅ Logged in using cookies.")
+        return True
+    return False
+
+
+@Tracer.traced("login", "login")
 def login(account_name):
     # Load credentials from accounts.json
 
@@ -15,61 +59,60 @@ def login(account_name):
     username = account_data["username"]
     password = account_data["password"]
 
+    TWITTER_COOKIES_DIR.mkdir(parents=True, exist_ok=True)
     cookie_file_path = TWITTER_COOKIES_DIR / f"{username}.json"
 
     # Start driver
     driver = SeleniumSingleton.initialize_driver(timeout=15)
 
-    # Go to Twitter login page
-    SeleniumSingleton.navigate_to(url)
-    time.sleep(3)
-
     # Load cookies if available
     if cookie_file_path.exists():
         AccountManager.update_has_cookies(account_name, True)
-        SeleniumSingleton.load_cookies(driver, cookie_file_path)
-        driver.refresh()
-        time.sleep(3)
-
-        if "home" in driver.current_url:
-            print("✅ Logged in using cookies.")
-            AccountManager.update_has_cookies(account_name, True)
+        if _login_with_cookies(account_name, cookie_file_path):
             return True
-        else:
-            print("⚠️ Cookies invalid or expired, proceeding with manual login.")
+
+        log.warning("⚠️ Cookies invalid or expired, proceeding with manual login.")
+        ArtifactCapture.capture("cookie-login-failed", account=account_name)
+        url = URLManager.get_url(category='login', key='first_login')
 
     else:
         AccountManager.update_has_cookies(account_name, False)
 
+    # Go to Twitter login page
+    SeleniumSingleton.navigate_to(url)
+    SeleniumSingleton.wait_for_page_ready(baseline=3)
 
     # Manual login flow
+    from selenium.webdriver.common.keys import Keys
     try:
         SeleniumSingleton.click_element("tag", "input")
-        time.sleep(1)
+        SeleniumSingleton.wait_for_element_stable("tag", "input", baseline=1)
         SeleniumSingleton.send_keys("tag", "input", username)
         SeleniumSingleton.send_keys("tag", "input", Keys.ENTER, clear_first=False)
-        time.sleep(3)
+        SeleniumSingleton.wait_for_requests_settled(baseline=3)
 
         inputs = SeleniumSingleton.find_elements("tag", "input")
         if len(inputs) > 1:
             SeleniumSingleton.send_keys("tag", "input", username)
             SeleniumSingleton.send_keys("tag", "input", Keys.ENTER, clear_first=False)
-            time.sleep(2)
+            SeleniumSingleton.wait_for_requests_settled(baseline=2)
 
         SeleniumSingleton.send_keys("name", "password", password)
         SeleniumSingleton.send_keys("name", "password", Keys.ENTER, clear_first=False)
-        time.sleep(5)
 
-        if "home" in driver.current_url:
-            print("✅ Logged in successfully. Saving cookies...")
+        if SeleniumSingleton.wait_for_url_contains("home", baseline=5):
+            log.info("✅ Logged in successfully. Saving cookies...")
             SeleniumSingleton.save_cookies(driver, cookie_file_path)
+            AccountManager.record_login(account_name)
             AccountManager.update_has_cookies(account_name, True)
 
             return True
         else:
-            print("❌ Login may have failed.")
+            log.error("❌ Login may have failed.")
+            ArtifactCapture.capture("login-failed", account=account_name)
             return False
 
     except Exception as e:
-        print(f"❌ Exception during login: {e}")
+        log.error("❌ Exception during login: %s", e)
+        ArtifactCapture.capture("login-error", account=account_name, error=e)
         return False
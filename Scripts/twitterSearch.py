@@ -1,50 +1,96 @@
 import time
-import json
+from Config.settings import KEYWORDS_FILE
 from Scripts.login import login
-from main import username
 from Helpers.SeleniumSingleton import SeleniumSingleton
+from Helpers.XpathManager import XpathManager
+from Helpers.ProcessedIndex import ProcessedIndex, tweet_id_from_url
+from Helpers.TimelineHarvester import harvest_tweets
+from Helpers.LogManager import LogManager
 
-def load_selectors(json_path="xpaths.json"):
-    with open(json_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+log = LogManager.get_logger("search")
 
-# Loading Selector Paths
-selectors = load_selectors()
 
-def read_keywords(file_path="keywords.txt"):
+def read_keywords(file_path=KEYWORDS_FILE):
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             return [line.strip() for line in f if line.strip()]
     except FileNotFoundError:
-        print(f"❌ File not found: {file_path}")
+        log.error("❌ File not found: %s", file_path)
         return []
 
 
 def search_keyword(keyword):
     search_url = f"https://twitter.com/search?q={keyword}&src=typed_query"
     SeleniumSingleton.navigate_to(search_url)
-    print(f"🔍 Searching: {keyword}")
+    log.info("🔍 Searching: %s", keyword)
     time.sleep(3)
 
 
 def go_to_latest_tab():
     try:
-        latest_tab_xpath = selectors['search_page']['latest_tab_xpath']
-
         # "Latest" tab has 'Latest' text, it's a nav item
-        SeleniumSingleton.click_element("xpath", "//span[text()='Latest']/ancestor::a")
-        print("🕒 Switched to 'Latest' tab.")
+        latest_tab_xpath = XpathManager.get_xpath('search_page', 'latest_tab_xpath')
+        SeleniumSingleton.click_element("xpath", latest_tab_xpath)
+        log.info("🕒 Switched to 'Latest' tab.")
         time.sleep(3)
     except Exception as e:
-        print(f"❌ Could not switch to 'Latest': {e}")
+        log.error("❌ Could not switch to 'Latest': %s", e)
+
+
+def like_and_comment(tweet_id, comment_text):
+    """Likes and replies to the open tweet detail page."""
+    # Step 1: Locate the like button and comment box in one round trip
+    detail = SeleniumSingleton.query_batch(
+        XpathManager.get_page('detailed_tweet_page'),
+        wait_for=['like_button_css'],
+    )
+    like_match = SeleniumSingleton.first_match(detail, 'like_button_css')
+    like_button = like_match['element'] if like_match else None
+
+    # Step 2: Click it if found
+    if like_button:
+        SeleniumSingleton.execute_script("arguments[0].scrollIntoView(true);", like_button)
+        like_button_css = XpathManager.get_xpath('detailed_tweet_page', 'like_button_css')
+        SeleniumSingleton.wait_for_element_stable("css", like_button_css, baseline=1)
+        SeleniumSingleton.execute_script("arguments[0].click();", like_button)
+        log.info("❤️ Liked the detailed tweet.")
+        # Let the like request go out before typing
+        SeleniumSingleton.wait_for_requests_settled(baseline=2)
+    else:
+        log.warning("⚠️ Like button not found in detailed view.")
+
+    # ✅ Step 2: Comment on the tweet
+    comment_box_css = XpathManager.get_xpath('detailed_tweet_page', 'comment_box_css')
+    comment_box = SeleniumSingleton.first_match(detail, 'comment_box_css')
+    if comment_box:
+        SeleniumSingleton.wait_for_element_stable("css", comment_box_css, baseline=1)
+        SeleniumSingleton.send_keys("css", comment_box_css, comment_text)
+
+        # The reply button only becomes enabled once the draft is registered
+        reply_button_css = XpathManager.get_xpath('detailed_tweet_page', 'reply_button_css')
+        reply_button = SeleniumSingleton.wait_for_element_clickable("css", reply_button_css, baseline=1, probe=True)
+        if reply_button:
+            SeleniumSingleton.execute_script("arguments[0].click();", reply_button)
+            log.info("💬 Commented on the post.")
+            ProcessedIndex.add(tweet_id)
+        else:
+            log.warning("⚠️ Reply button not found.")
+    else:
+        log.warning("⚠️ Comment box not found.")
 
 
 def interact_with_first_post(comment_text="Great post!"):
     try:
-        tweet_xpath = selectors['tweet']['first_tweet_xpath']
+        tweet_xpath = XpathManager.get_xpath('tweet_page', 'first_tweet_xpath')
         tweet = SeleniumSingleton.find_element("xpath", tweet_xpath)
 
         if tweet:
+            article_link_css = XpathManager.get_xpath('tweet_page', 'article_link_css')
+            status_links = tweet.find_elements("css selector", article_link_css)
+            tweet_id = tweet_id_from_url(status_links[0].get_attribute("href")) if status_links else None
+            if ProcessedIndex.should_skip(tweet_id):
+                return
+
             # Scroll and bring the tweet into view (with offset to avoid headers)
             SeleniumSingleton.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'}); window.scrollBy(0, -80);",
@@ -54,56 +100,59 @@ def interact_with_first_post(comment_text="Great post!"):
 
             # Wait for tweet to be clickable, then click
             SeleniumSingleton.execute_script("arguments[0].click();", tweet)
-            print("🖱️ Opened first tweet.")
+            log.info("🖱️ Opened first tweet.")
             time.sleep(4)
 
-            # Step 1: Locate the like button in the detailed tweet view
-            like_button_css = selectors['detailed_tweet']['like_button_css']
-            like_button = SeleniumSingleton.find_element("css", like_button_css)
-
-            # Step 2: Click it if found
-            if like_button:
-                SeleniumSingleton.execute_script("arguments[0].scrollIntoView(true);", like_button)
-                time.sleep(1)
-                SeleniumSingleton.execute_script("arguments[0].click();", like_button)
-                print("❤️ Liked the detailed tweet.")
-            else:
-                print("⚠️ Like button not found in detailed view.")
-
-            time.sleep(2)
+            like_and_comment(tweet_id, comment_text)
 
-            # ✅ Step 2: Comment on the tweet
-            comment_box_css = selectors['detailed_tweet']['comment_box_css']
-            comment_box = SeleniumSingleton.find_element("css", comment_box_css)
-            if comment_box:
-                # SeleniumSingleton.execute_script("arguments[0].scrollIntoView(true);", comment_box)
-                time.sleep(1)
-                SeleniumSingleton.send_keys("css", comment_box_css, comment_text)
-                time.sleep(1)
-
-                reply_button_css = selectors['detailed_tweet']['reply_button_css']
-                reply_button = SeleniumSingleton.find_element("css", reply_button_css)
-                if reply_button:
-                    SeleniumSingleton.execute_script("arguments[0].click();", reply_button)
-                    print("💬 Commented on the post.")
-                else:
-                    print("⚠️ Reply button not found.")
-            else:
-                print("⚠️ Comment box not found.")
-            
             time.sleep(3)
             SeleniumSingleton.go_back()
-            print("🔙 Navigated back.")
+            log.info("🔙 Navigated back.")
             time.sleep(2)
 
         else:
-            print("❌ Could not find the first tweet.")
+            log.warning("❌ Could not find the first tweet.")
 
     except Exception as e:
-        print(f"❌ Error interacting with first post: {e}")
+        log.error("❌ Error interacting with first post: %s", e)
+
 
+def interact_with_posts(comment_text="Great post!", count=5):
+    """Comments on up to `count` new tweets from the open results as they are harvested.
 
-def process_keywords(comment_text="Nice one!"):
+    The results stay open in their own tab, so harvesting resumes where it
+    left off; each tweet is opened directly by its status URL in a second
+    tab as soon as it is found.
+    """
+    results_tab = SeleniumSingleton.get_current_window_handle()
+    tweet_tab = None
+    harvested = 0
+    try:
+        for tweet in harvest_tweets(max_tweets=count, skip=ProcessedIndex.should_skip):
+            harvested += 1
+            try:
+                if tweet_tab is None:
+                    tweet_tab = SeleniumSingleton.open_tab()
+                else:
+                    SeleniumSingleton.switch_to_window(tweet_tab)
+                SeleniumSingleton.navigate_to(tweet["url"])
+                SeleniumSingleton.wait_for_page_ready()
+                like_and_comment(tweet["id"], comment_text)
+                # Let the reply request go out before the tab is reused
+                SeleniumSingleton.wait_for_requests_settled(baseline=3)
+            except Exception as e:
+                log.error("❌ Error interacting with tweet %s: %s", tweet['id'], e)
+            finally:
+                SeleniumSingleton.switch_to_window(results_tab)
+    finally:
+        if tweet_tab is not None:
+            SeleniumSingleton.switch_to_window(tweet_tab)
+            SeleniumSingleton.close_current_tab()
+            SeleniumSingleton.switch_to_window(results_tab)
+    log.info("🧺 Harvested %s new tweets.", harvested)
+
+
+def process_keywords(comment_text="Nice one!", tweets_per_keyword=1):
     keywords = read_keywords()
     if not keywords:
         return
@@ -112,9 +161,12 @@ def process_keywords(comment_text="Nice one!"):
         try:
             search_keyword(keyword)
             go_to_latest_tab()
-            interact_with_first_post(comment_text)
+            if tweets_per_keyword > 1:
+                interact_with_posts(comment_text, tweets_per_keyword)
+            else:
+                interact_with_first_post(comment_text)
         except Exception as e:
-            print(f"❌ Error processing keyword '{keyword}': {e}")
+            log.error("❌ Error processing keyword '%s': %s", keyword, e)
 
     print("✅ Done with all keywords.")
 
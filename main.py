@@ -1,51 +1,291 @@
 import time
 import sys
+import signal
+import threading
+from collections import deque
+from concurrent.futures import Future
 from Scripts.login import login
+from Config.settings import MIN_DWELL_SECONDS, PIPELINE_DEPTH, SUMMARY_WORKERS, SHUTDOWN_DEADLINE
 from Helpers.UrlManager import URLManager
+from Helpers.SummaryCache import SummaryCache
+from Helpers.ProcessedIndex import ProcessedIndex
+from Helpers.JobQueue import JobQueue, PENDING, EXTRACTED, SUMMARIZED, DONE
+from Helpers.AccountManager import AccountManager
+from APIs.OpenAi import hedging_stats, close_clients
+from Helpers.SelectorRegistry import SelectorRegistry
+from Helpers.Tracer import Tracer
+from Helpers.LogManager import LogManager
+from Helpers.ArtifactCapture import ArtifactCapture
+from Helpers.MemoryWatchdog import MemoryWatchdog
+from Helpers.PromptManager import PromptManager
 from Scripts.TweetOperations import Tweet
 from Helpers.SeleniumSingleton import SeleniumSingleton as SS
 
+log = LogManager.get_logger("run")
+
 
 first_tweet = Tweet()
 
-posts = URLManager.get_url(category='posts')
+posts = None  # post listing URLs; read from urls.json on first use
 username = "globalnews2183"
 
 
-def run_script():
+def run_script(pipelined=False):
 
+    SS.set_min_dwell(MIN_DWELL_SECONDS)
+    PromptManager.compile()  # render the POML template once, before the hot loop
     login(username)
-    time.sleep(5)
+    SS.wait_for_page_ready(baseline=5)
 
-    for post in posts:
-        SS.navigate_to(post)
-        time.sleep(5)
-                
-        first_tweet.click_first_tweet()
+    if pipelined:
+        run_pipelined()
+    else:
+        run_serial()
 
-        time.sleep(5)
+    SS.wait_report()
+    SS.navigation_report()
+    SelectorRegistry.report()
+    print(f"Summary cache: {SummaryCache.stats()}")
+    print(f"Processed index: {ProcessedIndex.stats()}")
+    print(f"Job queue (run {JobQueue.run_id}): {JobQueue.counts()}")
+    if MemoryWatchdog.enabled:
+        print(f"Memory watchdog: {MemoryWatchdog.stats()}")
+    if hedging_stats():
+        print(f"Summary providers: {hedging_stats()}")
+    if Tracer.enabled:
+        Tracer.summary()
+        print(f"Trace written to: {', '.join(str(p) for p in Tracer.export())}")
 
-        first_tweet.comment_this_post(do_summerize=True)
 
-        time.sleep(10)
+_validated_pages = set()
 
 
+def open_first_tweet(post):
+    """Navigates to a post listing and opens its first not-yet-processed tweet.
 
-if __name__ == '__main__':
+    Returns the tweet ID, or None if there was nothing new to open.
+    """
+    SS.navigate_to(post)
+    SS.wait_for_page_ready(baseline=5)
+    validate_selectors_once('tweet_page', anchor='first_tweet_xpath')
+
+    tweet_id = first_tweet.open_next_unprocessed()
+    if tweet_id is None:
+        return None
+
+    SS.wait_for_page_ready(baseline=5)
+    validate_selectors_once('detailed_tweet_page', anchor='tweet_content_css')
+    return tweet_id
+
+
+def validate_selectors_once(page, anchor):
+    """Flags selectors that don't match the first time a page type shows its content (`anchor`)."""
+    if page not in _validated_pages and SelectorRegistry.validate(page, anchor) is not None:
+        _validated_pages.add(page)
+
+
+def get_posts():
+    global posts
+    if posts is None:
+        posts = URLManager.get_url(category='posts')
+    return posts
+
+
+def run_serial():
+    JobQueue.open_run(get_posts())
+    for job in JobQueue.incomplete():
+        try:
+            process_job(job)
+        except Exception as e:
+            JobQueue.record_failure(job, e)
+        check_memory()
+    JobQueue.finish_run_if_complete()
+
+
+def check_memory():
+    """Runs the memory watchdog between posts; its failures are recorded, never fatal to the run."""
     try:
-        run_script()
+        MemoryWatchdog.check()
+    except Exception as e:
+        MemoryWatchdog.record_error(e)
+
+
+def process_job(job):
+    """Runs the job's remaining steps, checkpointing after each one."""
+    if job.state == PENDING and not extract_job(job):
+        return
+
+    if job.state == EXTRACTED:
+        summary = first_tweet.summarize_text(job.tweet_text) if job.tweet_text else None
+        JobQueue.checkpoint(job, SUMMARIZED, summary=summary or default_comment())
+
+    if job.state == SUMMARIZED:
+        comment_job(job)
+
+
+def default_comment():
+    log.warning("⚠️ Could not generate summary, using default comment instead.")
+    return "Great post!"
+
+
+def extract_job(job):
+    """Opens the job's next unprocessed tweet and checkpoints its text; False if there was none."""
+    tweet_id = open_first_tweet(job.url)
+    if tweet_id is None:
+        JobQueue.checkpoint(job, DONE, error="no unprocessed tweet")
+        return False
+
+    JobQueue.checkpoint(
+        job, EXTRACTED,
+        tweet_id=tweet_id,
+        tweet_url=SS.get_current_url(),
+        tweet_text=first_tweet.read_tweet_text(),
+    )
+    return True
+
+
+def comment_job(job):
+    """Posts the job's summary on its tweet (reopening it by URL if it isn't the open page)."""
+    if SS.get_current_url() != job.tweet_url:
+        SS.navigate_to(job.tweet_url)
+        SS.wait_for_page_ready()
+
+    if not first_tweet.post_comment(job.summary):
+        raise RuntimeError("reply was not posted")
+    ProcessedIndex.add(job.tweet_id)
+    JobQueue.checkpoint(job, DONE)
+
+    # Let the reply request go out before navigating away
+    SS.wait_for_requests_settled(baseline=10)
+
 
-        
-    except KeyboardInterrupt as e:
-        print()  # start on a new line
-        dots = ""
+def run_pipelined(depth=PIPELINE_DEPTH, workers=SUMMARY_WORKERS):
+    """Overlaps LLM summarization with browser work.
+
+    Tweet text is extracted and handed to a summary thread as soon as it is read;
+    the tweet's tab is parked and the browser moves on to the next post in a
+    fresh tab while the summary is generated. At most `depth` posts are in
+    flight, then the oldest one's tab is brought back and commented on, so
+    results are applied in order without navigating to the tweet again, and
+    memory stays flat on long URL lists. Jobs resumed at 'summarized', or
+    whose tab was lost to a browser restart, reopen their tweet by status URL.
+    """
+    JobQueue.open_run(get_posts())
+    pending = deque()  # (job, future or None, parked tab or None) in post order
+    slots = threading.BoundedSemaphore(workers)
+
+    def comment_oldest():
+        job, future, tab = pending.popleft()
+        try:
+            if future is not None:
+                summary = future.result()
+                JobQueue.checkpoint(job, SUMMARIZED, summary=summary or default_comment())
+            comment_in_tab(job, tab)
+        except Exception as e:
+            JobQueue.record_failure(job, e)
+
+    try:
+        for job in JobQueue.incomplete():
+            try:
+                if job.state == PENDING and not extract_job(job):
+                    continue
+            except Exception as e:
+                JobQueue.record_failure(job, e)
+                continue
+
+            if job.state == EXTRACTED:
+                text = job.tweet_text
+                # Sample the tab that did the browsing, before it is parked and a blank one
+                # opened. A recycle or restart here just means the tweet is reopened by URL.
+                check_memory()
+                # Keep the tweet open for commenting; browse on in a new tab
+                tab = SS.get_current_window_handle()
+                SS.open_tab()
+                pending.append((job, start_summary(text, slots) if text else None, tab))
+                if not text:
+                    JobQueue.checkpoint(job, SUMMARIZED, summary=default_comment())
+            else:
+                pending.append((job, None, None))
+
+            if len(pending) >= depth:
+                comment_oldest()
+
+        while pending:
+            comment_oldest()
+    finally:
+        # Summaries not started yet are dropped; ones in flight run on daemon
+        # threads that die with the process. Either way the job resumes from 'extracted'.
+        for _, future, _ in pending:
+            if future is not None:
+                future.cancel()
+
+    JobQueue.finish_run_if_complete()
+
+
+def start_summary(text, slots):
+    """Summarizes `text` on a daemon thread once one of `slots` is free; returns its Future.
+
+    Not a ThreadPoolExecutor: its workers are joined at interpreter exit, so
+    an interrupted run would still wait out in-flight LLM calls and their
+    retries, well past SHUTDOWN_DEADLINE.
+    """
+    future = Future()
+
+    def work():
+        with slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(first_tweet.summarize_text(text))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=work, name="summary", daemon=True).start()
+    return future
+
+
+def comment_in_tab(job, tab):
+    """Comments on `job` in its parked tab, then closes it; falls back to comment_job() in the current tab."""
+    browse_tab = SS.get_current_window_handle()
+    if tab is None or not SS.switch_to_window(tab):
+        comment_job(job)
+        return
+    try:
+        comment_job(job)
+    finally:
+        SS.close_current_tab()
+        SS.switch_to_window(browse_tab)
+
+
+def shutdown(deadline=SHUTDOWN_DEADLINE):
+    """Flushes saved state and quits the browser, giving up on it after `deadline` seconds."""
+    started = time.monotonic()
+    for close in (JobQueue.close, ProcessedIndex.close, SummaryCache.close, AccountManager.flush,
+                  ArtifactCapture.flush, Tracer.flush, close_clients):
         try:
-            while True:
-                dots = "." * ((len(dots) % 3) + 1)  # 1 → 2 → 3 → 1 ...
-                sys.stdout.write(f"\rclosing{dots}   ")  # spaces clear leftovers
-                sys.stdout.flush()
-                time.sleep(0.5)
-
-        except KeyboardInterrupt:
-            # Allow the user to break out of the animation
-            print("\nForce closed.")
\ No newline at end of file
+            close()
+        except Exception as e:
+            log.error("⚠️ Error while saving state: %s", e)
+
+    quitter = threading.Thread(target=SS.quit_driver, daemon=True)
+    quitter.start()
+    quitter.join(max(0.0, deadline - (time.monotonic() - started)))
+    if quitter.is_alive():
+        log.warning("⚠️ Browser did not quit within %ss, stopping chromedriver.", deadline)
+    SS.stop_service()
+    LogManager.flush()
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+if __name__ == '__main__':
+    # Schedulers stop jobs with SIGTERM; treat it like Ctrl+C
+    signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        run_script(pipelined="--pipelined" in sys.argv)
+    except KeyboardInterrupt:
+        print("\nInterrupted. Progress is saved; the next run resumes where this one stopped.")
+    finally:
+        shutdown()